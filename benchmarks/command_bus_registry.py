@@ -0,0 +1,140 @@
+import argparse
+import contextlib
+import io
+import logging
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+ORDERS_MODULE = SRC / "plugins" / "python_django" / "module_orders" / "src" / "orders"
+sys.path.insert(0, str(SRC))
+
+
+def render_project(workdir: Path) -> Path:
+  from core.services.template_manager import TemplateManager
+
+  project = workdir / "bench"
+  context = {"project_name": "bench", "database": "sqlite", "use_docker": False}
+  with contextlib.redirect_stdout(io.StringIO()):
+    TemplateManager().render_template("python-django", context, project, "bench")
+  # The shared command view wires the orders subscriber, so the project needs that module to import.
+  shutil.copytree(ORDERS_MODULE, project / "src" / "orders")
+  return project
+
+
+def configure_django(project: Path) -> None:
+  import django
+  from django.conf import settings
+
+  sys.path.insert(0, str(project))
+  settings.configure(
+    INSTALLED_APPS=["django.contrib.auth", "django.contrib.contenttypes", "rest_framework"],
+    SECRET_KEY="benchmark",
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    REST_FRAMEWORK={
+      "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
+      "DEFAULT_PARSER_CLASSES": ("rest_framework.parsers.JSONParser",),
+      "DEFAULT_AUTHENTICATION_CLASSES": (),
+      "DEFAULT_PERMISSION_CLASSES": (),
+    },
+  )
+  django.setup()
+
+
+def build_view():
+  from src.shared.domain.commands.command import Command
+  from src.shared.domain.commands.command_handler import CommandHandler
+  from src.shared.infrastructure.api.views.create_api_view import CreateAPIView
+
+  class BenchCommand(Command):
+    def __init__(self, data):
+      self.data = data
+
+  class BenchRepository:
+    def __init__(self):
+      self.saved = []
+
+  class BenchService:
+    def __init__(self, event_bus, **repositories):
+      self.event_bus = event_bus
+      self.repositories = repositories
+
+  class BenchCommandHandler(CommandHandler):
+    def __init__(self, service):
+      self.service = service
+
+    def subscribed_to(self) -> type[Command]:
+      return BenchCommand
+
+    def handle(self, command: BenchCommand) -> None:
+      self.service.repositories["repository"].saved.append(command.data)
+
+  class BenchSerializer:
+    def __init__(self, data, partial=False):
+      self.validated_data = data
+
+    def is_valid(self):
+      return True
+
+  class BenchCreateView(CreateAPIView):
+    repositories = [("repository", BenchRepository)]
+    request_serializer_class = BenchSerializer
+    application_command = BenchCommand
+    application_command_handler = BenchCommandHandler
+    application_service = BenchService
+
+  return BenchCreateView
+
+
+def measure(view_class, requests: int, rebuild: bool) -> list[float]:
+  from rest_framework.test import APIRequestFactory
+
+  registry = view_class.command_bus_registry
+  view = view_class.as_view({"post": "create"})
+  factory = APIRequestFactory()
+  timings = []
+  with contextlib.redirect_stdout(io.StringIO()):
+    for _ in range(requests):
+      request = factory.post("/bench/", {"name": "bench"}, format="json")
+      if rebuild:
+        # Forgetting every bus reproduces the old behaviour of wiring handlers, services and buses per request.
+        registry.clear()
+      start = time.perf_counter()
+      response = view(request)
+      timings.append((time.perf_counter() - start) * 1_000_000)
+      if response.status_code != 201:
+        raise RuntimeError(f"Benchmark request failed with status {response.status_code}: {response.data}")
+  return timings
+
+
+def main() -> int:
+  parser = argparse.ArgumentParser(description="Benchmark per-request command bus wiring in the Django template")
+  parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario (median is reported)")
+  args = parser.parse_args()
+
+  with tempfile.TemporaryDirectory() as tmp:
+    configure_django(render_project(Path(tmp)))
+    # Mirrors the template's INFO console logging, in memory so terminal speed does not skew the timings.
+    logging.basicConfig(level=logging.INFO, stream=io.StringIO(), format="{levelname} {message}", style="{", force=True)
+    view_class = build_view()
+    registry = view_class.command_bus_registry
+    measure(view_class, 50, rebuild=False)
+
+    results = {}
+    for scenario, rebuild in (("rebuild per request", True), ("shared registry", False)):
+      builds = registry.builds
+      results[scenario] = statistics.median(measure(view_class, args.requests, rebuild))
+      print(f"{scenario:<20} {results[scenario]:>8.1f} µs/request, {registry.builds - builds} bus builds")
+
+    saved = results["rebuild per request"] - results["shared registry"]
+    print(f"\n✅ Registry removes {saved:.1f} µs of wiring per request")
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,110 @@
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from synthetic import build_template_tree  # noqa: E402
+
+from core.services import template_index  # noqa: E402
+from core.services.template_index import JobKind, get_template_index  # noqa: E402
+
+NAME = "demo_project"
+PROJECT_NAME = "{{ project_name }}"
+PROJECT_NAME_000 = "000project_name000"
+JINJA_MARKERS = ("{{", "{%", "{#")
+BINARY_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg")
+
+
+def legacy_loop(template_path: Path) -> int:
+  pattern = re.compile(r"\{\{\s*project_name\s*\}\}")
+  total = 0
+  for item in template_path.rglob("*"):
+    if not item.is_file():
+      continue
+    destination = pattern.sub(NAME, str(item.relative_to(template_path)))
+    if item.suffix in BINARY_SUFFIXES:
+      continue
+    content = item.read_text()
+    needs_render = any(marker in content for marker in JINJA_MARKERS)
+    content = content.replace(PROJECT_NAME, NAME).replace(PROJECT_NAME_000, NAME)
+    total += len(destination) + len(content) + needs_render
+  return total
+
+
+def indexed_loop(template_path: Path, persist: bool) -> int:
+  root = str(template_path)
+  total = 0
+  for entry in get_template_index(template_path, persist=persist).entries:
+    destination = entry.destination_for(NAME)
+    if entry.kind == JobKind.COPY:
+      continue
+    with open(os.path.join(root, entry.source)) as f:
+      content = f.read()
+    if entry.needs_replace:
+      content = content.replace(PROJECT_NAME, NAME).replace(PROJECT_NAME_000, NAME)
+    total += len(destination) + len(content) + (entry.kind == JobKind.RENDER)
+  return total
+
+
+def timed(func, runs: int) -> float:
+  samples = []
+  for _ in range(runs):
+    start = time.perf_counter()
+    func()
+    samples.append((time.perf_counter() - start) * 1000)
+  return statistics.median(samples)
+
+
+def main() -> int:
+  parser = argparse.ArgumentParser(description="Compare the precompiled template index against the per-file loop")
+  parser.add_argument("--files", type=int, default=10_000, help="Number of files in the synthetic template tree")
+  parser.add_argument("--runs", type=int, default=5, help="Runs per variant (median is reported)")
+  parser.add_argument("--json", action="store_true", help="Print results as JSON")
+  args = parser.parse_args()
+
+  with tempfile.TemporaryDirectory() as tmp:
+    os.environ["XDG_CACHE_HOME"] = str(Path(tmp) / "cache")
+    template_path = Path(tmp) / "project_root"
+    build_template_tree(template_path, args.files)
+
+    if legacy_loop(template_path) != indexed_loop(template_path, persist=False):
+      print("❌ Indexed loop produced different output than the legacy loop")
+      return 1
+
+    def cold_index():
+      template_index._indexes.clear()
+      indexed_loop(template_path, persist=False)
+
+    def disk_index():
+      template_index._indexes.clear()
+      indexed_loop(template_path, persist=True)
+
+    indexed_loop(template_path, persist=True)
+    results = {
+      "files": args.files,
+      "legacy_ms": timed(lambda: legacy_loop(template_path), args.runs),
+      "index_cold_ms": timed(cold_index, args.runs),
+      "index_disk_ms": timed(disk_index, args.runs),
+      "index_warm_ms": timed(lambda: indexed_loop(template_path, persist=False), args.runs),
+    }
+
+  if args.json:
+    print(json.dumps(results, indent=2))
+  else:
+    print(f"Template tree: {results['files']} files")
+    for name in ("legacy", "index_cold", "index_disk", "index_warm"):
+      elapsed = results[f"{name}_ms"]
+      print(f"{name:<12} {elapsed:>9.1f} ms   {results['legacy_ms'] / elapsed:>5.2f}x")
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
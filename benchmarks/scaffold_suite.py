@@ -0,0 +1,203 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+SYNTHETIC_TEMPLATE = "synthetic"
+DEFAULT_THRESHOLD = 0.25
+MIN_REGRESSION_MS = 5.0
+
+
+def run_render(workdir: Path, args: argparse.Namespace) -> None:
+  from core.services.template_manager import TemplateManager
+
+  manager = TemplateManager()
+  manager.TEMPLATES_DIR = workdir / "templates"
+  context = {"project_name": "bench", "use_docker": True}
+  manager.render_template(SYNTHETIC_TEMPLATE, context, workdir / "out" / uuid.uuid4().hex, "bench")
+
+
+def run_init(workdir: Path, args: argparse.Namespace) -> None:
+  from core.generator.project_initializer import ProjectInitializer
+  from core.interfaces.init_command_base import InitCommandConfig
+
+  config = InitCommandConfig(
+    template="python-django", path=workdir / "out" / uuid.uuid4().hex / "bench", name_project="bench", not_git=True
+  )
+  ProjectInitializer().initialize_project(config)
+
+
+def run_generate(workdir: Path, args: argparse.Namespace) -> None:
+  from core.interfaces.base_class import DomainOption
+  from plugins.python_django.django_domain_generator import DjangoDomainGenerator
+
+  output = workdir / "out" / uuid.uuid4().hex
+  output.mkdir(parents=True)
+  os.chdir(output)
+  attributes = [{"name": "name", "type": "CharField", "required": True}, {"name": "notes", "required": False}]
+  generator = DjangoDomainGenerator()
+  for number in range(args.modules):
+    context = {
+      "app_name": "app",
+      "module_name": f"item{number}",
+      "module_name_plural": f"items{number}",
+      "domain_options": [DomainOption.ENTITIES],
+      "entity_attributes": attributes,
+    }
+    generator.generate(context)
+
+
+def run_generators(workdir: Path, args: argparse.Namespace) -> None:
+  from core.generator.generation_plan import GenerationPlan
+  from core.generator.generator_factory import GeneratorFactory
+  from core.interfaces.base_class import DomainOption, LanguageOption, LayerType
+  from plugins.python_django import PythonFrameworkOption
+
+  factory = GeneratorFactory()
+  plan = GenerationPlan()
+  for number in range(args.modules):
+    context = {
+      "app_name": "app",
+      "module_name": f"item{number}",
+      "module_name_plural": f"items{number}",
+      "domain_options": [DomainOption.ENTITIES],
+    }
+    for layer in LayerType:
+      factory.get_generator(LanguageOption.PYTHON, PythonFrameworkOption.DJANGO, layer).plan(context, plan)
+  plan.estimate_sizes()
+
+
+def run_plugins(workdir: Path, args: argparse.Namespace) -> None:
+  from core.generator.generator_factory import GeneratorFactory
+
+  factory = GeneratorFactory()
+  for language in factory.languages:
+    factory.supported_frameworks(language)
+
+
+CASES = {
+  "render": run_render,
+  "init": run_init,
+  "generate": run_generate,
+  "generators": run_generators,
+  "plugins": run_plugins,
+}
+
+
+def run_case(name: str, workdir: Path, args: argparse.Namespace) -> float:
+  sys.path.insert(0, str(SRC))
+  start = time.perf_counter()
+  with contextlib.redirect_stdout(io.StringIO()):
+    CASES[name](workdir, args)
+  return (time.perf_counter() - start) * 1000
+
+
+def spawn(name: str, workdir: Path, cache_dir: Path, args: argparse.Namespace) -> tuple[float, float]:
+  command = [sys.executable, __file__, "--case", name, "--workdir", str(workdir), "--modules", str(args.modules)]
+  env = {**os.environ, "XDG_CACHE_HOME": str(cache_dir)}
+  start = time.perf_counter()
+  completed = subprocess.run(command, cwd=SRC, env=env, capture_output=True, text=True)
+  wall = (time.perf_counter() - start) * 1000
+  if completed.returncode != 0:
+    raise RuntimeError(f"Benchmark '{name}' failed: {completed.stderr[-500:]}")
+  return wall, float(completed.stdout.strip().splitlines()[-1])
+
+
+def measure(name: str, workdir: Path, args: argparse.Namespace) -> dict:
+  results = {}
+  for scenario in ("cold", "warm"):
+    walls, elapsed = [], []
+    warm_cache = workdir / "cache" / f"{name}-warm"
+    if scenario == "warm":
+      spawn(name, workdir, warm_cache, args)
+    for run in range(args.runs):
+      cache_dir = warm_cache if scenario == "warm" else workdir / "cache" / f"{name}-cold-{run}"
+      wall, case = spawn(name, workdir, cache_dir, args)
+      walls.append(wall)
+      elapsed.append(case)
+    results[f"{name}_{scenario}"] = {"wall_ms": statistics.median(walls), "case_ms": statistics.median(elapsed)}
+  return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+  regressions = []
+  for name, result in results.items():
+    previous = baseline.get("results", {}).get(name)
+    if previous is None:
+      continue
+    for metric in ("wall_ms", "case_ms"):
+      limit = previous[metric] * (1 + threshold)
+      if result[metric] > limit and result[metric] - previous[metric] >= MIN_REGRESSION_MS:
+        regressions.append(
+          f"{name} {metric}: {result[metric]:.1f} ms vs {previous[metric]:.1f} ms (+{threshold:.0%} allowed)"
+        )
+  return regressions
+
+
+def git_revision() -> str | None:
+  completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+  return completed.stdout.strip() or None
+
+
+def main() -> int:
+  parser = argparse.ArgumentParser(description="Benchmark init, generate, template rendering and plugin loading")
+  parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES), help="Cases to run")
+  parser.add_argument("--runs", type=int, default=5, help="Runs per case and scenario (median is reported)")
+  parser.add_argument("--files", type=int, default=1000, help="Files in the synthetic template tree")
+  parser.add_argument("--depth", type=int, default=3, help="Directory depth of the synthetic template tree")
+  parser.add_argument("--modules", type=int, default=50, help="Modules rendered by the generate case")
+  parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+  parser.add_argument("--compare", type=Path, help="JSON results from a previous run to check for regressions")
+  parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown ratio")
+  parser.add_argument("--case", choices=list(CASES), help=argparse.SUPPRESS)
+  parser.add_argument("--workdir", type=Path, help=argparse.SUPPRESS)
+  args = parser.parse_args()
+
+  if args.case:
+    print(f"{run_case(args.case, args.workdir, args):.3f}")
+    return 0
+
+  from synthetic import build_template_tree
+
+  with tempfile.TemporaryDirectory() as tmp:
+    workdir = Path(tmp)
+    build_template_tree(workdir / "templates" / SYNTHETIC_TEMPLATE / "project_root", args.files, args.depth)
+    results = {}
+    for name in args.cases:
+      results.update(measure(name, workdir, args))
+
+  report = {
+    "revision": git_revision(),
+    "python": platform.python_version(),
+    "parameters": {"files": args.files, "depth": args.depth, "modules": args.modules, "runs": args.runs},
+    "results": results,
+  }
+  if args.output:
+    args.output.write_text(json.dumps(report, indent=2))
+
+  for name, result in results.items():
+    print(f"{name:<16} wall {result['wall_ms']:>8.1f} ms   in-process {result['case_ms']:>8.1f} ms")
+
+  if args.compare is None:
+    return 0
+  regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+  for regression in regressions:
+    print(f"❌ {regression}")
+  if not regressions:
+    print(f"✅ No regressions against {args.compare}")
+  return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,86 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+BUDGET_FILE = Path(__file__).resolve().parent / "startup_budget.json"
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+  imports = {}
+  for line in stderr.splitlines():
+    if not line.startswith("import time:") or "|" not in line:
+      continue
+    own, _cumulative, name = (part.strip() for part in line[len("import time:") :].split("|"))
+    if own.isdigit():
+      imports[name] = int(own)
+  return imports
+
+
+def interpreter_modules() -> set[str]:
+  completed = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"], capture_output=True, text=True)
+  return set(parse_importtime(completed.stderr))
+
+
+def measure(command: list[str], runs: int, baseline: set[str]) -> dict:
+  walls = []
+  import_times = []
+  modules: set[str] = set()
+  for _ in range(runs):
+    start = time.perf_counter()
+    completed = subprocess.run(
+      [sys.executable, "-X", "importtime", "main.py", *command], cwd=SRC, capture_output=True, text=True
+    )
+    walls.append((time.perf_counter() - start) * 1000)
+    if completed.returncode != 0:
+      raise RuntimeError(f"'{' '.join(command)}' exited with {completed.returncode}: {completed.stderr[-500:]}")
+    imports = {name: own for name, own in parse_importtime(completed.stderr).items() if name not in baseline}
+    import_times.append(sum(imports.values()) / 1000)
+    modules.update(imports)
+  return {"wall_ms": statistics.median(walls), "import_ms": statistics.median(import_times), "modules": modules}
+
+
+def main() -> int:
+  parser = argparse.ArgumentParser(description="Fail when CLI cold start grows beyond its budget")
+  parser.add_argument("--runs", type=int, default=5, help="Runs per command (median is compared)")
+  parser.add_argument("--budget-file", type=Path, default=BUDGET_FILE, help="JSON file with per-command budgets")
+  parser.add_argument("--json", action="store_true", help="Print results as JSON")
+  args = parser.parse_args()
+
+  budgets = json.loads(args.budget_file.read_text())
+  baseline = interpreter_modules()
+  failures = []
+  results = {}
+
+  for name, budget in budgets["commands"].items():
+    result = measure(budget["argv"], args.runs, baseline)
+    results[name] = {"wall_ms": result["wall_ms"], "import_ms": result["import_ms"]}
+
+    if result["import_ms"] > budget["max_import_ms"]:
+      failures.append(f"{name}: imports took {result['import_ms']:.1f} ms (budget {budget['max_import_ms']} ms)")
+    if result["wall_ms"] > budget["max_wall_ms"]:
+      failures.append(f"{name}: cold start took {result['wall_ms']:.1f} ms (budget {budget['max_wall_ms']} ms)")
+    forbidden = sorted(set(budget.get("forbidden_modules", [])) & result["modules"])
+    if forbidden:
+      failures.append(f"{name}: imported {', '.join(forbidden)}")
+
+  if args.json:
+    print(json.dumps({"results": results, "failures": failures}, indent=2))
+  else:
+    for name, result in results.items():
+      print(f"{name:<20} wall {result['wall_ms']:>7.1f} ms   imports {result['import_ms']:>7.1f} ms")
+    for failure in failures:
+      print(f"❌ {failure}")
+    if not failures:
+      print("✅ Startup within budget")
+
+  return 1 if failures else 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+TEMPLATE_BODIES = (
+  "from {{ project_name }}.settings import *\n{% if use_docker %}DOCKER = True{% endif %}\n",
+  "APP_NAME = '000project_name000'\n",
+  "import os\n\n\ndef handler(request):\n  return os.environ.get('KEY')\n" * 4,
+)
+
+
+def build_template_tree(root: Path, files: int, depth: int = 2) -> None:
+  for number in range(files):
+    directory = root
+    for level in range(depth):
+      directory /= f"level{level}_{(number >> level) % 8}"
+    if number % 10 == 0:
+      directory /= "{{ project_name }}"
+    directory.mkdir(parents=True, exist_ok=True)
+
+    if number % 5 == 0:
+      body = TEMPLATE_BODIES[0]
+    elif number % 11 == 0:
+      body = TEMPLATE_BODIES[1]
+    else:
+      body = TEMPLATE_BODIES[2]
+    (directory / f"module_{number}.py").write_text(body)
@@ -1,8 +1,6 @@
-import asyncio
-
-from googletrans import Translator
-from inflect import engine
+from pathlib import Path
 
+from core.generator.generation_plan import DEFAULT_PLAN_WORKERS, GenerationPlan, PlanExecutor
 from core.generator.generator_factory import GeneratorFactory
 from core.inputs.interface_user_input import InterfaceUserInput
 from core.interfaces.base_class import (
@@ -16,83 +14,98 @@ from core.interfaces.base_class import (
   QueryOption,
   ViewOption,
 )
+from core.services.name_normalizer import NameNormalizer
+from core.services.profiler import phase
+from core.services.reporter import Level, report, span
+from core.services.scaffold_manifest import ScaffoldManifest, use_manifest
+from core.services.translation_backends import GoogleTranslationBackend
 
 
 class ModuleGenerator:
-  def __init__(self, user_input: InterfaceUserInput):
-    self.factory = GeneratorFactory()
+  def __init__(
+    self,
+    user_input: InterfaceUserInput,
+    factory: GeneratorFactory | None = None,
+    normalizer: NameNormalizer | None = None,
+    manifest: ScaffoldManifest | None = None,
+    plan_workers: int = DEFAULT_PLAN_WORKERS,
+  ):
+    self.factory = factory if factory is not None else GeneratorFactory()
     self.user_input = user_input
-    self.engine = engine()
-
-  def run(self):
-    context = self._collect_inputs()
+    self.normalizer = normalizer if normalizer is not None else NameNormalizer(GoogleTranslationBackend())
+    self.manifest = manifest
+    self.plan_workers = plan_workers
+
+  def run(self, plan_only: bool = False):
+    with phase("collect_inputs"):
+      context = self._collect_inputs()
+    if plan_only:
+      self.plan(context).print_plan(context["module_name"])
+      return
     self._generate_structure(context)
-    print("\n✅ Setup completed successfully\n")
-
-  async def translate_text(self, text: str) -> str:
-    async with Translator() as translator:
-      try:
-        result = await translator.translate(text, dest="en", src="auto")
-        return result.text
-      except Exception as e:
-        print(f"Error trying to translate the text: {e}")
-        return text
+    report("\n✅ Setup completed successfully\n", Level.SUCCESS)
 
   def _collect_inputs(self) -> dict:
     context = {}
 
     try:
       # Friendly initial message
-      print("\n🛠️  Module Generation Wizard")
-      print("Press Ctrl+C at any time to cancel\n")
+      report("\n🛠️  Module Generation Wizard")
+      report("Press Ctrl+C at any time to cancel\n")
 
       # Module and Application Names Section
-      print("\n📝 Module Basic Information")
+      report("\n📝 Module Basic Information")
       self._collect_basic_names(context)
 
       # Language and Framework Selection
-      print("\n🌐 Language and framework selection")
+      report("\n🌐 Language and framework selection")
       self._collect_language_and_framework(context)
 
-      # Domain Layer
-      self._collect_domain_layer_inputs(context)
-
-      # Application Layer
-      self._collect_application_layer_inputs(context)
-
-      # Infrastructure Layer
-      self._collect_infrastructure_layer_inputs(context)
+      self._collect_layer_inputs(context)
     except KeyboardInterrupt:
-      print("\n\n🛑 Operation canceled by user. Exiting wizard....")
-      print("💡 You can run the command again whenever you need.\n")
-      print("✨ Thanks for using the module builder. See you soon!")
+      report("\n\n🛑 Operation canceled by user. Exiting wizard....", Level.WARNING)
+      report("💡 You can run the command again whenever you need.\n", Level.WARNING)
+      report("✨ Thanks for using the module builder. See you soon!", Level.WARNING)
       exit(0)
     except Exception as e:
-      print(f"\n❌ Unexpected error: {str(e)}")
-      print("🔧 Please report this bug so we can improve it.")
+      report(f"\n❌ Unexpected error: {str(e)}", Level.ERROR)
+      report("🔧 Please report this bug so we can improve it.", Level.ERROR)
       exit(1)
 
     return context
 
+  def collect_context(self) -> dict:
+    context = {}
+    with phase("collect_inputs"):
+      self._collect_basic_names(context)
+      self._collect_language_and_framework(context)
+      self._collect_layer_inputs(context)
+    return context
+
+  def _collect_layer_inputs(self, context: dict) -> None:
+    # Domain Layer
+    self._collect_domain_layer_inputs(context)
+
+    # Application Layer
+    self._collect_application_layer_inputs(context)
+
+    # Infrastructure Layer
+    self._collect_infrastructure_layer_inputs(context)
+
   def _collect_basic_names(self, context: dict) -> None:
     app_name = self.user_input.get_application_name()
-    get_module_name = self.user_input.get_module_name()
-    translate_text = asyncio.run(self.translate_text(get_module_name))
-    singular_noun = self.engine.singular_noun(str(translate_text))
-    module_name = singular_noun if isinstance(singular_noun, str) else translate_text
-    module_name_plural = self.engine.plural(module_name)
-    context.update({"app_name": app_name, "module_name": module_name, "module_name_plural": module_name_plural})
+    name = self.normalizer.normalize(self.user_input.get_module_name())
+    context.update({"app_name": app_name, "module_name": name.singular, "module_name_plural": name.plural})
 
   def _collect_language_and_framework(self, context: dict) -> None:
-    languages = list(self.factory._plugins.keys())
-    language = self.user_input.select_single_option("Select language:", languages)
-    frameworks = self.factory._plugins[language].supported_frameworks
+    language = self.user_input.select_single_option("Select language:", self.factory.languages)
+    frameworks = self.factory.supported_frameworks(language)
     framework = self.user_input.select_single_option("Select framework:", frameworks)
     context.update({"language": language, "framework": framework})
 
   def _collect_domain_layer_inputs(self, context: dict) -> None:
     if self.user_input.confirm_action("Do you want to configure domain layer?"):
-      print("\n🏗️  Domain layer configuration")
+      report("\n🏗️  Domain layer configuration")
       domain_options = self.user_input.select_options("Select domain options:", list(DomainOption))
       context.update({"domain_options": domain_options})
 
@@ -103,7 +116,7 @@ class ModuleGenerator:
 
   def _collect_application_layer_inputs(self, context: dict) -> None:
     if self.user_input.confirm_action("Do you want to configure application layer?"):
-      print("\n🏗️  Application layer configuration")
+      report("\n🏗️  Application layer configuration")
       app_options = self.user_input.select_options("Select application options:", list(ApplicationOption))
       context["application_options"] = app_options
 
@@ -117,7 +130,7 @@ class ModuleGenerator:
 
   def _collect_infrastructure_layer_inputs(self, context: dict):
     if self.user_input.confirm_action("Do you want to configure infrastructure layer?"):
-      print("\n🏗️  Infrastructure layer configuration")
+      report("\n🏗️  Infrastructure layer configuration")
       infra_options = self.user_input.select_options("Select infrastructure options:", list(InfrastructureOption))
       context["infrastructure_options"] = infra_options
 
@@ -133,29 +146,43 @@ class ModuleGenerator:
           view_options = self.user_input.select_options("Select view types:", list(ViewOption))
           context["view_options"] = view_options
 
-  def _generate_structure(self, context: dict):
-    self._generate_domain_layer(context)
-    self._generate_application_layer(context)
-    self._generate_infrastructure_layer(context)
-
-  def _generate_domain_layer(self, context: dict):
+  def generate(self, context: dict) -> list[Path]:
+    return self._generate_structure(context)
+
+  def plan(self, context: dict) -> GenerationPlan:
+    plan = GenerationPlan()
+    self._plan_domain_layer(context, plan)
+    self._plan_application_layer(context, plan)
+    self._plan_infrastructure_layer(context, plan)
+    return plan
+
+  def _generate_structure(self, context: dict) -> list[Path]:
+    with span("plan", module=context["module_name"]) as fields:
+      plan = self.plan(context)
+      fields["nodes"] = len(plan.nodes)
+    with span("execute", module=context["module_name"]) as fields, use_manifest(self.manifest):
+      written_files = PlanExecutor(self.plan_workers).run(plan)
+      fields["files"] = len(written_files)
+    return written_files
+
+  def _plan_domain_layer(self, context: dict, plan: GenerationPlan) -> None:
     if "domain_options" in context:
-      print("INFO: Generating Domain Layer...")
+      report("INFO: Planning Domain Layer...", Level.DETAIL)
       domain_generator = self.factory.get_generator(context["language"], context["framework"], LayerType.DOMAIN)
-      domain_generator.generate(context)
+      domain_generator.plan(context, plan)
 
-  def _generate_application_layer(self, context: dict):
+  def _plan_application_layer(self, context: dict, plan: GenerationPlan) -> None:
     if "application_options" in context:
-      print("INFO: Generating Application Layer...")
+      report("INFO: Planning Application Layer...", Level.DETAIL)
       application_generator = self.factory.get_generator(
         context["language"], context["framework"], LayerType.APPLICATION
       )
-      application_generator.generate(context)
+      application_generator.plan(context, plan)
 
-  def _generate_infrastructure_layer(self, context: dict):
+  def _plan_infrastructure_layer(self, context: dict, plan: GenerationPlan) -> None:
     if "infrastructure_options" in context:
-      print("INFO: Generating Infrastructure Layer...")
+      report("INFO: Planning Infrastructure Layer...", Level.DETAIL)
       infrastructure_generator = self.factory.get_generator(
         context["language"], context["framework"], LayerType.INFRASTRUCTURE
       )
-      infrastructure_generator.generate(context)
+      infrastructure_generator.plan(context, plan)
@@ -0,0 +1,194 @@
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from core.services.reporter import Level, get_reporter, report
+from core.services.translation_backends import DEFAULT_TRANSLATOR, TRANSLATION_BACKENDS
+
+if TYPE_CHECKING:
+  from core.generator.batch_module_generator import ModuleResult
+  from core.generator.generation_plan import GenerationPlan
+  from core.generator.generator_factory import GeneratorFactory
+  from core.services.file_writers import OutputTransaction
+  from core.services.name_normalizer import NameNormalizer
+  from core.services.scaffold_manifest import ScaffoldManifest
+
+
+class GenerateCommand:
+  def __init__(self, parser: ArgumentParser | None = None):
+    self._factory: GeneratorFactory | None = None
+    self._normalizers: dict[str, NameNormalizer] = {}
+    self.parser = parser if parser is not None else self._argument_parser()
+    self._configure_parser(self.parser)
+
+  def _argument_parser(self) -> ArgumentParser:
+    return ArgumentParser(
+      description="Generate module structure", usage="main.py generate [--manifest MANIFEST] [options]", add_help=False
+    )
+
+  def _configure_parser(self, parser: ArgumentParser) -> None:
+    parser.add_argument("--manifest", type=Path, help="JSON or YAML manifest describing the modules to generate")
+    parser.add_argument(
+      "--workers", type=int, default=1, help="Number of modules generated concurrently in manifest mode (default: 1)"
+    )
+    parser.add_argument(
+      "--translator",
+      choices=list(TRANSLATION_BACKENDS),
+      default=DEFAULT_TRANSLATOR,
+      help=f"Backend used to translate module names to English (default: {DEFAULT_TRANSLATOR})",
+    )
+    parser.add_argument(
+      "--no-template-cache", action="store_true", help="Do not read or write the compiled template cache"
+    )
+    parser.add_argument(
+      "--dry-run", action="store_true", help="Show which files would be created or changed without writing them"
+    )
+    parser.add_argument(
+      "--plan",
+      action="store_true",
+      help="Print the files each module would produce, in dependency order with estimated sizes, without writing",
+    )
+    parser.add_argument(
+      "--daemon",
+      action="store_true",
+      help="Send a --manifest request to a running `main.py serve` daemon (falls back to in-process)",
+    )
+    parser.add_argument("--socket", type=Path, help="Daemon socket path (default: in the user cache directory)")
+
+  def execute(self, parsed_args: Namespace):
+    if parsed_args.daemon:
+      if parsed_args.manifest is None:
+        report("\n❌ --daemon requires --manifest; the interactive wizard always runs in-process", Level.ERROR)
+        exit(1)
+      if self._submit_to_daemon(parsed_args):
+        return
+    self.run(parsed_args, Path.cwd())
+
+  def run(self, parsed_args: Namespace, root: Path):
+    # Deferred so that parsing other subcommands does not pull in jinja2 and the plugin machinery.
+    from core.cli import ModuleGenerator
+    from core.generator.batch_module_generator import BatchModuleGenerator
+    from core.inputs.cli_user_input import CLIUserInput
+    from core.inputs.manifest_user_input import ManifestUserInput
+    from core.services.file_writers import OutputTransaction
+    from core.services.scaffold_manifest import ScaffoldManifest
+    from core.services.template_cache import set_template_cache_enabled
+
+    set_template_cache_enabled(not parsed_args.no_template_cache)
+    normalizer = self.normalizer(parsed_args.translator)
+    dry_run = parsed_args.dry_run or parsed_args.plan
+    writer = None if dry_run else OutputTransaction(root)
+    scaffold_manifest = ScaffoldManifest(root, dry_run=dry_run, writer=writer)
+
+    try:
+      if parsed_args.manifest is None:
+        generator = ModuleGenerator(
+          CLIUserInput(), factory=self.factory(), normalizer=normalizer, manifest=scaffold_manifest
+        )
+        generator.run(plan_only=parsed_args.plan)
+        if parsed_args.plan:
+          return
+        self._finish(scaffold_manifest, writer)
+        report("\n✅ Module structure generated successfully!", Level.SUCCESS)
+        return
+
+      try:
+        inputs = ManifestUserInput.from_file(parsed_args.manifest)
+      except ValueError as e:
+        report(f"\n❌ Manifest error: {str(e)}", Level.ERROR)
+        exit(1)
+
+      batch = BatchModuleGenerator(
+        inputs, normalizer, workers=parsed_args.workers, manifest=scaffold_manifest, factory=self.factory()
+      )
+      if parsed_args.plan:
+        report(f"\n🗺️  Planning {len(inputs)} modules from {parsed_args.manifest}")
+        results = self._print_plans(batch.plan())
+      else:
+        report(f"\n🛠️  Generating {len(inputs)} modules from {parsed_args.manifest}")
+        results = batch.run()
+        self._print_summary(results)
+        self._finish(scaffold_manifest, writer)
+    except BaseException:
+      if writer is not None:
+        writer.rollback()
+      raise
+
+    if any(result.error for result in results):
+      exit(1)
+
+  def factory(self) -> "GeneratorFactory":
+    if self._factory is None:
+      from core.generator.generator_factory import GeneratorFactory
+
+      self._factory = GeneratorFactory()
+    return self._factory
+
+  def normalizer(self, translator: str) -> "NameNormalizer":
+    if translator not in self._normalizers:
+      from core.services.name_normalizer import NameNormalizer
+
+      self._normalizers[translator] = NameNormalizer(TRANSLATION_BACKENDS[translator]())
+    return self._normalizers[translator]
+
+  def _submit_to_daemon(self, parsed_args: Namespace) -> bool:
+    from core.services.generator_daemon import DaemonUnavailableError, submit
+
+    request = {
+      "action": "generate",
+      "cwd": str(Path.cwd()),
+      "manifest": str(parsed_args.manifest.resolve()),
+      "workers": parsed_args.workers,
+      "translator": parsed_args.translator,
+      "no_template_cache": parsed_args.no_template_cache,
+      "dry_run": parsed_args.dry_run,
+      "plan": parsed_args.plan,
+      "reporter": getattr(parsed_args, "reporter", "console"),
+    }
+    try:
+      response = submit(request, parsed_args.socket)
+    except DaemonUnavailableError as e:
+      report(f"⚠️  {str(e)}; generating in-process", Level.WARNING)
+      return False
+
+    print(response["output"], end="")
+    if response["exit_code"]:
+      exit(response["exit_code"])
+    return True
+
+  def _finish(self, scaffold_manifest: "ScaffoldManifest", writer: "OutputTransaction | None") -> None:
+    scaffold_manifest.save()
+    scaffold_manifest.report.print_summary(show_diffs=scaffold_manifest.dry_run)
+    if writer is None:
+      report("🔎 Dry run: no files were written")
+      return
+    writer.commit()
+    get_reporter().record("write", writer.stats.elapsed, files=writer.stats.files, bytes=writer.stats.bytes)
+    report(f"💾 Wrote {writer.stats.summary()}")
+
+  def _print_plans(self, planned: list[tuple["ModuleResult", "GenerationPlan | None"]]) -> list["ModuleResult"]:
+    for result, plan in planned:
+      if plan is None:
+        report(f"\n❌ {result.module_name}: {result.error}", Level.ERROR)
+        continue
+      try:
+        plan.print_plan(result.module_name)
+      except ValueError as e:
+        result.error = str(e)
+        report(f"\n❌ {result.module_name}: {result.error}", Level.ERROR)
+    return [result for result, _ in planned]
+
+  def _print_summary(self, results: list["ModuleResult"]) -> None:
+    report("\n📊 Generation summary")
+    for result in results:
+      if result.error:
+        report(f"❌ {result.module_name}: {result.error} ({result.elapsed:.2f}s)", Level.ERROR)
+      else:
+        report(f"✅ {result.module_name}: {len(result.files)} files written ({result.elapsed:.2f}s)")
+
+    total_files = sum(len(result.files) for result in results)
+    total_time = sum(result.elapsed for result in results)
+    generated = sum(1 for result in results if not result.error)
+    report(
+      f"\n{generated}/{len(results)} modules generated, {total_files} files written in {total_time:.2f}s", Level.SUCCESS
+    )
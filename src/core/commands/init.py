@@ -1,32 +1,38 @@
+import time
 from argparse import ArgumentError, ArgumentParser, Namespace
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from core.generator.project_initializer import ProjectInitializer
-from core.interfaces.init_command_base import DatabaseOption, InitCommandConfig, TemplateOption
+from core.inputs.manifest_file import read_manifest_file
+from core.interfaces.init_command_base import DatabaseOption, InitCommandConfig
+from core.services.reporter import Level, get_reporter, report
+from core.services.template_registry import TemplateRegistry
 from core.services.validators import validate_project_name
 
+if TYPE_CHECKING:
+  from core.generator.batch_project_initializer import ProjectResult
+
 PROJECTS = "projects"
 
 
 class InitCommand:
   def __init__(self, parser: ArgumentParser | None = None):
+    self.registry = TemplateRegistry()
     self.parser = parser if parser is not None else self._argument_parser()
     self._configure_parser(self.parser)
 
   def _argument_parser(self) -> ArgumentParser:
     return ArgumentParser(
       description="Initialize a new project from a template",
-      usage="main.py init --template TEMPLATE [options]",
+      usage="main.py init (--template TEMPLATE | --batch BATCH) [options]",
       add_help=False,
     )
 
   def _configure_parser(self, parser: ArgumentParser) -> None:
-    required = parser.add_argument_group("required arguments")
-    required.add_argument(
-      "--template", required=True, choices=[t.value for t in TemplateOption], help="Project template to use"
-    )
-
     optional = parser.add_argument_group("optional arguments")
+    optional.add_argument(
+      "--template", choices=self.registry.names(), help="Project template to use (required unless --batch is given)"
+    )
     optional.add_argument("--path", type=Path, help="Project directory path")
     optional.add_argument("--name", help="Project name (will be normalized)")
     optional.add_argument(
@@ -37,6 +43,29 @@ class InitCommand:
     )
     optional.add_argument("--use-docker", action="store_true", help="Include Docker setup files")
     optional.add_argument("--not-git", action="store_true", help="Skip git repository initialization")
+    optional.add_argument(
+      "--render-workers", type=int, help="Maximum number of concurrent template renders (default: CPU count + 4)"
+    )
+    optional.add_argument(
+      "--render-processes", action="store_true", help="Render templates in a process pool instead of threads"
+    )
+    optional.add_argument(
+      "--dry-run", action="store_true", help="Show which files would change, with diffs, without writing anything"
+    )
+    optional.add_argument(
+      "--link-assets",
+      action="store_true",
+      help="Hard-link binary and large assets from the template when on the same filesystem instead of copying",
+    )
+    optional.add_argument(
+      "--batch", type=Path, help="JSON or YAML file describing several projects to initialize in parallel"
+    )
+    optional.add_argument(
+      "--batch-workers", type=int, help="Number of processes used with --batch (default: CPU count)"
+    )
+    optional.add_argument(
+      "--no-template-cache", action="store_true", help="Do not read or write the compiled template cache"
+    )
 
   def _get_project_name(self, args: Namespace) -> str:
     if args.name:
@@ -59,29 +88,115 @@ class InitCommand:
       use_docker=args.use_docker,
       not_git=args.not_git,
       database=DatabaseOption(args.database.lower()),
+      render_workers=args.render_workers,
+      render_processes=args.render_processes,
+      dry_run=args.dry_run,
+      link_assets=args.link_assets,
     )
 
+  def _create_batch_configs(self, args: Namespace) -> list[InitCommandConfig]:
+    data = read_manifest_file(args.batch)
+    if not isinstance(data, dict) or not isinstance(data.get("projects"), list):
+      raise ValueError(f"Batch file {args.batch} must contain a 'projects' list")
+
+    defaults = data.get("defaults", {})
+    configs = []
+    for project in data["projects"]:
+      entry = {**defaults, **project}
+      template = entry.get("template")
+      if self.registry.get(template) is None:
+        raise ValueError(f"Batch project {entry.get('name')!r} has an unknown template {template!r}")
+      project_args = Namespace(**{
+        **vars(args),
+        "template": template,
+        "name": entry.get("name"),
+        "path": Path(entry["path"]) if entry.get("path") else args.path,
+        "database": entry.get("database", args.database),
+        "use_docker": entry.get("use_docker", args.use_docker),
+        "not_git": entry.get("not_git", args.not_git),
+        # Projects already run in parallel, so each one renders serially unless told otherwise.
+        "render_workers": args.render_workers or 1,
+      })
+      configs.append(self._create_config(project_args))
+
+    paths = [config.path for config in configs]
+    if len(set(paths)) != len(paths):
+      raise ValueError(f"Batch file {args.batch} initializes the same project path more than once")
+    return configs
+
   def execute(self, parsed_args: Namespace):
     try:
+      if parsed_args.batch is not None:
+        self._execute_batch(parsed_args)
+        return
+      if parsed_args.template is None:
+        raise ArgumentError(None, "the following arguments are required: --template")
+
       config = self._create_config(parsed_args)
 
-      print(f"\n🚀 Initializing project {config.name_project}")
-      print(f"📦 Template: {config.template}")
-      print(f"🗃️  Database: {config.database.value}")
+      report(f"\n🚀 Initializing project {config.name_project}")
+      report(f"📦 Template: {config.template}")
+      report(f"🗃️  Database: {config.database.value}")
       if config.use_docker:
-        print("🐳 Docker Configuration: Yes")
+        report("🐳 Docker Configuration: Yes")
       if not config.not_git:
-        print("🥬 Setting up the Git repository: Yes")
+        report("🥬 Setting up the Git repository: Yes")
+
+      # Deferred so that parsing other subcommands does not pull in jinja2 and the dependency checkers.
+      from core.generator.project_initializer import ProjectInitializer
+      from core.services.template_cache import set_template_cache_enabled
 
+      set_template_cache_enabled(not parsed_args.no_template_cache)
       initializer = ProjectInitializer()
       initializer.initialize_project(config)
     except ArgumentError as e:
-      print(f"\n❌ Argument error: {str(e)}")
+      report(f"\n❌ Argument error: {str(e)}", Level.ERROR)
       self.parser.print_help()
       exit(1)
     except ValueError as e:
-      print(f"\n❌ Validation error: {str(e)}")
+      report(f"\n❌ Validation error: {str(e)}", Level.ERROR)
       exit(1)
     except Exception as e:
-      print(f"\n❌ Unexpected error: {str(e)}")
+      report(f"\n❌ Unexpected error: {str(e)}", Level.ERROR)
       exit(1)
+
+  def _execute_batch(self, parsed_args: Namespace):
+    configs = self._create_batch_configs(parsed_args)
+
+    from core.generator.batch_project_initializer import BatchProjectInitializer
+    from core.services.template_cache import set_template_cache_enabled
+
+    set_template_cache_enabled(not parsed_args.no_template_cache)
+    batch = BatchProjectInitializer(configs, workers=parsed_args.batch_workers)
+    report(f"\n🚀 Initializing {len(configs)} projects with {batch.workers} workers")
+
+    start = time.perf_counter()
+    results = batch.run(lambda result, done: self._print_progress(result, done, len(configs)))
+    self._print_batch_summary(results, time.perf_counter() - start)
+
+    if any(result.error for result in results):
+      exit(1)
+
+  def _print_progress(self, result: "ProjectResult", done: int, total: int) -> None:
+    reporter = get_reporter()
+    reporter.record(
+      "project", result.elapsed, name=result.name_project, path=result.path, files=result.files, error=result.error
+    )
+    reporter.progress(done, total, result.name_project)
+    if result.error:
+      report(f"❌ [{done}/{total}] {result.name_project}: {result.error}", Level.ERROR)
+    else:
+      report(f"✅ [{done}/{total}] {result.name_project}: {result.files} files in {result.elapsed:.2f}s")
+
+  def _print_batch_summary(self, results: list["ProjectResult"], wall: float) -> None:
+    created = [result for result in results if not result.error]
+    work = sum(result.elapsed for result in results)
+    report("\n📊 Batch summary")
+    report(
+      f"{len(created)}/{len(results)} projects initialized, {sum(result.files for result in created)} files",
+      Level.SUCCESS,
+    )
+    report(f"Wall clock {wall:.2f}s, {work:.2f}s of project work ({work / wall if wall else 0:.1f}x parallelism)")
+    if created:
+      slowest = max(created, key=lambda result: result.elapsed)
+      report(f"Slowest: {slowest.name_project} ({slowest.elapsed:.2f}s) at {slowest.path}")
@@ -1,45 +1,22 @@
-from core.interfaces.init_command_base import DatabaseOption, TemplateInfo
+from core.interfaces.init_command_base import TemplateInfo
+from core.services.template_registry import TemplateRegistry
 
 
 class ListTemplatesCommand:
-  def __init__(self):
+  def __init__(self, registry: TemplateRegistry | None = None):
+    self.registry = registry if registry is not None else TemplateRegistry()
     self.templates = self._load_templates_info()
 
   def _load_templates_info(self) -> list[TemplateInfo]:
-    return [
-      TemplateInfo(
-        language="Python",
-        name="Django",
-        description="Django project with modern setup",
-        databases=[DatabaseOption.SQLITE.value, DatabaseOption.POSTGRES.value, DatabaseOption.MYSQL.value],
-        supports_docker=True,
-        required_dependencies=[("python", "system"), ("django", "python"), ("pip", "system")],
-        github_url="https://github.com/django/django",
-      ),
-      TemplateInfo(
-        language="TypeScript",
-        name="Express",
-        description="Express.js project with TypeScript",
-        databases=[DatabaseOption.SQLITE.value, DatabaseOption.POSTGRES.value, DatabaseOption.MONGODB.value],
-        supports_docker=True,
-        required_dependencies=[("node", "system"), ("npm", "system"), ("typescript", "system")],
-        github_url="https://github.com/expressjs/express",
-      ),
-      TemplateInfo(
-        language="PHP",
-        name="Laravel",
-        description="Laravel project with modern setup",
-        databases=[DatabaseOption.MYSQL.value, DatabaseOption.POSTGRES.value],
-        supports_docker=True,
-        required_dependencies=[("php", "system"), ("composer", "system")],
-        github_url="https://github.com/laravel/laravel",
-      ),
-    ]
+    return self.registry.templates()
 
   def execute(self):
     print("Available project templates:\n")
     for template in self.templates:
-      print(f"• {template.language} - {template.name}")
+      print(f"• {template.language} - {template.name} ({template.template_id})")
       print(f"  Description: {template.description}")
       print(f"  Supported databases: {', '.join(template.databases)}")
-      print(f"  Docker support: {'Yes' if template.supports_docker else 'No'}\n")
+      print(f"  Docker support: {'Yes' if template.supports_docker else 'No'}")
+      if template.bundles:
+        print(f"  Feature bundles: {', '.join(template.bundles)}")
+      print(f"  Template files: {template.file_count if template.file_count else 'not bundled'}\n")
@@ -0,0 +1,49 @@
+import os
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+
+class ServeCommand:
+  def __init__(self, parser: ArgumentParser | None = None):
+    self.parser = parser if parser is not None else self._argument_parser()
+    self._configure_parser(self.parser)
+
+  def _argument_parser(self) -> ArgumentParser:
+    return ArgumentParser(
+      description="Run a generator daemon that keeps plugins, templates and name caches warm",
+      usage="main.py serve [--socket SOCKET] [options]",
+      add_help=False,
+    )
+
+  def _configure_parser(self, parser: ArgumentParser) -> None:
+    parser.add_argument("--socket", type=Path, help="Unix socket to listen on (default: in the user cache directory)")
+    parser.add_argument(
+      "--idle-timeout",
+      type=float,
+      default=30 * 60,
+      help="Exit after this many seconds without requests, 0 to never exit (default: 1800)",
+    )
+    parser.add_argument("--status", action="store_true", help="Report whether a daemon is listening and exit")
+    parser.add_argument("--stop", action="store_true", help="Ask a running daemon to exit")
+
+  def execute(self, parsed_args: Namespace):
+    from core.services.generator_daemon import DaemonUnavailableError, GeneratorDaemon, default_socket_path, submit
+
+    socket_path = parsed_args.socket if parsed_args.socket is not None else default_socket_path()
+    if parsed_args.status or parsed_args.stop:
+      try:
+        response = submit({"action": "stop" if parsed_args.stop else "ping"}, socket_path)
+      except DaemonUnavailableError as e:
+        print(f"⚪ {str(e)}")
+        exit(1)
+      print(response["output"], end="")
+      return
+
+    daemon = GeneratorDaemon(socket_path, idle_timeout=parsed_args.idle_timeout)
+    daemon.warm_up()
+    print(f"🔥 Generator daemon listening on {socket_path} (pid {os.getpid()})")
+    print("💡 Send manifests with `main.py generate --manifest FILE --daemon`; stop with `main.py serve --stop`")
+    try:
+      daemon.serve()
+    except KeyboardInterrupt:
+      print("\n🛑 Generator daemon stopped")
@@ -1,21 +1,95 @@
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import jinja2
 
+from core.generator.generation_plan import FileNode, GenerationPlan, PlanExecutor
+from core.services.file_writers import DirectWriter
+from core.services.profiler import phase
+from core.services.reporter import span
+from core.services.scaffold_manifest import FileStatus, active_manifest, hash_bytes, hash_context
+from core.services.template_cache import get_bytecode_cache
+
+if TYPE_CHECKING:
+  from core.interfaces.base_class import LayerType
+
+_environments: dict[tuple[str, int], jinja2.Environment] = {}
+_environments_lock = threading.Lock()
+
+
+def get_environment(template_dir: str) -> jinja2.Environment:
+  # One environment per template directory keeps compiled templates in memory across layers and modules.
+  bytecode_cache = get_bytecode_cache()
+  key = (template_dir, id(bytecode_cache))
+  with _environments_lock:
+    if key not in _environments:
+      with phase("build_environment"):
+        _environments[key] = jinja2.Environment(
+          loader=jinja2.FileSystemLoader(searchpath=template_dir),
+          trim_blocks=True,
+          lstrip_blocks=True,
+          bytecode_cache=bytecode_cache,
+        )
+    return _environments[key]
+
+
+def environment_count() -> int:
+  return len(_environments)
+
 
 class BaseGenerator:
+  layer: "LayerType | None" = None
+
   def __init__(self, template_dir: str):
-    self.template_loader = jinja2.FileSystemLoader(searchpath=template_dir)
-    self.template_env = jinja2.Environment(loader=self.template_loader, trim_blocks=True, lstrip_blocks=True)
+    self.template_env = get_environment(template_dir)
+    self.template_loader = self.template_env.loader
+    self.writer = DirectWriter()
 
   def render_template(self, template_name: str, context: dict) -> str:
-    template = self.template_env.get_template(template_name)
-    return template.render(**context)
+    with phase("render"), span("template", template=template_name) as fields:
+      template = self.template_env.get_template(template_name)
+      content = template.render(**context)
+      fields["chars"] = len(content)
+      return content
 
-  def generate_file(self, output_path: Path, content: str):
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-      f.write(content)
+  def render_to_file(self, template_name: str, context: dict, output_path: Path) -> bool:
+    manifest = active_manifest.get()
+    if manifest is None:
+      return self.generate_file(output_path, self.render_template(template_name, context))
 
-  def generate(self, context: dict):
+    source, _, _ = self.template_loader.get_source(self.template_env, template_name)
+    template_hash = hash_bytes(source.encode("utf-8"))
+    context_hash = hash_context(context)
+    if manifest.is_current(output_path, template_hash, context_hash):
+      manifest.skip(output_path)
+      return False
+
+    return self._write(output_path, self.render_template(template_name, context), template_hash, context_hash)
+
+  def generate_file(self, output_path: Path, content: str) -> bool:
+    return self._write(output_path, content, "", "")
+
+  def _write(self, output_path: Path, content: str, template_hash: str, context_hash: str) -> bool:
+    manifest = active_manifest.get()
+    with phase("write"):
+      if manifest is not None:
+        status = manifest.write(output_path, content, template_hash, context_hash)
+        if status not in (FileStatus.CREATED, FileStatus.UPDATED):
+          return False
+      else:
+        self.writer.write(output_path, content.encode("utf-8"))
+    return True
+
+  def add_file(
+    self, plan: GenerationPlan, template_name: str, context: dict, output_path: Path, depends_on: tuple[Path, ...] = ()
+  ) -> FileNode:
+    return plan.add(FileNode(output_path, template_name, context, self, depends_on))
+
+  def plan(self, context: dict, plan: GenerationPlan):
     raise NotImplementedError
+
+  def generate(self, context: dict):
+    plan = GenerationPlan()
+    self.plan(context, plan)
+    PlanExecutor().run(plan)
@@ -0,0 +1,90 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.cli import ModuleGenerator
+from core.generator.generation_plan import GenerationPlan
+from core.generator.generator_factory import GeneratorFactory
+from core.inputs.interface_user_input import InterfaceUserInput
+from core.services.name_normalizer import NameNormalizer
+from core.services.reporter import get_reporter
+from core.services.scaffold_manifest import ScaffoldManifest
+
+
+@dataclass
+class ModuleResult:
+  module_name: str
+  files: list[Path] = field(default_factory=list)
+  elapsed: float = 0.0
+  error: str | None = None
+
+
+class BatchModuleGenerator:
+  def __init__(
+    self,
+    inputs: list[InterfaceUserInput],
+    normalizer: NameNormalizer,
+    workers: int = 1,
+    manifest: ScaffoldManifest | None = None,
+    factory: GeneratorFactory | None = None,
+  ):
+    self.inputs = inputs
+    self.workers = max(1, workers)
+    self.factory = factory if factory is not None else GeneratorFactory()
+    self._done = 0
+    self._lock = threading.Lock()
+    self.normalizer = normalizer
+    self.manifest = manifest
+
+  def run(self) -> list[ModuleResult]:
+    self.normalizer.normalize_many([user_input.get_module_name() for user_input in self.inputs])
+    prepared = [self._collect(user_input) for user_input in self.inputs]
+
+    if self.workers == 1:
+      return [self._generate(*item) for item in prepared]
+
+    with ThreadPoolExecutor(max_workers=self.workers) as executor:
+      return list(executor.map(lambda item: self._generate(*item), prepared))
+
+  def plan(self) -> list[tuple[ModuleResult, GenerationPlan | None]]:
+    self.normalizer.normalize_many([user_input.get_module_name() for user_input in self.inputs])
+    planned = []
+    for generator, context, result in (self._collect(user_input) for user_input in self.inputs):
+      plan = None
+      if context is not None:
+        try:
+          plan = generator.plan(context)
+        except Exception as e:
+          result.error = str(e)
+      planned.append((result, plan))
+    return planned
+
+  def _collect(self, user_input: InterfaceUserInput) -> tuple[ModuleGenerator, dict | None, ModuleResult]:
+    generator = ModuleGenerator(user_input, factory=self.factory, normalizer=self.normalizer, manifest=self.manifest)
+    result = ModuleResult(module_name=user_input.get_module_name())
+    start = time.perf_counter()
+    try:
+      context = generator.collect_context()
+    except Exception as e:
+      result.error = str(e)
+      context = None
+    result.elapsed = time.perf_counter() - start
+    return generator, context, result
+
+  def _generate(self, generator: ModuleGenerator, context: dict | None, result: ModuleResult) -> ModuleResult:
+    if context is not None:
+      start = time.perf_counter()
+      try:
+        result.files = generator.generate(context)
+      except Exception as e:
+        result.error = str(e)
+      result.elapsed += time.perf_counter() - start
+
+    reporter = get_reporter()
+    reporter.record("module", result.elapsed, module=result.module_name, files=len(result.files), error=result.error)
+    with self._lock:
+      self._done += 1
+      reporter.progress(self._done, len(self.inputs), result.module_name)
+    return result
@@ -0,0 +1,95 @@
+import contextlib
+import io
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.generator.project_initializer import ProjectInitializer
+from core.interfaces.init_command_base import InitCommandConfig
+from core.services.template_cache import is_template_cache_enabled, set_template_cache_enabled
+from core.services.template_index import get_template_index
+
+_initializer: ProjectInitializer | None = None
+
+
+@dataclass
+class ProjectResult:
+  name_project: str
+  path: Path
+  files: int = 0
+  elapsed: float = 0.0
+  error: str | None = None
+
+
+def _init_worker(template_cache_enabled: bool) -> None:
+  global _initializer
+  set_template_cache_enabled(template_cache_enabled)
+  _initializer = ProjectInitializer()
+
+
+def _initialize(config: InitCommandConfig, initializer: ProjectInitializer | None = None) -> ProjectResult:
+  initializer = initializer if initializer is not None else _initializer
+  result = ProjectResult(name_project=config.name_project, path=config.path)
+  start = time.perf_counter()
+  try:
+    with contextlib.redirect_stdout(io.StringIO()):
+      result.files = len(initializer.initialize_project(config, check_dependencies=False).statuses)
+  except Exception as e:
+    result.error = str(e)
+  result.elapsed = time.perf_counter() - start
+  return result
+
+
+class BatchProjectInitializer:
+  def __init__(self, configs: list[InitCommandConfig], workers: int | None = None):
+    self.configs = configs
+    self.workers = max(1, min(workers or os.cpu_count() or 1, len(configs)))
+    self.initializer = ProjectInitializer()
+
+  def run(self, on_result: Callable[[ProjectResult, int], None] | None = None) -> list[ProjectResult]:
+    results = []
+    rejected = self._prepare_templates()
+    pending = []
+    for config in self.configs:
+      if config.template in rejected:
+        result = ProjectResult(config.name_project, config.path, error=rejected[config.template])
+        results.append(result)
+        if on_result is not None:
+          on_result(result, len(results))
+      else:
+        pending.append(config)
+
+    if self.workers == 1:
+      for config in pending:
+        results.append(_initialize(config, self.initializer))
+        if on_result is not None:
+          on_result(results[-1], len(results))
+      return results
+
+    with ProcessPoolExecutor(
+      max_workers=self.workers, initializer=_init_worker, initargs=(is_template_cache_enabled(),)
+    ) as executor:
+      futures = [executor.submit(_initialize, config) for config in pending]
+      for future in as_completed(futures):
+        results.append(future.result())
+        if on_result is not None:
+          on_result(results[-1], len(results))
+    return results
+
+  def _prepare_templates(self) -> dict[str, str]:
+    # Dependency checks and template indexes are resolved once here instead of once per project.
+    rejected = {}
+    template_manager = self.initializer.template_manager
+    for template in sorted({config.template for config in self.configs}):
+      if not template_manager.validate_dependencies(template):
+        rejected[template] = "The necessary dependencies are not met"
+        continue
+      template_path = template_manager.template_path(template)
+      if not template_path.exists():
+        rejected[template] = f"Template directory {template} not found"
+        continue
+      get_template_index(template_path, persist=is_template_cache_enabled())
+    return rejected
@@ -0,0 +1,100 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from core.services.scaffold_manifest import hash_context
+
+if TYPE_CHECKING:
+  from core.generator.base_generator import BaseGenerator
+
+DEFAULT_PLAN_WORKERS = 4
+
+
+@dataclass
+class FileNode:
+  output_path: Path
+  template_name: str
+  context: dict
+  generator: "BaseGenerator"
+  depends_on: tuple[Path, ...] = ()
+
+  def render(self) -> str:
+    return self.generator.render_template(self.template_name, self.context)
+
+  def execute(self) -> bool:
+    return self.generator.render_to_file(self.template_name, self.context, self.output_path)
+
+
+class GenerationPlan:
+  def __init__(self):
+    self.nodes: dict[Path, FileNode] = {}
+    self.duplicates = 0
+
+  def add(self, node: FileNode) -> FileNode:
+    existing = self.nodes.get(node.output_path)
+    if existing is None:
+      self.nodes[node.output_path] = node
+      return node
+
+    if existing.template_name != node.template_name or hash_context(existing.context) != hash_context(node.context):
+      raise ValueError(f"Plan renders {node.output_path} twice with different templates or context")
+    existing.depends_on = tuple(dict.fromkeys(existing.depends_on + node.depends_on))
+    self.duplicates += 1
+    return existing
+
+  def levels(self) -> list[list[FileNode]]:
+    pending = {path: set(node.depends_on) for path, node in self.nodes.items()}
+    for path, depends_on in pending.items():
+      missing = depends_on - self.nodes.keys()
+      if missing:
+        raise ValueError(f"{path} depends on {sorted(map(str, missing))}, which the plan does not produce")
+
+    levels = []
+    while pending:
+      ready = [path for path, depends_on in pending.items() if not depends_on]
+      if not ready:
+        raise ValueError(f"Plan has a dependency cycle between {sorted(map(str, pending))}")
+      levels.append([self.nodes[path] for path in ready])
+      for path in ready:
+        del pending[path]
+      for depends_on in pending.values():
+        depends_on.difference_update(ready)
+    return levels
+
+  def estimate_sizes(self) -> dict[Path, int]:
+    # Rendering in memory gives exact sizes; nothing touches the disk until the plan is executed.
+    return {path: len(node.render().encode("utf-8")) for path, node in self.nodes.items()}
+
+  def print_plan(self, title: str) -> None:
+    levels = self.levels()
+    sizes = self.estimate_sizes()
+    duplicates = f", {self.duplicates} duplicate outputs merged" if self.duplicates else ""
+    # The plan is the command's output rather than status, so it is printed whatever reporter is active.
+    print(f"\n🗺️  Plan for {title}: {len(self.nodes)} files in {len(levels)} steps{duplicates}")
+    for step, level in enumerate(levels, start=1):
+      for node in level:
+        print(f"  [{step}] {node.output_path} ({node.template_name}, ~{sizes[node.output_path]} bytes)")
+        for dependency in node.depends_on:
+          print(f"        after {dependency}")
+    print(f"📏 Estimated output: {sum(sizes.values())} bytes")
+
+
+class PlanExecutor:
+  def __init__(self, max_workers: int = DEFAULT_PLAN_WORKERS):
+    self.max_workers = max(1, max_workers)
+
+  def run(self, plan: GenerationPlan) -> list[Path]:
+    levels = plan.levels()
+    written = set()
+    if self.max_workers == 1 or all(len(level) == 1 for level in levels):
+      for level in levels:
+        written.update(node.output_path for node in level if node.execute())
+    else:
+      with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        for level in levels:
+          # Each node runs in a copy of the caller's context so the active scaffold manifest is visible.
+          futures = {node.output_path: executor.submit(contextvars.copy_context().run, node.execute) for node in level}
+          written.update(path for path, future in futures.items() if future.result())
+    return [path for path in plan.nodes if path in written]
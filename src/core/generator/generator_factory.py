@@ -1,79 +1,75 @@
-import importlib
-import pkgutil
-from enum import Enum
-from pathlib import Path
+import threading
+from dataclasses import dataclass
 
-from core.generator.base_generator import BaseGenerator
+from core.generator.base_generator import BaseGenerator, environment_count
 from core.interfaces.base_class import FrameworkOption, LanguageOption, LanguagePlugin, LayerType
+from core.services.plugin_registry import PluginRegistry
+from core.services.profiler import phase
+
+
+@dataclass
+class GeneratorPoolStats:
+  hits: int = 0
+  misses: int = 0
+  environments: int = 0
+
+  def summary(self) -> str:
+    return f"{self.misses} generators built, {self.hits} reused, {self.environments} template environments"
 
 
 class GeneratorFactory:
-  def __init__(self):
+  def __init__(self, registry: PluginRegistry | None = None):
+    self.registry = registry if registry is not None else PluginRegistry()
     self._plugins: dict[LanguageOption, LanguagePlugin] = {}
-    self._load_plugins()
+    self._generators: dict[tuple[LanguageOption, FrameworkOption | None, LayerType | None], BaseGenerator] = {}
+    self._lock = threading.RLock()
+    self.pool_stats = GeneratorPoolStats()
+
+  @property
+  def languages(self) -> list[LanguageOption]:
+    with phase("load_plugins"):
+      return [LanguageOption(entry.language) for entry in self.registry.entries()]
 
-  def _load_plugins(self):
-    plugins_dir = Path(__file__).parent.parent.parent / "plugins"
-    for _finder, name, _ in pkgutil.iter_modules([str(plugins_dir)]):
-      module = importlib.import_module(f"plugins.{name}")
-      for item in dir(module):
-        obj = getattr(module, item)
-        try:
-          if (
-            isinstance(obj, type)
-            and obj is not LanguagePlugin
-            and obj is not BaseGenerator
-            and not issubclass(obj, type(Enum) | Enum)
-          ):
-            plugin = obj()
+  def supported_frameworks(self, language: LanguageOption) -> list[FrameworkOption]:
+    return self._get_plugin(language).supported_frameworks
 
-            if isinstance(plugin, LanguagePlugin):
-              self._plugins[plugin.language_name] = plugin
-        except TypeError:
-          continue
+  def _get_plugin(self, language: LanguageOption) -> LanguagePlugin:
+    with self._lock:
+      if language not in self._plugins:
+        entry = self.registry.find(language.value)
+        if entry is None:
+          raise ValueError(
+            f"Unsupported language '{language.value}' is not supported."
+            f"Available options: {[lang.value for lang in self.languages]}"
+          )
+        with phase("load_plugins"):
+          self._plugins[language] = self.registry.load(entry)
+      return self._plugins[language]
 
   def get_generator(
     self, language: LanguageOption, framework: FrameworkOption | None = None, layer: LayerType | None = None
   ) -> BaseGenerator:
-    if language not in self._plugins:
-      raise ValueError(
-        f"Unsupported language '{language.value}' is not supported."
-        f"Available options: {[lang.value for lang in self._plugins]}"
-      )
-
-    plugin = self._plugins[language]
-
-    if framework is not None and framework not in plugin.supported_frameworks:
-      raise ValueError(
-        f"Framework '{framework.value}' is not supported for language '{language.value}'. "
-        f"Available options: {[f.value for f in plugin.supported_frameworks]}"
-      )
-
-    generator = plugin.get_generator(framework, layer)
+    key = (language, framework, layer)
+    with self._lock:
+      generator = self._generators.get(key)
+      if generator is not None:
+        self.pool_stats.hits += 1
+        return generator
 
-    if layer is not None and not self._validate_layer_support(generator, layer):
-      supported_layers = self._get_supported_layers(generator)
-      raise ValueError(
-        f"Layer '{layer.value}' is not supported by this generator. "
-        f"Available layers: {[layer.value for layer in supported_layers]}"
-      )
+      plugin = self._get_plugin(language)
+      if framework is not None and framework not in plugin.supported_frameworks:
+        raise ValueError(
+          f"Framework '{framework.value}' is not supported for language '{language.value}'. "
+          f"Available options: {[f.value for f in plugin.supported_frameworks]}"
+        )
 
-    return self._plugins[language].get_generator(framework)
+      with phase("build_generator"):
+        generator = plugin.get_generator(framework, layer)
 
-  def _validate_layer_support(self, generator: BaseGenerator, layer: LayerType) -> bool:
-    layer_methods = {
-      LayerType.DOMAIN: hasattr(generator, "generate_domain"),
-      LayerType.APPLICATION: hasattr(generator, "generate_application"),
-      LayerType.INFRASTRUCTURE: hasattr(generator, "generate_infrastructure"),
-    }
-    return layer_methods.get(layer, False)
+      if layer is not None and generator.layer not in (None, layer):
+        raise ValueError(f"Layer '{layer.name.lower()}' is not supported by {type(generator).__name__}")
 
-  def _get_supported_layers(self, generator: BaseGenerator) -> list[LayerType]:
-    supported = []
-    if hasattr(generator, "generate_domain"):
-      supported.append(LayerType.DOMAIN)
-    if hasattr(generator, "generate_application"):
-      supported.append(LayerType.APPLICATION)
-    if hasattr(generator, "generate_infrastructure"):
-      supported.append(LayerType.INFRASTRUCTURE)
-    return supported
+      self._generators[key] = generator
+      self.pool_stats.misses += 1
+      self.pool_stats.environments = environment_count()
+      return generator
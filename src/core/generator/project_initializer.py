@@ -2,6 +2,11 @@ import subprocess
 from pathlib import Path
 
 from core.interfaces.init_command_base import InitCommandConfig
+from core.services.file_writers import OutputTransaction
+from core.services.git_bootstrap import bootstrap_repository
+from core.services.profiler import phase
+from core.services.reporter import Level, get_reporter, report, span
+from core.services.scaffold_manifest import MANIFEST_FILE, ScaffoldManifest, SyncReport
 from core.services.template_manager import TemplateManager
 
 
@@ -9,63 +14,92 @@ class ProjectInitializer:
   def __init__(self):
     self.template_manager = TemplateManager()
 
-  def initialize_project(self, config: "InitCommandConfig"):
-    self._validate_project(config)
-    self._create_project_structure(config)
-    self._process_template_files(config)
+  def initialize_project(self, config: "InitCommandConfig", check_dependencies: bool = True) -> SyncReport:
+    if check_dependencies:
+      self._validate_project(config)
+    sync_report = self._process_template_files(config)
 
-    if not config.not_git:
-      self._initialize_git_repo(config.path, config.name_project)
+    if config.dry_run:
+      sync_report.print_summary(show_diffs=True)
+      report("\n🔎 Dry run: no files were written")
+      return sync_report
+
+    sync_report.print_summary()
 
-    if config.use_docker:
-      self._setup_docker(config)
+    if not config.not_git:
+      self._initialize_git_repo(config.path, config.name_project, list(sync_report.statuses))
 
-    print(f"\n🎉 Project {config.name_project} created successfully!")
-    print(f"📍 Location: {config.path.absolute()}")
+    report(f"\n🎉 Project {config.name_project} created successfully!", Level.SUCCESS)
+    report(f"📍 Location: {config.path.absolute()}", Level.SUCCESS)
+    return sync_report
 
   def _validate_project(self, config: InitCommandConfig):
-    if not self.template_manager.validate_dependencies(config.template):
+    with phase("check_dependencies"):
+      valid = self.template_manager.validate_dependencies(config.template)
+    if not valid:
       raise RuntimeError("The necessary dependencies are not met")
 
-  def _create_project_structure(self, config: InitCommandConfig):
-    config.path.mkdir(parents=True, exist_ok=True)
-
-  def _process_template_files(self, config: "InitCommandConfig"):
+  def _process_template_files(self, config: "InitCommandConfig") -> SyncReport:
     context = {"project_name": config.name_project, "database": config.database.value, "use_docker": config.use_docker}
-    self.template_manager.render_template(config.template, context, config.path, config.name_project)
+    if config.dry_run:
+      manifest = ScaffoldManifest(config.path, dry_run=True)
+      self._render(config, context, manifest)
+      return manifest.report
+
+    # Files are staged next to the project and moved into place only once everything rendered.
+    with OutputTransaction(config.path) as transaction:
+      manifest = ScaffoldManifest(config.path, writer=transaction)
+      self._render(config, context, manifest)
+      manifest.save()
+    get_reporter().record(
+      "write", transaction.stats.elapsed, files=transaction.stats.files, bytes=transaction.stats.bytes
+    )
+    report(f"💾 Wrote {transaction.stats.summary()}")
+    return manifest.report
+
+  def _render(self, config: InitCommandConfig, context: dict, manifest: ScaffoldManifest):
+    render_report = self.template_manager.render_template(
+      config.template,
+      context,
+      config.path,
+      config.name_project,
+      max_workers=config.render_workers,
+      use_processes=config.render_processes,
+      manifest=manifest,
+      link_assets=config.link_assets,
+    )
+    reporter = get_reporter()
+    if reporter.records_spans:
+      for path, elapsed in render_report.timings.items():
+        reporter.record("template", elapsed, path=path.relative_to(config.path).as_posix())
+      kinds = {kind.name.lower(): count for kind, count in render_report.kinds.items()}
+      reporter.record("render", render_report.elapsed, files=render_report.files, kinds=kinds)
+    report(f"\n✅ {render_report.files} files processed in {render_report.elapsed:.2f}s ({render_report.summary()})")
+    if render_report.bundles:
+      report(f"🧩 Feature bundles: {', '.join(render_report.bundles)}")
+    if config.use_docker and "docker" not in render_report.bundles:
+      report("\n⚠️  Docker is not supported for this template.", Level.WARNING)
+
+  def _initialize_git_repo(self, path: Path, name_project: str, files: list[Path]):
+    commit_message = f"Initialize project: {name_project}" if name_project else "Initialize project"
+    if not (path / ".git").exists():
+      try:
+        with phase("git"), span("git") as fields:
+          fields["files"] = bootstrap_repository(path, [*files, path / MANIFEST_FILE], commit_message)
+        report(f"\n✅ Git repository initialized with {fields['files']} files")
+        report(f"✅ Initial commit created: '{commit_message}'")
+      except (subprocess.CalledProcessError, OSError):
+        report("\n⚠️  Git initialization failed (git may not be installed)", Level.WARNING)
+      return
 
-  def _initialize_git_repo(self, path: Path, name_project: str):
     try:
       subprocess.run(["git", "init", str(path)], check=True)
-      print("\n✅ Git repository initialized")
+      report("\n✅ Git repository initialized")
 
       subprocess.run(["git", "-C", str(path), "add", "-A"], check=True)
-      print("✅ All files added to staging")
+      report("✅ All files added to staging")
 
-      commit_message = f"Initialize project: {name_project}" if name_project else "Initialize project"
       subprocess.run(["git", "-C", str(path), "commit", "-m", commit_message], check=True)
-      print(f"✅ Initial commit created: '{commit_message}'")
+      report(f"✅ Initial commit created: '{commit_message}'")
     except subprocess.CalledProcessError:
-      print("\n⚠️  Git initialization failed (git may not be installed)")
-
-  def _setup_docker(self, config: InitCommandConfig):
-    template_info = self.template_manager.get_template_info(config.template)
-    if not template_info.supports_docker:
-      print("\n⚠️  Docker is not supported for this template.")
-      return
-
-    docker_context = {"project_name": config.name_project, "database": config.database.value}
-
-    # Render Dockerfile
-    dockerfile_template = f"{config.template}/Dockerfile.j2"
-    dockerfile_path = config.path / "Dockerfile"
-    dockerfile_content = self.template_manager.jinja_env.get_template(dockerfile_template).render(**docker_context)
-    dockerfile_path.write_text(dockerfile_content)
-
-    # Render docker-compose.yml
-    compose_template = f"{config.template}/docker-compose.yml.j2"
-    compose_path = config.path / "docker-compose.yml"
-    compose_content = self.template_manager.jinja_env.get_template(compose_template).render(**docker_context)
-    compose_path.write_text(compose_content)
-
-    print("\n✅ Docker files configured")
+      report("\n⚠️  Git initialization failed (git may not be installed)", Level.WARNING)
@@ -0,0 +1,16 @@
+import json
+from pathlib import Path
+
+
+def read_manifest_file(manifest_path: Path) -> dict:
+  if not manifest_path.is_file():
+    raise ValueError(f"Manifest file {manifest_path} not found")
+
+  content = manifest_path.read_text()
+  if manifest_path.suffix in (".yaml", ".yml"):
+    try:
+      import yaml
+    except ImportError as e:
+      raise ValueError("PyYAML is required to read YAML manifests (pip install pyyaml)") from e
+    return yaml.safe_load(content)
+  return json.loads(content)
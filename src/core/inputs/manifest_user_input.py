@@ -0,0 +1,88 @@
+from enum import Enum
+from pathlib import Path
+
+from core.inputs.interface_user_input import InterfaceUserInput
+from core.inputs.manifest_file import read_manifest_file
+from core.interfaces.base_class import (
+  ApiOption,
+  ApplicationOption,
+  CommandOption,
+  DomainOption,
+  InfrastructureOption,
+  LanguageOption,
+  PersistenceOption,
+  QueryOption,
+  ViewOption,
+)
+
+CONFIRMATION_KEYS = {
+  "Do you want to configure domain layer?": "domain_options",
+  "Do you want to add attributes to the entity?": "entity_attributes",
+  "Do you want to configure application layer?": "application_options",
+  "Do you want to configure infrastructure layer?": "infrastructure_options",
+}
+
+OPTION_KEYS: dict[type[Enum], str] = {
+  DomainOption: "domain_options",
+  ApplicationOption: "application_options",
+  CommandOption: "command_options",
+  QueryOption: "query_options",
+  InfrastructureOption: "infrastructure_options",
+  PersistenceOption: "persistence_options",
+  ApiOption: "api_options",
+  ViewOption: "view_options",
+}
+
+
+class ManifestUserInput(InterfaceUserInput):
+  def __init__(self, spec: dict):
+    for key in ("app_name", "module_name", "language", "framework"):
+      if not spec.get(key):
+        raise ValueError(f"Manifest module entry is missing required key '{key}'")
+    self.spec = spec
+
+  @classmethod
+  def from_file(cls, manifest_path: Path) -> list["ManifestUserInput"]:
+    data = read_manifest_file(manifest_path)
+    if not isinstance(data, dict) or not isinstance(data.get("modules"), list):
+      raise ValueError(f"Manifest {manifest_path} must contain a 'modules' list")
+
+    defaults = data.get("defaults", {})
+    return [cls({**defaults, **module}) for module in data["modules"]]
+
+  def get_application_name(self) -> str:
+    return str(self.spec["app_name"]).strip()
+
+  def get_module_name(self) -> str:
+    return str(self.spec["module_name"]).strip()
+
+  def confirm_action(self, message: str) -> bool:
+    key = CONFIRMATION_KEYS.get(message)
+    return key is not None and bool(self.spec.get(key))
+
+  def select_single_option(self, message: str, options: list[Enum]) -> Enum:
+    key = "language" if options and isinstance(options[0], LanguageOption) else "framework"
+    wanted = str(self.spec[key]).lower()
+    for option in options:
+      if str(option.value).lower() == wanted:
+        return option
+    raise ValueError(f"Invalid {key} '{self.spec[key]}'. Available options: {[option.value for option in options]}")
+
+  def select_options(self, message: str, options: list[Enum]) -> list[Enum]:
+    key = OPTION_KEYS[type(options[0])]
+    wanted = [str(value).lower() for value in self.spec.get(key, [])]
+    selected = [option for option in options if option.value in wanted]
+    unknown = set(wanted) - {option.value for option in selected}
+    if unknown:
+      raise ValueError(f"Invalid {key} {sorted(unknown)}. Available options: {[option.value for option in options]}")
+    return selected
+
+  def get_entity_attributes(self) -> list[tuple[str, str]]:
+    attributes = []
+    for attribute in self.spec.get("entity_attributes", []):
+      if isinstance(attribute, dict):
+        attributes.append((attribute["name"], attribute.get("type", "")))
+      else:
+        name, data_type = attribute
+        attributes.append((name, data_type))
+    return attributes
@@ -21,7 +21,9 @@ class LanguagePlugin(Protocol):
   @property
   def supported_frameworks(self) -> list[FrameworkOption]: ...
 
-  def get_generator(self, framework: FrameworkOption | None = None) -> BaseGenerator: ...
+  def get_generator(
+    self, framework: FrameworkOption | None = None, layer: "LayerType | None" = None
+  ) -> BaseGenerator: ...
 
 
 # ==============================
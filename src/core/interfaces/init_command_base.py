@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
@@ -14,12 +14,6 @@ class DependencyChecker(ABC):
     pass
 
 
-class TemplateOption(Enum):
-  PYTHON_DJANGO = "python-django"
-  TS_EXPRESS = "ts-express"
-  PHP_LARAVEL = "php-laravel"
-
-
 class DatabaseOption(Enum):
   SQLITE = "sqlite"
   POSTGRES = "postgres"
@@ -36,6 +30,10 @@ class TemplateInfo:
   supports_docker: bool
   required_dependencies: list[tuple[str, str]]
   github_url: str
+  template_id: str = ""
+  plugin: str = ""
+  bundles: list[str] = field(default_factory=list)
+  file_count: int = 0
 
 
 @dataclass
@@ -46,3 +44,7 @@ class InitCommandConfig:
   use_docker: bool = False
   not_git: bool = False
   database: DatabaseOption = DatabaseOption.SQLITE
+  render_workers: int | None = None
+  render_processes: bool = False
+  dry_run: bool = False
+  link_assets: bool = False
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass
+class WriteStats:
+  files: int = 0
+  bytes: int = 0
+  elapsed: float = 0.0
+
+  @property
+  def files_per_second(self) -> float:
+    return self.files / self.elapsed if self.elapsed else 0.0
+
+  @property
+  def mb_per_second(self) -> float:
+    return self.bytes / (1024 * 1024) / self.elapsed if self.elapsed else 0.0
+
+  def summary(self) -> str:
+    return (
+      f"{self.files} files, {self.bytes / (1024 * 1024):.2f} MB in {self.elapsed:.2f}s "
+      f"({self.files_per_second:.0f} files/s, {self.mb_per_second:.1f} MB/s)"
+    )
+
+
+class OutputWriter(ABC):
+  @abstractmethod
+  def prepare(self, directories: Iterable[Path]) -> None:
+    pass
+
+  @abstractmethod
+  def write(self, target: Path, data: bytes) -> None:
+    pass
+
+  @abstractmethod
+  def copy(self, target: Path, source: Path, link: bool = False) -> None:
+    pass
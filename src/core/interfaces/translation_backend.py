@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class TranslationBackend(ABC):
+  @property
+  @abstractmethod
+  def name(self) -> str:
+    pass
+
+  @abstractmethod
+  def translate_many(self, texts: list[str]) -> dict[str, str]:
+    pass
@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+APP_NAME = "modular-structure-generation"
+
+
+def get_cache_dir(*parts: str) -> Path:
+  base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA") or Path.home() / ".cache"
+  path = Path(base, APP_NAME, *parts)
+  path.mkdir(parents=True, exist_ok=True)
+  return path
+
+
+def read_json(path: Path) -> Any:
+  try:
+    return json.loads(path.read_text(encoding="utf-8"))
+  except (OSError, ValueError):
+    return None
+
+
+def write_json(path: Path, data: Any, **dump_options) -> bool:
+  # Written to a temporary file and renamed so concurrent readers never see a partial cache; failures are not fatal.
+  try:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+      json.dump(data, f, **dump_options)
+    os.replace(tmp_name, path)
+  except OSError:
+    return False
+  return True
+
+
+def directory_signature(directory: Path, filenames: tuple[str, ...]) -> dict[str, list[int]]:
+  # mtimes of the given files in each package below directory; 0 marks a missing file.
+  signature = {}
+  try:
+    items = list(os.scandir(directory))
+  except OSError:
+    return signature
+  for item in items:
+    if not item.is_dir() or item.name.startswith(("_", ".")):
+      continue
+    mtimes = []
+    for filename in filenames:
+      try:
+        mtimes.append(os.stat(os.path.join(item.path, filename)).st_mtime_ns)
+      except OSError:
+        mtimes.append(0)
+    if any(mtimes):
+      signature[item.name] = mtimes
+  return signature
+
+
+class SignatureCache:
+  def __init__(self, file_name: str, cache_path: Path | None = None):
+    self.file_name = file_name
+    self.cache_path = cache_path
+
+  def load(self, directory: Path, signature: dict[str, list[int]]) -> list | None:
+    cached = read_json(self.path())
+    if not isinstance(cached, dict):
+      return None
+    if cached.get("directory") != str(directory) or cached.get("signature") != signature:
+      return None
+    return cached.get("entries")
+
+  def store(self, directory: Path, signature: dict[str, list[int]], entries: list) -> None:
+    write_json(self.path(), {"directory": str(directory), "signature": signature, "entries": entries})
+
+  def path(self) -> Path:
+    return self.cache_path if self.cache_path is not None else get_cache_dir() / self.file_name
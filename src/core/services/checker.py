@@ -1,6 +1,17 @@
+import shutil
 import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+from pathlib import Path
 
 from core.interfaces.init_command_base import DependencyChecker
+from core.services.cache_dir import get_cache_dir, read_json, write_json
+from core.services.reporter import Level, report, span
+
+CACHE_FILE = "dependencies.json"
+DEFAULT_CACHE_TTL = 24 * 60 * 60
 
 
 class SystemDependencyChecker(DependencyChecker):
@@ -12,45 +23,100 @@ class SystemDependencyChecker(DependencyChecker):
       return False
 
   def install_dependency(self, dependency: str) -> bool:
-    print(f"⚠️  {dependency} no está instalado. No se puede instalar automáticamente.")
+    report(f"⚠️  {dependency} no está instalado. No se puede instalar automáticamente.", Level.WARNING)
     return False
 
 
 class PythonDependencyChecker(DependencyChecker):
   def check_dependency(self, dependency: str) -> bool:
     try:
-      subprocess.run(["python", "-m", "pip", "show", dependency], capture_output=True, check=True)
+      metadata.distribution(dependency)
       return True
-    except subprocess.CalledProcessError:
+    except metadata.PackageNotFoundError:
       return False
 
   def install_dependency(self, dependency: str) -> bool:
     try:
-      subprocess.run(["python", "-m", "pip", "install", dependency], check=True)
+      subprocess.run([sys.executable, "-m", "pip", "install", dependency], check=True)
       return True
     except subprocess.CalledProcessError:
       return False
 
 
+class DependencyCache:
+  def __init__(self, cache_path: Path | None = None, ttl: float = DEFAULT_CACHE_TTL):
+    self.cache_path = cache_path
+    self.ttl = ttl
+    self._entries: dict[str, float] | None = None
+
+  def is_fresh(self, dependency: str, dep_type: str) -> bool:
+    checked_at = self._load().get(self._key(dependency, dep_type))
+    return checked_at is not None and time.time() - checked_at < self.ttl
+
+  def record(self, found: list[tuple[str, str]]) -> None:
+    if not found:
+      return
+    entries = self._load()
+    now = time.time()
+    for dependency, dep_type in found:
+      entries[self._key(dependency, dep_type)] = now
+    write_json(self._cache_file(), entries)
+
+  def _key(self, dependency: str, dep_type: str) -> str:
+    scope = sys.executable if dep_type == "python" else shutil.which(dependency) or ""
+    return f"{dep_type}:{dependency}:{scope}"
+
+  def _load(self) -> dict[str, float]:
+    if self._entries is None:
+      entries = read_json(self._cache_file())
+      self._entries = entries if isinstance(entries, dict) else {}
+    return self._entries
+
+  def _cache_file(self) -> Path:
+    return self.cache_path if self.cache_path is not None else get_cache_dir() / CACHE_FILE
+
+
 class DependencyManager:
-  def __init__(self):
+  def __init__(self, cache: DependencyCache | None = None):
     self.checkers = {"system": SystemDependencyChecker(), "python": PythonDependencyChecker()}
+    self.cache = cache if cache is not None else DependencyCache()
 
   def check_requirements(self, requirements: list[tuple[str, str]]) -> bool:
+    with span("dependencies", count=len(requirements)) as fields:
+      results = self._probe(requirements)
+      fields["missing"] = sum(1 for found in results.values() if not found)
+
     all_ok = True
     for dep, dep_type in requirements:
-      print(f"\n📍 Comprobando la dependencia {dep}")
-      if not self.checkers[dep_type].check_dependency(dep):
-        print(f"❌ Falta dependencia: {dep}")
+      report(f"\n📍 Comprobando la dependencia {dep}", Level.DETAIL)
+      if not results[(dep, dep_type)]:
+        report(f"❌ Falta dependencia: {dep}", Level.ERROR)
         all_ok = False
         if not self._ask_and_install(dep, dep_type):
           return False
       else:
-        print(f"✅ Dependencia {dep} encontrada")
+        report(f"✅ Dependencia {dep} encontrada", Level.DETAIL)
     return all_ok
 
+  def _probe(self, requirements: list[tuple[str, str]]) -> dict[tuple[str, str], bool]:
+    results = {}
+    pending = []
+    for dep, dep_type in requirements:
+      if self.cache.is_fresh(dep, dep_type):
+        results[(dep, dep_type)] = True
+      else:
+        pending.append((dep, dep_type))
+
+    if pending:
+      with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+        checks = executor.map(lambda req: self.checkers[req[1]].check_dependency(req[0]), pending)
+        results.update(zip(pending, checks, strict=True))
+      # Only fresh probes are recorded: refreshing cache hits would keep an uninstalled tool cached forever.
+      self.cache.record([req for req in pending if results[req]])
+    return results
+
   def _ask_and_install(self, dependency: str, dep_type: str) -> bool:
-    print(f"\n⚠️  Se requiere {dependency} para continuar.")
+    report(f"\n⚠️  Se requiere {dependency} para continuar.", Level.WARNING)
     answer = input("¿Deseas intentar instalarlo automáticamente? (s/n): ").lower()
     if answer == "s":
       return self.checkers[dep_type].install_dependency(dependency)
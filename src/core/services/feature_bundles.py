@@ -0,0 +1,41 @@
+import json
+import os
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+METADATA_FILE = "plugin.json"
+
+
+@dataclass(frozen=True)
+class FeatureBundle:
+  name: str
+  files: tuple[str, ...]
+  when: tuple[tuple[str, tuple], ...]
+
+  def enabled(self, context: dict) -> bool:
+    return all(context.get(key) in accepted for key, accepted in self.when)
+
+  def owns(self, relative_path: str) -> bool:
+    return any(relative_path == path or relative_path.startswith(f"{path}/") for path in self.files)
+
+
+def load_bundles(plugin_dir: Path) -> list[FeatureBundle]:
+  metadata_path = plugin_dir / METADATA_FILE
+  try:
+    mtime_ns = os.stat(metadata_path).st_mtime_ns
+  except OSError:
+    return []
+  return _load_bundles(metadata_path, mtime_ns)
+
+
+@cache
+def _load_bundles(metadata_path: Path, mtime_ns: int) -> list[FeatureBundle]:
+  metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+  bundles = []
+  for name, spec in metadata.get("bundles", {}).items():
+    when = tuple(
+      (key, tuple(value) if isinstance(value, list) else (value,)) for key, value in spec.get("when", {}).items()
+    )
+    bundles.append(FeatureBundle(name=name, files=tuple(spec.get("files", [])), when=when))
+  return bundles
@@ -0,0 +1,45 @@
+import os
+import shutil
+from pathlib import Path
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+_ZERO_COPY = []
+if hasattr(os, "copy_file_range"):
+  _ZERO_COPY.append(lambda src_fd, dst_fd, offset, count: os.copy_file_range(src_fd, dst_fd, count))
+if hasattr(os, "sendfile"):
+  _ZERO_COPY.append(lambda src_fd, dst_fd, offset, count: os.sendfile(dst_fd, src_fd, offset, count))
+
+
+def copy_file(source: Path, target: Path, link: bool = False) -> None:
+  if link and _hard_link(source, target):
+    return
+
+  with open(source, "rb") as src, open(target, "wb") as dst:
+    if not _zero_copy(src.fileno(), dst.fileno()):
+      shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+
+def _hard_link(source: Path, target: Path) -> bool:
+  try:
+    if os.stat(source).st_dev != os.stat(target.parent).st_dev:
+      return False
+    target.unlink(missing_ok=True)
+    os.link(source, target)
+    return True
+  except OSError:
+    return False
+
+
+def _zero_copy(src_fd: int, dst_fd: int) -> bool:
+  for copy_range in _ZERO_COPY:
+    offset = 0
+    try:
+      while sent := copy_range(src_fd, dst_fd, offset, COPY_CHUNK_SIZE):
+        offset += sent
+      return True
+    except OSError:
+      # Unsupported for this pair of files (e.g. sendfile to a regular file on macOS); try the next strategy.
+      if offset:
+        raise
+  return False
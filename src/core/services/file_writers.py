@@ -0,0 +1,119 @@
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections.abc import Iterable
+from pathlib import Path
+
+from core.interfaces.output_writer import OutputWriter, WriteStats
+from core.services.file_copier import copy_file
+
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class DirectWriter(OutputWriter):
+  def __init__(self):
+    self.stats = WriteStats()
+    self._created_dirs: set[Path] = set()
+    self._lock = threading.Lock()
+
+  def prepare(self, directories: Iterable[Path]) -> None:
+    start = time.perf_counter()
+    self._make_dirs(self._location(directory) for directory in directories)
+    self._record(0, 0, start)
+
+  def write(self, target: Path, data: bytes) -> None:
+    start = time.perf_counter()
+    location = self._location(target)
+    self._make_dirs([location.parent])
+    with open(location, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+      f.write(data)
+    self._record(1, len(data), start)
+
+  def copy(self, target: Path, source: Path, link: bool = False) -> None:
+    start = time.perf_counter()
+    location = self._location(target)
+    self._make_dirs([location.parent])
+    copy_file(source, location, link=link)
+    self._record(1, os.stat(location).st_size, start)
+
+  def _location(self, target: Path) -> Path:
+    return target
+
+  def _make_dirs(self, directories: Iterable[Path]) -> None:
+    with self._lock:
+      for directory in sorted(set(directories) - self._created_dirs):
+        directory.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(directory)
+        self._created_dirs.update(directory.parents)
+
+  def _record(self, files: int, size: int, start: float) -> None:
+    with self._lock:
+      self.stats.files += files
+      self.stats.bytes += size
+      self.stats.elapsed += time.perf_counter() - start
+
+
+class OutputTransaction(DirectWriter):
+  def __init__(self, root: Path):
+    super().__init__()
+    self.root = Path(os.path.abspath(root))
+    self._replace_root = not self.root.exists()
+    # Staging next to (or inside) the destination keeps it on the same filesystem so commit is a rename.
+    staging_parent = self.root.parent if self._replace_root else self.root
+    staging_parent.mkdir(parents=True, exist_ok=True)
+    # Plain mkdir (not mkdtemp's 0700) so a renamed root gets the usual umask-derived permissions.
+    self.staging = staging_parent / f".{self.root.name}-{uuid.uuid4().hex}.partial"
+    self.staging.mkdir()
+    self._files: set[Path] = set()
+
+  def __enter__(self) -> "OutputTransaction":
+    return self
+
+  def __exit__(self, exc_type, exc, traceback) -> None:
+    if exc_type is None:
+      self.commit()
+    else:
+      self.rollback()
+
+  def write(self, target: Path, data: bytes) -> None:
+    super().write(target, data)
+    self._track(target)
+
+  def copy(self, target: Path, source: Path, link: bool = False) -> None:
+    super().copy(target, source, link=link)
+    self._track(target)
+
+  def commit(self) -> None:
+    start = time.perf_counter()
+    if not self._replace_root or not self._rename_root():
+      self._move_files()
+      shutil.rmtree(self.staging, ignore_errors=True)
+    self._record(0, 0, start)
+
+  def rollback(self) -> None:
+    shutil.rmtree(self.staging, ignore_errors=True)
+
+  def _rename_root(self) -> bool:
+    try:
+      os.rename(self.staging, self.root)
+      return True
+    except OSError:
+      return False
+
+  def _move_files(self) -> None:
+    for directory in sorted({(self.root / relative).parent for relative in self._files}):
+      directory.mkdir(parents=True, exist_ok=True)
+    for relative in sorted(self._files):
+      os.replace(self.staging / relative, self.root / relative)
+
+  def _track(self, target: Path) -> None:
+    with self._lock:
+      self._files.add(self._relative(target))
+
+  def _location(self, target: Path) -> Path:
+    return self.staging / self._relative(target)
+
+  def _relative(self, target: Path) -> Path:
+    return Path(os.path.abspath(target)).relative_to(self.root)
@@ -0,0 +1,159 @@
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from argparse import Namespace
+from pathlib import Path
+
+from core.services.cache_dir import get_cache_dir
+from core.services.reporter import REPORTERS, Level, Reporter, report, use_reporter
+from core.services.translation_backends import DEFAULT_TRANSLATOR
+
+SOCKET_FILE = "generate.sock"
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+CONNECT_TIMEOUT = 0.5
+
+
+class DaemonUnavailableError(Exception):
+  pass
+
+
+def default_socket_path() -> Path:
+  return get_cache_dir("daemon") / SOCKET_FILE
+
+
+def submit(request: dict, socket_path: Path | None = None) -> dict:
+  socket_path = socket_path if socket_path is not None else default_socket_path()
+  client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+  try:
+    client.settimeout(CONNECT_TIMEOUT)
+    try:
+      client.connect(str(socket_path))
+    except OSError as e:
+      raise DaemonUnavailableError(f"Generator daemon is not running at {socket_path}") from e
+    client.settimeout(None)
+    client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+    with client.makefile("rb") as stream:
+      line = stream.readline()
+  finally:
+    client.close()
+  if not line:
+    raise DaemonUnavailableError(f"Generator daemon at {socket_path} closed the connection")
+  return json.loads(line)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+  def handle(self) -> None:
+    try:
+      request = json.loads(self.rfile.readline())
+    except ValueError:
+      response = {"output": "❌ Malformed daemon request\n", "exit_code": 1}
+    else:
+      response = self.server.generator_daemon.handle(request)
+    self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+  generator_daemon: "GeneratorDaemon"
+
+  def handle_timeout(self) -> None:
+    self.generator_daemon.stop()
+
+
+class GeneratorDaemon:
+  def __init__(self, socket_path: Path | None = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+    # Deferred so that `serve --stop` and the generate client stay as light as other subcommands.
+    from core.commands.generate import GenerateCommand
+
+    self.socket_path = socket_path if socket_path is not None else default_socket_path()
+    self.idle_timeout = idle_timeout
+    self.command = GenerateCommand()
+    self.requests = 0
+    self._running = False
+    # Requests are served one at a time: generation output is captured by redirecting the process-wide stdout.
+    self._lock = threading.Lock()
+
+  def warm_up(self) -> None:
+    from core.interfaces.base_class import LayerType
+
+    # Builds the pooled per-layer generators (and their template environments) that requests would otherwise pay for.
+    factory = self.command.factory()
+    for language in factory.languages:
+      for framework in factory.supported_frameworks(language):
+        for layer in LayerType:
+          try:
+            factory.get_generator(language, framework, layer)
+          except ValueError:
+            continue
+    self.command.normalizer(DEFAULT_TRANSLATOR).inflect_engine()
+
+  def serve(self) -> None:
+    self._claim_socket()
+    server = _UnixServer(str(self.socket_path), _RequestHandler)
+    server.generator_daemon = self
+    server.timeout = self.idle_timeout or None
+    os.chmod(self.socket_path, 0o600)
+    self._running = True
+    try:
+      while self._running:
+        server.handle_request()
+    finally:
+      server.server_close()
+      self.socket_path.unlink(missing_ok=True)
+
+  def stop(self) -> None:
+    self._running = False
+
+  def handle(self, request: dict) -> dict:
+    action = request.get("action")
+    if action == "ping":
+      pool = self.command.factory().pool_stats.summary()
+      return {
+        "output": f"🟢 Generator daemon (pid {os.getpid()}) served {self.requests} requests; {pool}\n",
+        "exit_code": 0,
+      }
+    if action == "stop":
+      self.stop()
+      return {"output": "🛑 Generator daemon stopped\n", "exit_code": 0}
+    if action != "generate":
+      return {"output": f"❌ Unknown daemon action {action!r}\n", "exit_code": 1}
+
+    output = io.StringIO()
+    exit_code = 0
+    start = time.perf_counter()
+    reporter = REPORTERS.get(request.get("reporter", "console"), Reporter)(stream=output)
+    # Output paths resolve against the process cwd, so each request runs from the client's directory.
+    with self._lock, contextlib.chdir(request["cwd"]), contextlib.redirect_stdout(output), use_reporter(reporter):
+      try:
+        self.command.run(self._generate_args(request), Path(request["cwd"]))
+      except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+      except Exception as e:
+        report(f"\nError: {str(e)}", Level.ERROR)
+        exit_code = 1
+    self.requests += 1
+    return {"output": output.getvalue(), "exit_code": exit_code, "elapsed": time.perf_counter() - start}
+
+  def _generate_args(self, request: dict) -> Namespace:
+    return Namespace(
+      manifest=Path(request["manifest"]),
+      workers=request.get("workers", 1),
+      translator=request.get("translator", DEFAULT_TRANSLATOR),
+      no_template_cache=request.get("no_template_cache", False),
+      dry_run=request.get("dry_run", False),
+      plan=request.get("plan", False),
+    )
+
+  def _claim_socket(self) -> None:
+    if not self.socket_path.exists():
+      return
+    try:
+      submit({"action": "ping"}, self.socket_path)
+    except (DaemonUnavailableError, OSError, ValueError):
+      self.socket_path.unlink(missing_ok=True)
+      return
+    raise RuntimeError(f"A generator daemon is already listening on {self.socket_path}")
@@ -0,0 +1,118 @@
+import hashlib
+import os
+import stat
+import struct
+import subprocess
+from pathlib import Path
+
+CHUNK_SIZE = 1024 * 1024
+INDEX_VERSION = 2
+
+
+def bootstrap_repository(path: Path, files: list[Path], message: str) -> int:
+  root = Path(os.path.abspath(path))
+  subprocess.run(["git", "init", "--quiet", str(root)], check=True)
+  git_dir = root / ".git"
+  committer = subprocess.run(
+    ["git", "-C", str(root), "var", "GIT_COMMITTER_IDENT"], check=True, capture_output=True, text=True
+  ).stdout.strip()
+
+  entries = []
+  process = subprocess.Popen(["git", "-C", str(root), "fast-import", "--quiet"], stdin=subprocess.PIPE)
+  try:
+    for mark, relative in enumerate(_unignored(root, _relative_paths(root, files)), start=1):
+      entries.append(_stream_blob(process.stdin, os.path.join(root, relative), relative, mark))
+    _stream_commit(process.stdin, _head_ref(git_dir), committer, message, entries)
+  finally:
+    process.stdin.close()
+  if process.wait() != 0:
+    raise subprocess.CalledProcessError(process.returncode, "git fast-import")
+
+  if _uses_sha1(git_dir):
+    _write_index(git_dir, entries)
+  else:
+    subprocess.run(["git", "-C", str(root), "read-tree", "HEAD"], check=True)
+  return len(entries)
+
+
+def _relative_paths(root: Path, files: list[Path]) -> list[str]:
+  prefix = len(str(root)) + 1
+  relative = {os.path.abspath(file)[prefix:].replace(os.sep, "/") for file in files}
+  return sorted((path for path in relative if not path.startswith(".git/")), key=lambda path: path.encode("utf-8"))
+
+
+def _unignored(root: Path, paths: list[str]) -> list[str]:
+  # Honour the project's .gitignore (e.g. .env) the same way `git add -A` would.
+  result = subprocess.run(
+    ["git", "-C", str(root), "check-ignore", "--stdin", "-z"],
+    input="\0".join(paths).encode("utf-8"),
+    capture_output=True,
+  )
+  if result.returncode not in (0, 1):
+    raise subprocess.CalledProcessError(result.returncode, "git check-ignore", stderr=result.stderr)
+  ignored = set(result.stdout.decode("utf-8").split("\0"))
+  return [path for path in paths if path not in ignored]
+
+
+def _stream_blob(stream, file: str, relative: str, mark: int) -> tuple:
+  with open(file, "rb") as f:
+    file_stat = os.fstat(f.fileno())
+    digest = hashlib.sha1(f"blob {file_stat.st_size}\0".encode())
+    stream.write(f"blob\nmark :{mark}\ndata {file_stat.st_size}\n".encode())
+    while chunk := f.read(CHUNK_SIZE):
+      digest.update(chunk)
+      stream.write(chunk)
+    stream.write(b"\n")
+  mode = 0o100755 if file_stat.st_mode & stat.S_IXUSR else 0o100644
+  return relative, mark, mode, digest.digest(), file_stat
+
+
+def _stream_commit(stream, ref: str, committer: str, message: str, entries: list[tuple]) -> None:
+  data = message.encode("utf-8")
+  stream.write(f"commit {ref}\ncommitter {committer}\ndata {len(data)}\n".encode() + data + b"\n")
+  for relative, mark, mode, _, _ in entries:
+    stream.write(f"M {mode:o} :{mark} {_quote(relative)}\n".encode())
+  stream.write(b"\n")
+
+
+def _quote(path: str) -> str:
+  if path.startswith('"') or any(char in path for char in '\\\n"'):
+    return '"' + path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+  return path
+
+
+def _head_ref(git_dir: Path) -> str:
+  head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+  return head.removeprefix("ref: ") if head.startswith("ref: ") else "refs/heads/master"
+
+
+def _uses_sha1(git_dir: Path) -> bool:
+  config = (git_dir / "config").read_text(encoding="utf-8").lower()
+  return "objectformat = sha256" not in config
+
+
+def _write_index(git_dir: Path, entries: list[tuple]) -> None:
+  # Index v2 with stat data taken while hashing, so `git status` does not need to re-read the files.
+  content = bytearray(b"DIRC" + struct.pack(">II", INDEX_VERSION, len(entries)))
+  for relative, _, mode, sha, file_stat in entries:
+    name = relative.encode("utf-8")
+    content += struct.pack(
+      ">10I",
+      int(file_stat.st_ctime) & 0xFFFFFFFF,
+      file_stat.st_ctime_ns % 1_000_000_000,
+      int(file_stat.st_mtime) & 0xFFFFFFFF,
+      file_stat.st_mtime_ns % 1_000_000_000,
+      file_stat.st_dev & 0xFFFFFFFF,
+      file_stat.st_ino & 0xFFFFFFFF,
+      mode,
+      file_stat.st_uid & 0xFFFFFFFF,
+      file_stat.st_gid & 0xFFFFFFFF,
+      file_stat.st_size & 0xFFFFFFFF,
+    )
+    content += sha + struct.pack(">H", min(len(name), 0xFFF)) + name
+    content += b"\0" * (8 - (62 + len(name)) % 8)
+  content += hashlib.sha1(content).digest()
+
+  lock_path = git_dir / "index.lock"
+  lock_path.write_bytes(content)
+  os.replace(lock_path, git_dir / "index")
@@ -0,0 +1,75 @@
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.interfaces.translation_backend import TranslationBackend
+from core.services.cache_dir import get_cache_dir, read_json, write_json
+
+CACHE_FILE = "names.json"
+
+
+@dataclass(frozen=True)
+class NormalizedName:
+  source: str
+  translation: str
+  singular: str
+  plural: str
+
+
+class NameNormalizer:
+  def __init__(self, backend: TranslationBackend, cache_path: Path | None = None):
+    self.backend = backend
+    self.cache_path = cache_path if cache_path is not None else get_cache_dir() / CACHE_FILE
+    self._lock = threading.Lock()
+    self._engine = None
+    self._dirty = False
+    self._cache = self._load_cache()
+
+  def normalize(self, text: str) -> NormalizedName:
+    return self.normalize_many([text])[text]
+
+  def normalize_many(self, texts: list[str]) -> dict[str, NormalizedName]:
+    with self._lock:
+      translations = self._cache.setdefault("translations", {}).setdefault(self.backend.name, {})
+      missing = list(dict.fromkeys(text for text in texts if text not in translations))
+      if missing:
+        found = self.backend.translate_many(missing)
+        translations.update(found)
+        self._dirty = self._dirty or bool(found)
+
+      names = {}
+      for text in texts:
+        translation = translations.get(text, text)
+        singular, plural = self._inflect(translation)
+        names[text] = NormalizedName(source=text, translation=translation, singular=singular, plural=plural)
+
+      self._save_cache()
+      return names
+
+  def _inflect(self, word: str) -> tuple[str, str]:
+    inflections = self._cache.setdefault("inflections", {})
+    if word not in inflections:
+      engine = self.inflect_engine()
+      singular_noun = engine.singular_noun(word)
+      singular = singular_noun if isinstance(singular_noun, str) else word
+      inflections[word] = [singular, engine.plural(singular)]
+      self._dirty = True
+    singular, plural = inflections[word]
+    return singular, plural
+
+  def inflect_engine(self):
+    if self._engine is None:
+      from inflect import engine
+
+      self._engine = engine()
+    return self._engine
+
+  def _load_cache(self) -> dict:
+    cache = read_json(self.cache_path)
+    return cache if isinstance(cache, dict) else {}
+
+  def _save_cache(self) -> None:
+    if not self._dirty:
+      return
+    if write_json(self.cache_path, self._cache, ensure_ascii=False):
+      self._dirty = False
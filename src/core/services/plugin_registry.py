@@ -0,0 +1,95 @@
+import importlib
+import json
+from dataclasses import asdict, dataclass
+from enum import Enum
+from pathlib import Path
+
+from core.services.cache_dir import SignatureCache, directory_signature
+
+PLUGINS = "plugins"
+METADATA_FILE = "plugin.json"
+CACHE_FILE = "plugins.json"
+
+
+@dataclass(frozen=True)
+class PluginEntry:
+  name: str
+  language: str
+  frameworks: tuple[str, ...]
+  entry_point: str
+
+
+class PluginRegistry:
+  PLUGINS_DIR = Path(__file__).parent.parent.parent / PLUGINS
+
+  def __init__(self, plugins_dir: Path | None = None, cache_path: Path | None = None):
+    self.plugins_dir = plugins_dir if plugins_dir is not None else self.PLUGINS_DIR
+    self.cache = SignatureCache(CACHE_FILE, cache_path)
+    self._entries: list[PluginEntry] | None = None
+
+  def entries(self) -> list[PluginEntry]:
+    if self._entries is None:
+      self._entries = self._load_entries()
+    return self._entries
+
+  def find(self, language: str) -> PluginEntry | None:
+    return next((entry for entry in self.entries() if entry.language == language), None)
+
+  def load(self, entry: PluginEntry):
+    module_name, class_name = entry.entry_point.split(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+  def _load_entries(self) -> list[PluginEntry]:
+    signature = directory_signature(self.plugins_dir, (METADATA_FILE, "__init__.py"))
+    cached = self.cache.load(self.plugins_dir, signature)
+    if cached is not None:
+      return [
+        PluginEntry(
+          name=entry["name"],
+          language=entry["language"],
+          frameworks=tuple(entry["frameworks"]),
+          entry_point=entry["entry_point"],
+        )
+        for entry in cached
+      ]
+
+    entries = [entry for name in sorted(signature) if (entry := self._discover(name)) is not None]
+    self.cache.store(self.plugins_dir, signature, [asdict(entry) for entry in entries])
+    return entries
+
+  def _discover(self, name: str) -> PluginEntry | None:
+    metadata_path = self.plugins_dir / name / METADATA_FILE
+    if metadata_path.is_file():
+      metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+      if "entry_point" not in metadata:
+        return None
+      return PluginEntry(
+        name=name,
+        language=metadata["language"],
+        frameworks=tuple(metadata.get("frameworks", [])),
+        entry_point=metadata["entry_point"],
+      )
+    return self._introspect(name)
+
+  def _introspect(self, name: str) -> PluginEntry | None:
+    # Plugins without metadata are imported once; the result is cached until their files change.
+    from core.generator.base_generator import BaseGenerator
+    from core.interfaces.base_class import LanguagePlugin
+
+    module = importlib.import_module(f"{PLUGINS}.{name}")
+    for item in dir(module):
+      obj = getattr(module, item)
+      if not isinstance(obj, type) or obj is LanguagePlugin or issubclass(obj, Enum | BaseGenerator):
+        continue
+      try:
+        plugin = obj()
+      except TypeError:
+        continue
+      if isinstance(plugin, LanguagePlugin):
+        return PluginEntry(
+          name=name,
+          language=plugin.language_name.value,
+          frameworks=tuple(framework.value for framework in plugin.supported_frameworks),
+          entry_point=f"{module.__name__}:{item}",
+        )
+    return None
@@ -0,0 +1,113 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from importlib.abc import Loader, MetaPathFinder
+
+_profiler: "StartupProfiler | None" = None
+_NULL_PHASE = nullcontext()
+
+
+class _TimedLoader(Loader):
+  def __init__(self, loader: Loader, profiler: "StartupProfiler", fullname: str):
+    self._loader = loader
+    self._profiler = profiler
+    self._fullname = fullname
+
+  def create_module(self, spec):
+    return self._loader.create_module(spec)
+
+  def exec_module(self, module):
+    with self._profiler.timing_import(self._fullname):
+      self._loader.exec_module(module)
+
+  def __getattr__(self, name: str):
+    return getattr(self._loader, name)
+
+
+class _ImportTimer(MetaPathFinder):
+  def __init__(self, profiler: "StartupProfiler"):
+    self._profiler = profiler
+
+  def find_spec(self, fullname, path, target=None):
+    for finder in sys.meta_path:
+      if finder is self or not hasattr(finder, "find_spec"):
+        continue
+      spec = finder.find_spec(fullname, path, target)
+      if spec is not None:
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+          spec.loader = _TimedLoader(spec.loader, self._profiler, fullname)
+        return spec
+    return None
+
+
+class StartupProfiler:
+  def __init__(self):
+    self.started_at = time.perf_counter()
+    self.imports: dict[str, tuple[float, float]] = {}
+    self.phases: dict[str, float] = {}
+    self._finder = _ImportTimer(self)
+    self._local = threading.local()
+    self._lock = threading.Lock()
+
+  def install(self) -> None:
+    sys.meta_path.insert(0, self._finder)
+
+  def uninstall(self) -> None:
+    if self._finder in sys.meta_path:
+      sys.meta_path.remove(self._finder)
+
+  @contextmanager
+  def timing_import(self, fullname: str):
+    stack = self._local.__dict__.setdefault("stack", [])
+    stack.append(0.0)
+    start = time.perf_counter()
+    try:
+      yield
+    finally:
+      elapsed = time.perf_counter() - start
+      children = stack.pop()
+      if stack:
+        stack[-1] += elapsed
+      self.imports[fullname] = (elapsed, elapsed - children)
+
+  @contextmanager
+  def phase(self, name: str):
+    start = time.perf_counter()
+    try:
+      yield
+    finally:
+      elapsed = time.perf_counter() - start
+      with self._lock:
+        self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+  def report(self, limit: int = 20) -> str:
+    total_wall = time.perf_counter() - self.started_at
+    total_imports = sum(own for _, own in self.imports.values())
+    lines = ["", "⏱️  Startup profile", f"Total wall clock: {total_wall * 1000:.1f} ms", "", "Phases:"]
+    lines.extend(f"  {name:<20} {elapsed * 1000:>9.1f} ms" for name, elapsed in self.phases.items())
+    lines.extend(["", f"Imports: {len(self.imports)} modules, {total_imports * 1000:.1f} ms"])
+    lines.append(f"  {'module':<48} {'cumulative':>12} {'self':>10}")
+    ranked = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+    lines.extend(
+      f"  {name:<48} {cumulative * 1000:>9.1f} ms {own * 1000:>7.1f} ms" for name, (cumulative, own) in ranked
+    )
+    return "\n".join(lines)
+
+
+def enable_profiling() -> StartupProfiler:
+  global _profiler
+  if _profiler is None:
+    _profiler = StartupProfiler()
+    _profiler.install()
+  return _profiler
+
+
+def get_profiler() -> StartupProfiler | None:
+  return _profiler
+
+
+def phase(name: str):
+  if _profiler is None:
+    return _NULL_PHASE
+  return _profiler.phase(name)
@@ -0,0 +1,232 @@
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+
+from core.interfaces.output_writer import OutputWriter
+from core.services.feature_bundles import FeatureBundle
+from core.services.file_writers import DirectWriter
+from core.services.profiler import phase
+from core.services.scaffold_manifest import (
+  ManifestEntry,
+  ScaffoldManifest,
+  hash_bytes,
+  hash_context,
+  hash_file,
+  is_output_current,
+)
+from core.services.template_cache import get_bytecode_cache, is_template_cache_enabled
+from core.services.template_index import PROJECT_NAME, PROJECT_NAME_000, JobKind, get_template_index
+
+DEFAULT_BATCH_SIZE = 64
+NEWLINE_RE = re.compile(r"\r\n|\r|\n")
+
+
+@dataclass(frozen=True)
+class RenderJob:
+  source: Path
+  output: Path
+  kind: JobKind = JobKind.RENDER
+  needs_replace: bool = True
+
+
+@dataclass
+class RenderResult:
+  job: RenderJob
+  content: str | None
+  elapsed: float
+  kind: JobKind = JobKind.RENDER
+  template_hash: str | None = None
+  current: bool = False
+
+
+@dataclass
+class RenderReport:
+  timings: dict[Path, float] = field(default_factory=dict)
+  kinds: Counter = field(default_factory=Counter)
+  bundles: list[str] = field(default_factory=list)
+  elapsed: float = 0.0
+
+  @property
+  def files(self) -> int:
+    return len(self.timings)
+
+  def slowest(self, count: int = 5) -> list[tuple[Path, float]]:
+    return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[:count]
+
+  def summary(self) -> str:
+    return ", ".join(f"{self.kinds[kind]} {kind.value}" for kind in JobKind if self.kinds[kind])
+
+
+@cache
+def _get_environment(templates_dir: str, use_cache: bool) -> Environment:
+  return Environment(
+    loader=FileSystemLoader(templates_dir),
+    autoescape=False,
+    bytecode_cache=get_bytecode_cache() if use_cache else None,
+    cache_size=-1,
+  )
+
+
+def _render_job(
+  job: RenderJob,
+  templates_dir: str,
+  use_cache: bool,
+  context: dict,
+  name_project: str,
+  context_hash: str | None = None,
+  expected: ManifestEntry | None = None,
+) -> RenderResult:
+  start = time.perf_counter()
+  if job.kind == JobKind.COPY:
+    template_hash = hash_file(job.source) if context_hash is not None else None
+    current = context_hash is not None and is_output_current(job.output, expected, template_hash, context_hash)
+    return RenderResult(job, None, time.perf_counter() - start, JobKind.COPY, template_hash, current)
+
+  raw = None
+  template_hash = None
+  if context_hash is not None:
+    raw = job.source.read_bytes()
+    template_hash = hash_bytes(raw)
+    if is_output_current(job.output, expected, template_hash, context_hash):
+      return RenderResult(job, None, time.perf_counter() - start, job.kind, template_hash, current=True)
+
+  if job.kind == JobKind.RENDER:
+    template_name = job.source.relative_to(templates_dir).as_posix()
+    content = _get_environment(templates_dir, use_cache).get_template(template_name).render(**context)
+  else:
+    content = _as_jinja_output(raw.decode("utf-8") if raw is not None else job.source.read_text(encoding="utf-8"))
+  if job.needs_replace:
+    content = content.replace(PROJECT_NAME, name_project).replace(PROJECT_NAME_000, name_project)
+  return RenderResult(job, content, time.perf_counter() - start, job.kind, template_hash)
+
+
+def _as_jinja_output(source: str) -> str:
+  # Match what Jinja would emit for plain text: normalized newlines and the single trailing newline dropped.
+  lines = NEWLINE_RE.split(source)
+  if lines[-1] == "":
+    del lines[-1]
+  return "\n".join(lines)
+
+
+class RenderPipeline:
+  def __init__(
+    self,
+    templates_dir: Path,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    manifest: ScaffoldManifest | None = None,
+    link_assets: bool = False,
+    writer: OutputWriter | None = None,
+  ):
+    self.templates_dir = str(templates_dir)
+    self.max_workers = max_workers if max_workers is not None else min(32, (os.cpu_count() or 1) + 4)
+    self.use_processes = use_processes
+    self.batch_size = max(1, batch_size)
+    self.use_cache = is_template_cache_enabled()
+    self.manifest = manifest
+    self.link_assets = link_assets
+    if writer is None:
+      writer = manifest.writer if manifest is not None else DirectWriter()
+    self.writer = writer
+    self.context_hash: str | None = None
+
+  def discover(
+    self, template_path: Path, output_path: Path, name_project: str, exclude: list[FeatureBundle] | None = None
+  ) -> list[RenderJob]:
+    entries = get_template_index(template_path, persist=self.use_cache).entries
+    if exclude:
+      entries = [entry for entry in entries if not any(bundle.owns(entry.source) for bundle in exclude)]
+    return [
+      RenderJob(
+        source=template_path / entry.source,
+        output=output_path / entry.destination_for(name_project),
+        kind=entry.kind,
+        needs_replace=entry.needs_replace,
+      )
+      for entry in entries
+    ]
+
+  def run(self, jobs: list[RenderJob], context: dict, name_project: str) -> RenderReport:
+    report = RenderReport()
+    start = time.perf_counter()
+    directories = {job.output.parent for job in jobs}
+    if self.manifest is not None:
+      self.context_hash = hash_context({**context, "name_project": name_project})
+      self.manifest.prepare(directories)
+    else:
+      self.writer.prepare(directories)
+
+    if self.max_workers <= 1 or len(jobs) <= 1:
+      self._run_serial(jobs, context, name_project, report)
+    else:
+      self._run_parallel(jobs, context, name_project, report)
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+  def _run_serial(self, jobs: list[RenderJob], context: dict, name_project: str, report: RenderReport):
+    for job in jobs:
+      with phase("render"):
+        result = _render_job(*self._job_args(job, context, name_project))
+      self._write_batch([result], report)
+
+  def _run_parallel(self, jobs: list[RenderJob], context: dict, name_project: str, report: RenderReport):
+    executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+    window = self.max_workers * 2
+    pending: set[Future] = set()
+    batch: list[RenderResult] = []
+
+    with phase("render"), executor_class(max_workers=self.max_workers) as executor:
+      for job in jobs:
+        if len(pending) >= window:
+          done, pending = wait(pending, return_when=FIRST_COMPLETED)
+          batch.extend(future.result() for future in done)
+          if len(batch) >= self.batch_size:
+            self._write_batch(batch, report)
+            batch = []
+        pending.add(executor.submit(_render_job, *self._job_args(job, context, name_project)))
+
+      for future in wait(pending).done:
+        batch.append(future.result())
+
+    self._write_batch(batch, report)
+
+  def _job_args(self, job: RenderJob, context: dict, name_project: str) -> tuple:
+    expected = self.manifest.entry_for(job.output) if self.manifest is not None else None
+    return job, self.templates_dir, self.use_cache, context, name_project, self.context_hash, expected
+
+  def _write_batch(self, batch: list[RenderResult], report: RenderReport):
+    if self.manifest is not None:
+      self._sync_batch(batch, report)
+      return
+
+    with phase("write"):
+      for result in batch:
+        if result.kind == JobKind.COPY:
+          self.writer.copy(result.job.output, result.job.source, link=self.link_assets)
+        else:
+          self.writer.write(result.job.output, result.content.encode("utf-8"))
+        report.timings[result.job.output] = result.elapsed
+        report.kinds[result.kind] += 1
+
+  def _sync_batch(self, batch: list[RenderResult], report: RenderReport):
+    with phase("write"):
+      for result in batch:
+        output = result.job.output
+        report.timings[output] = result.elapsed
+        if result.current:
+          self.manifest.skip(output)
+          continue
+        if result.kind == JobKind.COPY:
+          self.manifest.copy(output, result.job.source, result.template_hash, self.context_hash, self.link_assets)
+        else:
+          self.manifest.write(output, result.content, result.template_hash, self.context_hash)
+        report.kinds[result.kind] += 1
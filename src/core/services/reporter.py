@@ -0,0 +1,170 @@
+import json
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from enum import Enum
+from typing import TextIO
+
+PROGRESS_WIDTH = 30
+PROGRESS_INTERVAL = 0.1
+
+
+class Level(Enum):
+  DETAIL = "detail"
+  INFO = "info"
+  SUCCESS = "success"
+  WARNING = "warning"
+  ERROR = "error"
+
+
+class Reporter:
+  records_spans = False
+
+  def __init__(self, stream: TextIO | None = None):
+    self.stream = stream
+
+  def message(self, text: str, level: Level = Level.INFO) -> None:
+    print(text, file=self._stream())
+
+  def progress(self, done: int, total: int, label: str = "") -> None:
+    return
+
+  def span(self, name: str, **fields):
+    if not self.records_spans:
+      return nullcontext({})
+    return self._span(name, fields)
+
+  def record(self, name: str, elapsed: float, **fields) -> None:
+    return
+
+  def close(self) -> None:
+    return
+
+  @contextmanager
+  def _span(self, name: str, fields: dict) -> Iterator[dict]:
+    start = time.perf_counter()
+    try:
+      yield fields
+    finally:
+      self.record(name, time.perf_counter() - start, **fields)
+
+  def _stream(self) -> TextIO:
+    return self.stream if self.stream is not None else sys.stdout
+
+
+class QuietReporter(Reporter):
+  def message(self, text: str, level: Level = Level.INFO) -> None:
+    if level in (Level.WARNING, Level.ERROR):
+      super().message(text, level)
+
+
+class ProgressReporter(Reporter):
+  def __init__(self, stream: TextIO | None = None):
+    super().__init__(stream)
+    self._lock = threading.Lock()
+    self._bar = ""
+    self._drawn_at = 0.0
+
+  def message(self, text: str, level: Level = Level.INFO) -> None:
+    if level in (Level.DETAIL, Level.INFO):
+      return
+    with self._lock:
+      self._clear()
+      print(text.strip("\n"), file=self._stream())
+      self._draw()
+
+  def progress(self, done: int, total: int, label: str = "") -> None:
+    now = time.perf_counter()
+    with self._lock:
+      filled = PROGRESS_WIDTH * done // total if total else PROGRESS_WIDTH
+      self._bar = f"[{'#' * filled}{'.' * (PROGRESS_WIDTH - filled)}] {done}/{total} {label}"
+      # Redraws are throttled so large batches are not bound by terminal writes.
+      if done == total or now - self._drawn_at >= PROGRESS_INTERVAL:
+        self._drawn_at = now
+        self._clear()
+        self._draw()
+
+  def close(self) -> None:
+    with self._lock:
+      if self._bar and self._bar_stream().isatty():
+        self._bar_stream().write("\n")
+      self._bar = ""
+
+  def _clear(self) -> None:
+    if self._bar and self._bar_stream().isatty():
+      self._bar_stream().write("\r\033[K")
+
+  def _draw(self) -> None:
+    if self._bar and self._bar_stream().isatty():
+      self._bar_stream().write(self._bar)
+      self._bar_stream().flush()
+
+  def _bar_stream(self) -> TextIO:
+    return self.stream if self.stream is not None else sys.stderr
+
+
+class JsonLinesReporter(Reporter):
+  records_spans = True
+
+  def __init__(self, stream: TextIO | None = None):
+    super().__init__(stream)
+    self._lock = threading.Lock()
+    self._started_at = time.perf_counter()
+
+  def message(self, text: str, level: Level = Level.INFO) -> None:
+    self._emit({"event": "message", "level": level.value, "text": text.strip("\n")})
+
+  def progress(self, done: int, total: int, label: str = "") -> None:
+    self._emit({"event": "progress", "done": done, "total": total, "label": label})
+
+  def record(self, name: str, elapsed: float, **fields) -> None:
+    self._emit({"event": "span", "name": name, "elapsed_ms": round(elapsed * 1000, 3), **fields})
+
+  def close(self) -> None:
+    self._stream().flush()
+
+  def _emit(self, event: dict) -> None:
+    event["time_ms"] = round((time.perf_counter() - self._started_at) * 1000, 3)
+    line = json.dumps(event, ensure_ascii=False, default=str)
+    with self._lock:
+      self._stream().write(line + "\n")
+
+
+REPORTERS: dict[str, type[Reporter]] = {
+  "console": Reporter,
+  "quiet": QuietReporter,
+  "progress": ProgressReporter,
+  "json": JsonLinesReporter,
+}
+
+_reporter: Reporter = Reporter()
+
+
+def get_reporter() -> Reporter:
+  return _reporter
+
+
+def set_reporter(reporter: Reporter) -> Reporter:
+  global _reporter
+  previous, _reporter = _reporter, reporter
+  return previous
+
+
+@contextmanager
+def use_reporter(reporter: Reporter) -> Iterator[Reporter]:
+  previous = set_reporter(reporter)
+  try:
+    yield reporter
+  finally:
+    reporter.close()
+    set_reporter(previous)
+
+
+def report(text: str, level: Level = Level.INFO) -> None:
+  _reporter.message(text, level)
+
+
+def span(name: str, **fields):
+  return _reporter.span(name, **fields)
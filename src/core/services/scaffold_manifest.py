@@ -0,0 +1,206 @@
+import difflib
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+
+from core.interfaces.output_writer import OutputWriter
+from core.services.file_copier import COPY_CHUNK_SIZE
+from core.services.file_writers import DirectWriter
+from core.services.reporter import Level, report
+
+MANIFEST_FILE = ".scaffold-manifest"
+MANIFEST_VERSION = 1
+
+active_manifest: ContextVar["ScaffoldManifest | None"] = ContextVar("active_manifest", default=None)
+
+
+class FileStatus(Enum):
+  CREATED = "created"
+  UPDATED = "updated"
+  SKIPPED = "skipped"
+  CONFLICT = "conflict"
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+  template_hash: str
+  context_hash: str
+  output_hash: str
+
+
+@dataclass
+class SyncReport:
+  statuses: dict[Path, FileStatus] = field(default_factory=dict)
+  diffs: list[str] = field(default_factory=list)
+
+  def paths(self, status: FileStatus) -> list[Path]:
+    return [path for path, file_status in self.statuses.items() if file_status == status]
+
+  def summary(self) -> str:
+    return ", ".join(f"{len(self.paths(status))} {status.value}" for status in FileStatus)
+
+  def print_summary(self, show_diffs: bool = False) -> None:
+    report(f"📄 Files: {self.summary()}")
+    for path in self.paths(FileStatus.UPDATED):
+      report(f"  ✏️  Updated: {path}")
+    for path in self.paths(FileStatus.CONFLICT):
+      report(f"  ⚠️  Conflict, local changes kept: {path}", Level.WARNING)
+    if show_diffs:
+      for diff in self.diffs:
+        report(diff.removesuffix("\n"))
+
+
+def hash_bytes(data: bytes) -> str:
+  return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+  digest = hashlib.sha256()
+  with open(path, "rb") as f:
+    while chunk := f.read(COPY_CHUNK_SIZE):
+      digest.update(chunk)
+  return digest.hexdigest()
+
+
+def hash_context(context: dict) -> str:
+  return hash_bytes(json.dumps(context, sort_keys=True, default=str).encode("utf-8"))
+
+
+def _to_bytes(content: str | bytes) -> bytes:
+  return content if isinstance(content, bytes) else content.encode("utf-8")
+
+
+def is_output_current(target: Path, entry: ManifestEntry | None, template_hash: str, context_hash: str) -> bool:
+  if entry is None or entry.template_hash != template_hash or entry.context_hash != context_hash:
+    return False
+  try:
+    return hash_file(target) == entry.output_hash
+  except OSError:
+    return False
+
+
+class ScaffoldManifest:
+  def __init__(self, root: Path, dry_run: bool = False, writer: OutputWriter | None = None):
+    self.root = Path(os.path.abspath(root))
+    self.dry_run = dry_run
+    self.writer = writer if writer is not None else DirectWriter()
+    self.report = SyncReport()
+    self._lock = threading.Lock()
+    self._entries = self._load()
+
+  def entry_for(self, output_path: Path) -> ManifestEntry | None:
+    return self._entries.get(self._key(output_path))
+
+  def prepare(self, directories: Iterable[Path]) -> None:
+    if not self.dry_run:
+      self.writer.prepare(self._resolve(directory) for directory in directories)
+
+  def is_current(self, output_path: Path, template_hash: str, context_hash: str) -> bool:
+    return is_output_current(self._resolve(output_path), self.entry_for(output_path), template_hash, context_hash)
+
+  def skip(self, output_path: Path) -> FileStatus:
+    with self._lock:
+      self.report.statuses[output_path] = FileStatus.SKIPPED
+    return FileStatus.SKIPPED
+
+  def write(self, output_path: Path, content: str | bytes, template_hash: str, context_hash: str) -> FileStatus:
+    key = self._key(output_path)
+    target = self._resolve(output_path)
+    data = _to_bytes(content)
+    output_hash = hash_bytes(data)
+    try:
+      existing = target.read_bytes()
+    except FileNotFoundError:
+      existing = None
+
+    existing_hash = hash_bytes(existing) if existing is not None else None
+    status = self._record(output_path, key, existing_hash, ManifestEntry(template_hash, context_hash, output_hash))
+    if self.dry_run and status in (FileStatus.UPDATED, FileStatus.CONFLICT):
+      with self._lock:
+        self.report.diffs.append(self._diff(key, existing, data))
+
+    if not self.dry_run and status in (FileStatus.CREATED, FileStatus.UPDATED):
+      self.writer.write(target, data)
+    return status
+
+  def copy(
+    self, output_path: Path, source: Path, source_hash: str, context_hash: str, link: bool = False
+  ) -> FileStatus:
+    key = self._key(output_path)
+    target = self._resolve(output_path)
+    try:
+      existing_hash = hash_file(target)
+    except FileNotFoundError:
+      existing_hash = None
+
+    status = self._record(output_path, key, existing_hash, ManifestEntry(source_hash, context_hash, source_hash))
+    if self.dry_run and status in (FileStatus.UPDATED, FileStatus.CONFLICT):
+      with self._lock:
+        self.report.diffs.append(f"Binary files a/{key} and b/{key} differ\n")
+
+    if not self.dry_run and status in (FileStatus.CREATED, FileStatus.UPDATED):
+      self.writer.copy(target, source, link=link)
+    return status
+
+  def _record(self, output_path: Path, key: str, existing_hash: str | None, new_entry: ManifestEntry) -> FileStatus:
+    with self._lock:
+      entry = self._entries.get(key)
+      if existing_hash is None:
+        status = FileStatus.CREATED
+      elif existing_hash == new_entry.output_hash:
+        status = FileStatus.SKIPPED
+      elif entry is None or existing_hash != entry.output_hash:
+        status = FileStatus.CONFLICT
+      else:
+        status = FileStatus.UPDATED
+
+      self.report.statuses[output_path] = status
+      if status != FileStatus.CONFLICT:
+        self._entries[key] = new_entry
+    return status
+
+  def save(self) -> None:
+    if self.dry_run:
+      return
+    data = {"version": MANIFEST_VERSION, "files": {key: asdict(entry) for key, entry in sorted(self._entries.items())}}
+    self.writer.write(self.root / MANIFEST_FILE, json.dumps(data, indent=2).encode("utf-8"))
+
+  def _load(self) -> dict[str, ManifestEntry]:
+    try:
+      data = json.loads((self.root / MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+      return {}
+    if data.get("version") != MANIFEST_VERSION:
+      return {}
+    return {key: ManifestEntry(**entry) for key, entry in data.get("files", {}).items()}
+
+  def _key(self, output_path: Path) -> str:
+    return self._resolve(output_path).relative_to(self.root).as_posix()
+
+  def _resolve(self, output_path: Path) -> Path:
+    # Callers build output paths from the project path they were given, so relative ones are relative to the cwd.
+    return Path(os.path.abspath(output_path))
+
+  def _diff(self, key: str, existing: bytes, data: bytes) -> str:
+    try:
+      before = existing.decode("utf-8").splitlines(keepends=True)
+      after = data.decode("utf-8").splitlines(keepends=True)
+    except UnicodeDecodeError:
+      return f"Binary files a/{key} and b/{key} differ\n"
+    return "".join(difflib.unified_diff(before, after, fromfile=f"a/{key}", tofile=f"b/{key}"))
+
+
+@contextmanager
+def use_manifest(manifest: ScaffoldManifest | None) -> Iterator[None]:
+  token = active_manifest.set(manifest)
+  try:
+    yield
+  finally:
+    active_manifest.reset(token)
@@ -0,0 +1,134 @@
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from jinja2 import BytecodeCache, Environment
+from jinja2.bccache import Bucket
+
+from core.services.cache_dir import get_cache_dir
+
+CACHE_SUFFIX = ".jbc"
+DEFAULT_MAX_SIZE = 32 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 4096
+
+_enabled = True
+_shared_cache: "PersistentBytecodeCache | None" = None
+_shared_lock = threading.Lock()
+
+
+class PersistentBytecodeCache(BytecodeCache):
+  def __init__(self, directory: Path, max_size: int = DEFAULT_MAX_SIZE, max_entries: int = DEFAULT_MAX_ENTRIES):
+    self.directory = directory
+    self.max_size = max_size
+    self.max_entries = max_entries
+    self._lock = threading.Lock()
+    self._entries: dict[Path, int] | None = None
+
+  def get_bucket(self, environment: Environment, name: str, filename: str | None, source: str) -> Bucket:
+    bucket = Bucket(environment, self._cache_key(environment, name, filename), self.get_source_checksum(source))
+    self.load_bytecode(bucket)
+    return bucket
+
+  def load_bytecode(self, bucket: Bucket) -> None:
+    path = self._path(bucket.key)
+    try:
+      with open(path, "rb") as f:
+        bucket.load_bytecode(f)
+      os.utime(path)
+    except OSError:
+      return
+
+  def dump_bytecode(self, bucket: Bucket) -> None:
+    path = self._path(bucket.key)
+    data = bucket.bytecode_to_string()
+    try:
+      fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+      with os.fdopen(fd, "wb") as f:
+        f.write(data)
+      os.replace(tmp_name, path)
+    except OSError:
+      return
+
+    with self._lock:
+      entries = self._load_entries()
+      entries[path] = len(data)
+      self._evict(entries)
+
+  def clear(self) -> None:
+    with self._lock:
+      for path in self._load_entries():
+        path.unlink(missing_ok=True)
+      self._entries = {}
+
+  def _cache_key(self, environment: Environment, name: str, filename: str | None) -> str:
+    parts = [name, filename or ""]
+    if filename is not None:
+      with contextlib.suppress(OSError):
+        parts.append(str(os.stat(filename).st_mtime_ns))
+    parts.extend(
+      str(option)
+      for option in (
+        environment.block_start_string,
+        environment.variable_start_string,
+        environment.comment_start_string,
+        environment.trim_blocks,
+        environment.lstrip_blocks,
+        environment.keep_trailing_newline,
+        environment.newline_sequence,
+      )
+    )
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+  def _path(self, key: str) -> Path:
+    return self.directory / f"{key}{CACHE_SUFFIX}"
+
+  def _load_entries(self) -> dict[Path, int]:
+    if self._entries is None:
+      self._entries = {}
+      for entry in os.scandir(self.directory):
+        if entry.name.endswith(CACHE_SUFFIX):
+          self._entries[Path(entry.path)] = entry.stat().st_size
+    return self._entries
+
+  def _evict(self, entries: dict[Path, int]) -> None:
+    total_size = sum(entries.values())
+    if total_size <= self.max_size and len(entries) <= self.max_entries:
+      return
+
+    def last_used(path: Path) -> float:
+      try:
+        return path.stat().st_mtime
+      except OSError:
+        return 0.0
+
+    for path in sorted(entries, key=last_used):
+      if total_size <= self.max_size and len(entries) <= self.max_entries:
+        break
+      total_size -= entries.pop(path)
+      path.unlink(missing_ok=True)
+
+
+def set_template_cache_enabled(enabled: bool) -> None:
+  global _enabled
+  _enabled = enabled
+
+
+def is_template_cache_enabled() -> bool:
+  return _enabled
+
+
+def get_bytecode_cache() -> PersistentBytecodeCache | None:
+  global _shared_cache
+  if not _enabled:
+    return None
+
+  with _shared_lock:
+    if _shared_cache is None:
+      try:
+        _shared_cache = PersistentBytecodeCache(get_cache_dir("templates"))
+      except OSError:
+        return None
+    return _shared_cache
@@ -0,0 +1,137 @@
+import hashlib
+import os
+import re
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+from core.services.cache_dir import get_cache_dir, read_json, write_json
+
+PROJECT_NAME = "{{ project_name }}"
+PROJECT_NAME_000 = "000project_name000"
+PROJECT_NAME_PATTERN = re.compile(r"\{\{\s*project_name\s*\}\}")
+BINARY_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg")
+LARGE_FILE_SIZE = 1024 * 1024
+JINJA_MARKERS = ("{{", "{%", "{#")
+INDEX_VERSION = 3
+
+_lock = threading.Lock()
+_indexes: dict[Path, "TemplateIndex"] = {}
+
+
+class JobKind(Enum):
+  RENDER = "rendered"
+  PASSTHROUGH = "passed through"
+  COPY = "copied"
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+  source: str
+  destination: tuple[str, ...]
+  kind: JobKind
+  needs_replace: bool
+
+  def destination_for(self, name_project: str) -> str:
+    return name_project.join(self.destination)
+
+
+class TemplateIndex:
+  def __init__(self, template_path: Path, entries: list[IndexEntry], stats: dict[str, list[int]]):
+    self.template_path = template_path
+    self.entries = entries
+    self.stats = stats
+
+  @classmethod
+  def build(cls, template_path: Path, stats: dict[str, list[int]]) -> "TemplateIndex":
+    entries = [cls._index_file(template_path, relative, size) for relative, (size, _) in stats.items()]
+    return cls(template_path, entries, stats)
+
+  @staticmethod
+  def _index_file(template_path: Path, relative: str, size: int) -> IndexEntry:
+    destination = tuple(PROJECT_NAME_PATTERN.split(relative))
+    if relative.endswith(BINARY_SUFFIXES):
+      return IndexEntry(relative, destination, JobKind.COPY, False)
+    if size >= LARGE_FILE_SIZE and _copies_verbatim(template_path / relative):
+      # Large files are only copied verbatim when rendering could not change them.
+      return IndexEntry(relative, destination, JobKind.COPY, False)
+
+    try:
+      source = (template_path / relative).read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+      return IndexEntry(relative, destination, JobKind.COPY, False)
+
+    kind = JobKind.RENDER if any(marker in source for marker in JINJA_MARKERS) else JobKind.PASSTHROUGH
+    return IndexEntry(relative, destination, kind, PROJECT_NAME in source or PROJECT_NAME_000 in source)
+
+
+def _copies_verbatim(path: Path) -> bool:
+  # Rendering also normalizes newlines and drops one trailing newline, so those files must go through the renderer.
+  data = path.read_bytes()
+  markers = (*JINJA_MARKERS, PROJECT_NAME, PROJECT_NAME_000)
+  if any(marker.encode("utf-8") in data for marker in markers):
+    return False
+  return b"\r" not in data and not data.endswith(b"\n")
+
+
+def scan_tree(template_path: Path) -> dict[str, list[int]]:
+  stats = {}
+  pending = [""]
+  while pending:
+    prefix = pending.pop()
+    with os.scandir(template_path / prefix) as items:
+      for item in items:
+        relative = prefix + item.name
+        if item.is_dir(follow_symlinks=False):
+          pending.append(relative + "/")
+        elif item.is_file():
+          stat = item.stat()
+          stats[relative] = [stat.st_size, stat.st_mtime_ns]
+  return dict(sorted(stats.items()))
+
+
+def get_template_index(template_path: Path, persist: bool = True) -> TemplateIndex:
+  stats = scan_tree(template_path)
+  with _lock:
+    index = _indexes.get(template_path)
+    if index is None or index.stats != stats:
+      index = _read_index(template_path, stats) if persist else None
+      if index is None:
+        index = TemplateIndex.build(template_path, stats)
+        if persist:
+          _write_index(index)
+      _indexes[template_path] = index
+  return index
+
+
+def _index_path(template_path: Path) -> Path:
+  digest = hashlib.sha256(str(template_path.resolve()).encode("utf-8")).hexdigest()[:16]
+  return get_cache_dir("indexes") / f"{digest}.json"
+
+
+def _read_index(template_path: Path, stats: dict[str, list[int]]) -> TemplateIndex | None:
+  data = read_json(_index_path(template_path))
+  if not isinstance(data, dict):
+    return None
+  if data.get("version") != INDEX_VERSION or data.get("template_path") != str(template_path):
+    return None
+  if data.get("stats") != stats:
+    return None
+  entries = [
+    IndexEntry(source, tuple(destination), JobKind(kind), needs_replace)
+    for source, destination, kind, needs_replace in data["entries"]
+  ]
+  return TemplateIndex(template_path, entries, stats)
+
+
+def _write_index(index: TemplateIndex) -> None:
+  data = {
+    "version": INDEX_VERSION,
+    "template_path": str(index.template_path),
+    "stats": index.stats,
+    "entries": [
+      [entry.source, list(entry.destination), entry.kind.value, entry.needs_replace] for entry in index.entries
+    ],
+  }
+  write_json(_index_path(index.template_path), data)
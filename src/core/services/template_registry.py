@@ -0,0 +1,82 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+from core.interfaces.init_command_base import TemplateInfo
+from core.services.cache_dir import SignatureCache, directory_signature
+
+PLUGINS = "plugins"
+PROJECT_ROOT = "project_root"
+METADATA_FILE = "plugin.json"
+CACHE_FILE = "templates.json"
+
+
+class TemplateRegistry:
+  PLUGINS_DIR = Path(__file__).parent.parent.parent / PLUGINS
+
+  def __init__(self, plugins_dir: Path | None = None, cache_path: Path | None = None):
+    self.plugins_dir = plugins_dir if plugins_dir is not None else self.PLUGINS_DIR
+    self.cache = SignatureCache(CACHE_FILE, cache_path)
+    self._templates: dict[str, TemplateInfo] | None = None
+
+  def templates(self) -> list[TemplateInfo]:
+    return list(self._load().values())
+
+  def names(self) -> list[str]:
+    return list(self._load())
+
+  def get(self, template_id: str) -> TemplateInfo | None:
+    return self._load().get(template_id)
+
+  def _load(self) -> dict[str, TemplateInfo]:
+    if self._templates is None:
+      self._templates = {template.template_id: template for template in self._load_templates()}
+    return self._templates
+
+  def _load_templates(self) -> list[TemplateInfo]:
+    signature = self._signature()
+    cached = self.cache.load(self.plugins_dir, signature)
+    if cached is not None:
+      return [self._template_info(entry) for entry in cached]
+
+    templates = [template for name in sorted(signature) if (template := self._discover(name)) is not None]
+    self.cache.store(self.plugins_dir, signature, [asdict(template) for template in templates])
+    return templates
+
+  def _signature(self) -> dict[str, list[int]]:
+    # The project_root mtime only tracks top-level changes, which is enough to keep file counts indicative.
+    signature = directory_signature(self.plugins_dir, (METADATA_FILE, PROJECT_ROOT))
+    return {name: mtimes for name, mtimes in signature.items() if mtimes[0]}
+
+  def _discover(self, name: str) -> TemplateInfo | None:
+    metadata = json.loads((self.plugins_dir / name / METADATA_FILE).read_text(encoding="utf-8"))
+    template = metadata.get("template")
+    if template is None:
+      return None
+    bundles = list(metadata.get("bundles", {}))
+    return self._template_info({
+      "language": template["language"],
+      "name": template["name"],
+      "description": template.get("description", ""),
+      "databases": template.get("databases", []),
+      "supports_docker": template.get("supports_docker", "docker" in bundles),
+      "required_dependencies": template.get("required_dependencies", []),
+      "github_url": template.get("github_url", ""),
+      "template_id": template["id"],
+      "plugin": name,
+      "bundles": bundles,
+      "file_count": self._count_files(self.plugins_dir / name / PROJECT_ROOT),
+    })
+
+  def _count_files(self, template_path: Path) -> int:
+    if not template_path.is_dir():
+      return 0
+    from core.services.template_index import scan_tree
+
+    return len(scan_tree(template_path))
+
+  def _template_info(self, entry: dict) -> TemplateInfo:
+    return TemplateInfo(**{
+      **entry,
+      "required_dependencies": [tuple(dependency) for dependency in entry["required_dependencies"]],
+    })
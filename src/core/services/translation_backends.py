@@ -0,0 +1,56 @@
+import json
+import unicodedata
+from pathlib import Path
+
+from core.interfaces.translation_backend import TranslationBackend
+from core.services.reporter import Level, report
+
+OFFLINE_DICTIONARY = Path(__file__).parent.parent / "data" / "offline_translations.json"
+
+
+class GoogleTranslationBackend(TranslationBackend):
+  @property
+  def name(self) -> str:
+    return "google"
+
+  def translate_many(self, texts: list[str]) -> dict[str, str]:
+    if not texts:
+      return {}
+    import asyncio
+
+    return asyncio.run(self._translate_many(texts))
+
+  async def _translate_many(self, texts: list[str]) -> dict[str, str]:
+    from googletrans import Translator
+
+    async with Translator() as translator:
+      try:
+        results = await translator.translate(texts, dest="en", src="auto")
+        return {text: result.text for text, result in zip(texts, results, strict=True)}
+      except Exception as e:
+        report(f"Error trying to translate the text: {e}", Level.WARNING)
+        return {}
+
+
+class OfflineDictionaryBackend(TranslationBackend):
+  def __init__(self, dictionary_path: Path = OFFLINE_DICTIONARY):
+    languages = json.loads(dictionary_path.read_text(encoding="utf-8"))
+    self.words = {self._fold(word): word_en for entries in languages.values() for word, word_en in entries.items()}
+
+  @property
+  def name(self) -> str:
+    return "offline"
+
+  def translate_many(self, texts: list[str]) -> dict[str, str]:
+    return {text: self.words[self._fold(text)] for text in texts if self._fold(text) in self.words}
+
+  def _fold(self, text: str) -> str:
+    normalized = unicodedata.normalize("NFKD", text.strip().lower())
+    return "".join(char for char in normalized if not unicodedata.combining(char))
+
+
+TRANSLATION_BACKENDS: dict[str, type[TranslationBackend]] = {
+  "google": GoogleTranslationBackend,
+  "offline": OfflineDictionaryBackend,
+}
+DEFAULT_TRANSLATOR = "google"
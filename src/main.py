@@ -1,21 +1,55 @@
-from argparse import ArgumentParser
+import sys
 
-from core.cli import ModuleGenerator
-from core.commands.init import InitCommand
-from core.commands.list_templates import ListTemplatesCommand
-from core.inputs.cli_user_input import CLIUserInput
+from core.services.profiler import enable_profiling, get_profiler, phase
+from core.services.reporter import REPORTERS, Level, get_reporter, report, set_reporter
+
+PROFILE_STARTUP = "--profile-startup"
+SUBCOMMANDS = ("init", "list-templates", "generate", "serve")
+
+
+def _global_args(argv: list[str]) -> list[str]:
+  # The flag belongs to the top-level parser, so only arguments before the subcommand count.
+  for index, arg in enumerate(argv):
+    if arg in SUBCOMMANDS:
+      return argv[:index]
+  return argv
+
+
+if PROFILE_STARTUP in _global_args(sys.argv[1:]):
+  enable_profiling()
+
+from argparse import ArgumentParser  # noqa: E402
+
+from core.commands.generate import GenerateCommand  # noqa: E402
+from core.commands.init import InitCommand  # noqa: E402
+from core.commands.list_templates import ListTemplatesCommand  # noqa: E402
+from core.commands.serve import ServeCommand  # noqa: E402
 
 
 def main():
-  parser = ArgumentParser(description="CLI Tool for project scaffolding and module generation")
-  subparsers = parser.add_subparsers(dest="command", required=True)
-  init_parser = subparsers.add_parser("init", help="Initialize a new project from template")
-  subparsers.add_parser("list-templates", help="List all available project templates")
-  subparsers.add_parser("generate", help="Generate module structure")
+  with phase("parse_args"):
+    parser = ArgumentParser(description="CLI Tool for project scaffolding and module generation")
+    parser.add_argument(
+      PROFILE_STARTUP, action="store_true", help="Report import times and per-phase wall clock on exit"
+    )
+    parser.add_argument(
+      "--reporter",
+      choices=list(REPORTERS),
+      default="console",
+      help="Status output: console, quiet (warnings and errors), progress (bar) or json (JSON lines with timings)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    init_parser = subparsers.add_parser("init", help="Initialize a new project from template")
+    subparsers.add_parser("list-templates", help="List all available project templates")
+    generate_parser = subparsers.add_parser("generate", help="Generate module structure")
+    serve_parser = subparsers.add_parser("serve", help="Run a warm generator daemon on a Unix socket")
 
-  init_cmd = InitCommand(init_parser)
+    init_cmd = InitCommand(init_parser)
+    generate_cmd = GenerateCommand(generate_parser)
+    serve_cmd = ServeCommand(serve_parser)
 
-  args = parser.parse_args()
+    args = parser.parse_args()
+    set_reporter(REPORTERS[args.reporter]())
 
   try:
     if args.command == "init":
@@ -24,13 +58,17 @@ def main():
       list_templates_cmd = ListTemplatesCommand()
       list_templates_cmd.execute()
     elif args.command == "generate":
-      user_input = CLIUserInput()
-      generator = ModuleGenerator(user_input)
-      generator.run()
-      print("\n✅ Module structure generated successfully!")
+      generate_cmd.execute(args)
+    elif args.command == "serve":
+      serve_cmd.execute(args)
   except Exception as e:
-    print(f"\nError: {str(e)}")
+    report(f"\nError: {str(e)}", Level.ERROR)
     exit(1)
+  finally:
+    get_reporter().close()
+    profiler = get_profiler()
+    if profiler is not None:
+      print(profiler.report(), file=sys.stderr)
 
 
 if __name__ == "__main__":
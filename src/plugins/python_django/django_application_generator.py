@@ -1,26 +1,30 @@
 from pathlib import Path
 
 from core.generator.base_generator import BaseGenerator
-from core.interfaces.base_class import ApplicationOption
+from core.generator.generation_plan import GenerationPlan
+from core.interfaces.base_class import ApplicationOption, LayerType
+from core.services.reporter import Level, report
 
 
 class DjangoApplicationGenerator(BaseGenerator):
+  layer = LayerType.APPLICATION
+
   def __init__(self):
     template_dir = str(Path(__file__).parent / "templates")
     super().__init__(template_dir)
 
-  def generate(self, context: dict):
+  def plan(self, context: dict, plan: GenerationPlan):
     options = context.get("application_options", [])
-    print(f"Generating Django application layer with options: {options}")
+    report(f"Planning Django application layer with options: {options}", Level.DETAIL)
 
     if ApplicationOption.COMMANDS in options:
-      self._generate_commands(context)
+      self._plan_commands(context, plan)
 
     if ApplicationOption.QUERIES in options:
-      self._generate_value_objects(context)
+      self._plan_queries(context, plan)
 
-  def _generate_commands(self, context: dict):
+  def _plan_commands(self, context: dict, plan: GenerationPlan):
     pass
 
-  def _generate_queries(self, context: dict):
+  def _plan_queries(self, context: dict, plan: GenerationPlan):
     pass
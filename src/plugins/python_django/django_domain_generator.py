@@ -1,30 +1,47 @@
 from pathlib import Path
 
 from core.generator.base_generator import BaseGenerator
-from core.interfaces.base_class import DomainOption
+from core.generator.generation_plan import FileNode, GenerationPlan
+from core.interfaces.base_class import DomainOption, LayerType
+from core.services.reporter import Level, report
 
 
 class DjangoDomainGenerator(BaseGenerator):
+  layer = LayerType.DOMAIN
+
   def __init__(self):
     template_dir = str(Path(__file__).parent / "templates")
     super().__init__(template_dir)
 
-  def generate(self, context: dict):
+  def plan(self, context: dict, plan: GenerationPlan):
     app_name = context["app_name"].lower()
     module_name = context["module_name"].lower()
     module_name_plural = context["module_name_plural"].lower()
+    attributes = context.get("entity_attributes", [])
 
     options = context.get("domain_options", [])
-    print(f"Generating Django domain layer with options: {options}")
-
-    if DomainOption.ENTITIES in options:
-      self._generate_models(app_name, module_name_plural, module_name, context.get("entity_attributes", []))
+    report(f"Planning Django domain layer with options: {options}", Level.DETAIL)
 
+    depends_on = ()
     if DomainOption.VALUE_OBJECTS in options:
-      self._generate_value_objects(app_name, module_name, context.get("entity_attributes", []))
+      value_objects = self._plan_value_objects(plan, app_name, module_name_plural, module_name, attributes)
+      depends_on = (value_objects.output_path,)
 
-  def _generate_models(self, app_name: str, module_name_plural: str, module_name: str, attributes: list[dict]):
-    model_content = self.render_template(
+    if DomainOption.ENTITIES in options:
+      self._plan_models(plan, app_name, module_name_plural, module_name, attributes, depends_on)
+
+  def _plan_models(
+    self,
+    plan: GenerationPlan,
+    app_name: str,
+    module_name_plural: str,
+    module_name: str,
+    attributes: list[dict],
+    depends_on: tuple[Path, ...] = (),
+  ) -> FileNode:
+    output_path = Path(f"{app_name}/{module_name_plural}/domain/{module_name}.py")
+    return self.add_file(
+      plan,
       "domain/entity.py.j2",
       {
         "app_name": app_name,
@@ -32,13 +49,16 @@ class DjangoDomainGenerator(BaseGenerator):
         "module_name_plural": module_name_plural,
         "attributes": attributes,
       },
+      output_path,
+      depends_on,
     )
 
-    output_path = Path(f"{app_name}/{module_name_plural}/domain/{module_name}.py")
-    self.generate_file(output_path, model_content)
-
-  def _generate_value_objects(self, app_name: str, module_name_plural: str, module_name: str, attributes: list[dict]):
-    model_content = self.render_template(
+  def _plan_value_objects(
+    self, plan: GenerationPlan, app_name: str, module_name_plural: str, module_name: str, attributes: list[dict]
+  ) -> FileNode:
+    output_path = Path(f"{app_name}/{module_name_plural}/domain/value_objects/{module_name}.py")
+    return self.add_file(
+      plan,
       "domain/entity.py.j2",
       {
         "app_name": app_name,
@@ -46,7 +66,5 @@ class DjangoDomainGenerator(BaseGenerator):
         "module_name_plural": module_name_plural,
         "attributes": attributes,
       },
+      output_path,
     )
-
-    output_path = Path(f"{app_name}/{module_name_plural}/domain/value_objects/{module_name}.py")
-    self.generate_file(output_path, model_content)
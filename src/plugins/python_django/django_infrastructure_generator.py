@@ -1,26 +1,30 @@
 from pathlib import Path
 
 from core.generator.base_generator import BaseGenerator
-from core.interfaces.base_class import InfrastructureOption
+from core.generator.generation_plan import GenerationPlan
+from core.interfaces.base_class import InfrastructureOption, LayerType
+from core.services.reporter import Level, report
 
 
 class DjangoInfrastructureGenerator(BaseGenerator):
+  layer = LayerType.INFRASTRUCTURE
+
   def __init__(self):
     template_dir = str(Path(__file__).parent / "templates")
     super().__init__(template_dir)
 
-  def generate(self, context: dict):
+  def plan(self, context: dict, plan: GenerationPlan):
     options = context.get("infrastructure_options", [])
-    print(f"Generating Django infrastructure layer with options: {options}")
+    report(f"Planning Django infrastructure layer with options: {options}", Level.DETAIL)
 
     if InfrastructureOption.PERSISTENCE in options:
-      self._generate_persistence(context)
+      self._plan_persistence(context, plan)
 
     if InfrastructureOption.API in options:
-      self._generate_api(context)
+      self._plan_api(context, plan)
 
-  def _generate_persistence(self, context: dict):
+  def _plan_persistence(self, context: dict, plan: GenerationPlan):
     pass
 
-  def _generate_api(self, context: dict):
+  def _plan_api(self, context: dict, plan: GenerationPlan):
     pass
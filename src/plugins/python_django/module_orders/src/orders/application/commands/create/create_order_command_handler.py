@@ -5,10 +5,10 @@
 
 from src.orders.application.commands.create.create_order_command import CreateOrderCommand
 from src.orders.application.commands.create.order_creator_service import OrderCreatorService
-from src.shared.domain.commands.command_handler import CommandHandler
+from src.shared.domain.commands.batch_command_handler import BatchCommandHandler
 
 
-class CreateOrderCommandHandler(CommandHandler):
+class CreateOrderCommandHandler(BatchCommandHandler):
   def __init__(self, service: OrderCreatorService):
     self.service = service
 
@@ -16,18 +16,24 @@ class CreateOrderCommandHandler(CommandHandler):
     return CreateOrderCommand
 
   def handle(self, command: CreateOrderCommand) -> None:
-    self.service.run(
-      order_id=command.order_id,
-      order_number=command.order_number,
-      customer_id=command.customer_id,
-      customer_name=command.customer_name,
-      seller_id=command.seller_id,
-      seller_name=command.seller_name,
-      ip_address=command.ip_address,
-      source=command.source,
-      currency=command.currency,
-      items=command.items,
-    )
+    self.service.run(**self._order_data(command))
+
+  def handle_many(self, commands: list[CreateOrderCommand]) -> None:
+    self.service.run_many([self._order_data(command) for command in commands])
+
+  def _order_data(self, command: CreateOrderCommand) -> dict:
+    return {
+      "order_id": command.order_id,
+      "order_number": command.order_number,
+      "customer_id": command.customer_id,
+      "customer_name": command.customer_name,
+      "seller_id": command.seller_id,
+      "seller_name": command.seller_name,
+      "ip_address": command.ip_address,
+      "source": command.source,
+      "currency": command.currency,
+      "items": command.items,
+    }
 
 
 # class CreateOrderCommandHandler(CommandHandler):
@@ -1,3 +1,7 @@
+from typing import Any
+
+from django.db import transaction
+
 from src.orders.domain.entities.order import Order, OrderSource
 from src.orders.domain.order_repository import IOrderRepository
 from src.orders.domain.value_objects.order_id import OrderId
@@ -42,3 +46,10 @@ class OrderCreatorService:
     )
     self.repository.save(order)
     self.event_bus.publish(order.pull_domain_events())
+
+  def run_many(self, orders_data: list[dict[str, Any]]):
+    orders = [Order.create(**order_data) for order_data in orders_data]
+    self.repository.save_many(orders)
+    events = [event for order in orders for event in order.pull_domain_events()]
+    # save_many may only be a savepoint inside an outer transaction, so events wait for the real commit.
+    transaction.on_commit(lambda: self.event_bus.publish(events))
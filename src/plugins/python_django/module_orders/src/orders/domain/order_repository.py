@@ -17,6 +17,10 @@ class IOrderRepository(ABC):
   def save(self, order: Order):
     pass
 
+  def save_many(self, orders: list[Order]):
+    for order in orders:
+      self.save(order)
+
   @abstractmethod
   def delete(self, order_id: OrderId):
     pass
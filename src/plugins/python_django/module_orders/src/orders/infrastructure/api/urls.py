@@ -1,5 +1,6 @@
 from django.urls import path
 
+# from src.orders.infrastructure.api.views.bulk_create_order_view import BulkCreateOrderView
 # from src.orders.infrastructure.api.views.create_order_view import CreateOrderView
 # from src.orders.infrastructure.api.views.delete_order_view import DeleteOrderView
 from src.orders.infrastructure.api.views.order_list_view import OrderListView
@@ -10,6 +11,7 @@ from src.orders.infrastructure.api.views.order_list_view import OrderListView
 urlpatterns = [
   path("orders", OrderListView.as_view({"get": "list"}), name="orders-list"),
   # path("orders/create", CreateOrderView.as_view({"post": "create"}), name="orders-create"),
+  # path("orders/bulk", BulkCreateOrderView.as_view({"post": "bulk_create"}), name="orders-bulk-create"),
   # path("orders/<uuid:pk>", ReadOrderView.as_view({"get": "retrieve"}), name="orders-read"),
   # path("orders/update/<uuid:pk>", UpdateOrderView.as_view({"put": "update"}), name="orders-update"),
   # path("orders/update/<uuid:pk>", UpdateOrderView.as_view({"patch": "patch"}), name="orders-patch"),
@@ -0,0 +1,18 @@
+from rest_framework.permissions import AllowAny
+from src.orders.application.commands.create.create_order_command import CreateOrderCommand
+from src.orders.application.commands.create.create_order_command_handler import CreateOrderCommandHandler
+from src.orders.application.commands.create.order_creator_service import OrderCreatorService
+from src.orders.infrastructure.api.serializers.create_order_request_serializer import CreateOrderRequestSerializer
+from src.orders.infrastructure.cache.orders_query_cache import orders_query_cache_invalidation_middleware
+from src.orders.infrastructure.persistences.django_order_repository import DjangoOrderRepository
+from src.shared.infrastructure.api.views.bulk_create_api_view import BulkCreateAPIView
+
+
+class BulkCreateOrderView(BulkCreateAPIView):
+  permission_classes = [AllowAny]
+  repositories = [("repository", DjangoOrderRepository)]
+  request_serializer_class = CreateOrderRequestSerializer
+  application_command = CreateOrderCommand
+  application_command_handler = CreateOrderCommandHandler
+  application_service = OrderCreatorService
+  command_bus_middlewares = (orders_query_cache_invalidation_middleware,)
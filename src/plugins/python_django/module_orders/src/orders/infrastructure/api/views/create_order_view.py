@@ -3,6 +3,7 @@ from rest_framework.permissions import AllowAny
 from src.orders.application.commands.create.create_order_command import CreateOrderCommand
 from src.orders.application.commands.create.create_order_command_handler import CreateOrderCommandHandler
 from src.orders.application.commands.create.order_creator_service import OrderCreatorService
+from src.orders.infrastructure.cache.orders_query_cache import orders_query_cache_invalidation_middleware
 from src.orders.infrastructure.persistences.django_order_repository import DjangoOrderRepository
 from src.shared.infrastructure.api.views.create_api_view import CreateAPIView
 
@@ -14,3 +15,4 @@ class CreateOrderView(CreateAPIView):
   application_command_handler = CreateOrderCommandHandler
   application_service = OrderCreatorService
   infrastructure_event_bus = None
+  command_bus_middlewares = (orders_query_cache_invalidation_middleware,)
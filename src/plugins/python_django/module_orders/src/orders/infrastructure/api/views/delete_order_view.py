@@ -3,6 +3,7 @@ from rest_framework.permissions import AllowAny
 from src.orders.application.commands.delete.delete_order_command import DeleteOrderCommand
 from src.orders.application.commands.delete.delete_order_command_handler import DeleteOrderCommandHandler
 from src.orders.application.commands.delete.order_deleter_service import OrderDeleterService
+from src.orders.infrastructure.cache.orders_query_cache import orders_query_cache_invalidation_middleware
 from src.orders.infrastructure.persistences.django_order_repository import DjangoOrderRepository
 from src.shared.infrastructure.api.views.delete_api_view import DestroyAPIView
 
@@ -14,3 +15,4 @@ class DeleteOrderView(DestroyAPIView):
   application_command_handler = DeleteOrderCommandHandler
   application_service = OrderDeleterService
   infrastructure_event_bus = None
+  command_bus_middlewares = (orders_query_cache_invalidation_middleware,)
@@ -3,6 +3,7 @@ from rest_framework.permissions import AllowAny
 from src.orders.application.queries.read.read_order_query import ReadOrderQuery
 from src.orders.application.queries.read.read_order_query_handlers import ReadOrderQueryHandler
 from src.orders.infrastructure.api.serializers.order_response_serializer import OrderResponseSerializer
+from src.orders.infrastructure.cache.orders_query_cache import orders_query_cache_middleware
 from src.orders.infrastructure.persistences.django_order_repository import DjangoOrderRepository
 from src.shared.infrastructure.api.views.retrieve_api_view import RetrieveAPIView
 
@@ -13,3 +14,4 @@ class ReadOrderView(RetrieveAPIView):
   application_list_query = ReadOrderQuery
   application_list_query_handler = ReadOrderQueryHandler
   response_serializer_class = OrderResponseSerializer
+  query_bus_middlewares = (orders_query_cache_middleware,)
@@ -3,6 +3,7 @@ from rest_framework.permissions import AllowAny
 from src.orders.application.commands.update.order_updater_service import OrderUpdaterService
 from src.orders.application.commands.update.update_order_command import UpdateOrderCommand
 from src.orders.application.commands.update.update_order_command_handler import UpdateOrderCommandHandler
+from src.orders.infrastructure.cache.orders_query_cache import orders_query_cache_invalidation_middleware
 from src.orders.infrastructure.persistences.django_order_repository import DjangoOrderRepository
 from src.shared.infrastructure.api.views.update_api_view import UpdateAPIView
 
@@ -14,3 +15,4 @@ class UpdateOrderView(UpdateAPIView):
   application_command_handler = UpdateOrderCommandHandler
   application_service = OrderUpdaterService
   infrastructure_event_bus = None
+  command_bus_middlewares = (orders_query_cache_invalidation_middleware,)
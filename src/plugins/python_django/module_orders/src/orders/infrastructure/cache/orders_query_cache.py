@@ -0,0 +1,17 @@
+from src.shared.infrastructure.middlewares.query_cache_invalidation_middleware import QueryCacheInvalidationMiddleware
+from src.shared.infrastructure.middlewares.query_cache_middleware import QueryCacheMiddleware
+from src.shared.infrastructure.query_bus.django_query_cache_backend import DjangoQueryCacheBackend
+from src.shared.infrastructure.query_bus.query_cache import QueryCache
+
+ORDERS_CACHE_TAG = "orders"
+ORDERS_CACHE_TTL_SECONDS = 30
+
+# The Django cache is shared by every worker when CACHES points at Redis or memcached, so invalidations reach them all.
+orders_query_cache = QueryCache(DjangoQueryCacheBackend(key_prefix="orders-query-cache"), ttl=ORDERS_CACHE_TTL_SECONDS)
+
+orders_query_cache_middleware = QueryCacheMiddleware(orders_query_cache, tags=(ORDERS_CACHE_TAG,))
+
+# Every orders command view (create, bulk create, update and delete) runs this on its command bus.
+orders_query_cache_invalidation_middleware = QueryCacheInvalidationMiddleware(
+  orders_query_cache, tags=(ORDERS_CACHE_TAG,)
+)
@@ -1,6 +1,8 @@
 from decimal import Decimal
 
+from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 
 from src.orders.domain.entities.order import Order, OrderSource, OrderStatus
 from src.orders.domain.entities.order_item import OrderItem
@@ -21,6 +23,7 @@ from src.orders.domain.value_objects.seller_id import SellerId
 from src.orders.domain.value_objects.seller_name import SellerName
 from src.orders.infrastructure.persistences.models.order import OrderDAO
 from src.orders.infrastructure.persistences.models.order_item import OrderItemDAO
+from src.shared.infrastructure.persistences.base_models import SYSTEM_USER_ID
 
 
 class DjangoOrderRepository(IOrderRepository):
@@ -47,54 +50,82 @@ class DjangoOrderRepository(IOrderRepository):
 
   @transaction.atomic
   def save(self, order: Order) -> None:
-    order_db = self._get_or_create_order_dao(order)
-    self._save_order_items(order_db, order.line_items)
+    fields = self._order_fields(order)
+    order_db, _ = OrderDAO.objects.update_or_create(
+      id=order.id.value, defaults=fields, create_defaults=self._create_defaults(fields)
+    )
+    self._save_order_items(order_db, order.items)
     self._save_order_payments(order_db, order.payments)
 
-  def _get_or_create_order_dao(self, order: Order) -> OrderDAO:
-    defaults = {
+  @transaction.atomic
+  def save_many(self, orders: list[Order]) -> None:
+    order_daos = [OrderDAO(id=order.id.value, **self._create_defaults(self._order_fields(order))) for order in orders]
+    OrderDAO.objects.bulk_create(order_daos)
+    order_item_daos = [
+      OrderItemDAO(id=item.order_item_id.value, order=order_dao, **self._create_defaults(self._order_item_fields(item)))
+      for order, order_dao in zip(orders, order_daos, strict=True)
+      for item in order.items
+    ]
+    OrderItemDAO.objects.bulk_create(order_item_daos)
+    for order, order_dao in zip(orders, order_daos, strict=True):
+      self._save_order_payments(order_dao, order.payments)
+
+  # save() and save_many() share these mappings so single and bulk writes persist the same columns.
+  def _order_fields(self, order: Order) -> dict:
+    order_date = order.order_date
+    if settings.USE_TZ and timezone.is_naive(order_date):
+      # The domain stamps orders with naive local times; storing them aware avoids Django's naive datetime warning.
+      order_date = timezone.make_aware(order_date)
+    return {
       "order_number": order.order_number.value,
-      "order_date": order.order_date.value,
+      "order_date": order_date,
       "customer_id": order.customer_id.value,
+      "customer_name": order.customer_name.value if order.customer_name else None,
       "seller_id": order.seller_id.value,
-      "total_amount": float(order.total_amount.amount),
-      "discount_amount": float(order.total_discount.amount),
-      "tax_amount": float(order.total_tax.amount),
-      "paid_amount": float(order.paid_amount.amount),
+      "seller_name": order.seller_name.value if order.seller_name else None,
+      "ip_address": order.ip_address,
+      "source": order.source.value,
       "status": order.status.value,
+      "total_items": order.total_items,
+      "currency": order.currency,
+      "amount": order.subtotal.value,
+      "discount": order.total_discount.value,
+      "tax_amount": order.total_tax.value,
+      "total_amount": order.total_amount.value,
+      "paid_amount": order.paid_amount.value,
+      "balance_due": order.balance_due.value,
       "notes": order.notes,
+      "updated_by": SYSTEM_USER_ID,
     }
 
-    if order.id:
-      order_db, created = OrderDAO.objects.update_or_create(id=order.id.value, defaults=defaults)
-    else:
-      order_db = OrderDAO.objects.create(**defaults)
+  def _order_item_fields(self, item: OrderItem) -> dict:
+    return {
+      "product_id": item.product_id.value,
+      "product_name": item.product_name.value,
+      "product_sku": item.product_sku,
+      "product_image_url": item.product_image_url,
+      "quantity": item.quantity.value,
+      "unit_price": item.unit_price.value,
+      "subtotal": item.subtotal.value,
+      "discount_amount": item.discount_amount,
+      "tax_amount": item.tax_amount,
+      "total": item.total.value,
+      "notes": item.notes,
+      "updated_by": SYSTEM_USER_ID,
+    }
 
-    return order_db
+  def _create_defaults(self, fields: dict) -> dict:
+    return {**fields, "created_by": SYSTEM_USER_ID}
 
   def _save_order_items(self, order_db: OrderDAO, items: list[OrderItem]) -> None:
-    existing_item_ids = [item.id.value for item in items if item.id]
-    OrderItemDAO.objects.filter(order=order_db).exclude(id__in=existing_item_ids).delete()
+    item_ids = [item.order_item_id.value for item in items]
+    OrderItemDAO.objects.filter(order=order_db).exclude(id__in=item_ids).delete()
 
     for item in items:
-      defaults = {
-        "product_id": item.product_id.value,
-        "product_name": item.product_name.value,
-        "product_sku": item.product_sku,
-        "product_image_url": item.product_image_url,
-        "quantity": item.quantity.value,
-        "unit_price": float(item.unit_price.amount),
-        "subtotal": float(item.subtotal.amount),
-        "discount_amount": float(item.discount_amount),
-        "tax_amount": float(item.tax_amount),
-        "total": float(item.total.amount),
-        "notes": item.notes,
-      }
-
-      if item.id:
-        OrderItemDAO.objects.update_or_create(id=item.id.value, order=order_db, defaults=defaults)
-      else:
-        OrderItemDAO.objects.create(order=order_db, **defaults)
+      fields = self._order_item_fields(item)
+      OrderItemDAO.objects.update_or_create(
+        id=item.order_item_id.value, order=order_db, defaults=fields, create_defaults=self._create_defaults(fields)
+      )
 
   def _save_order_payments(self, order_db: OrderDAO, payments: list[Payment]) -> None:
     """Guarda los pagos de la orden"""
@@ -0,0 +1,73 @@
+import uuid
+from unittest.mock import Mock
+
+import pytest
+from src.orders.application.commands.create.create_order_command import CreateOrderCommand
+from src.orders.application.commands.create.create_order_command_handler import CreateOrderCommandHandler
+from src.orders.application.commands.create.order_creator_service import OrderCreatorService
+from src.orders.domain.entities.order import OrderSource
+from src.orders.domain.value_objects.customer_id import CustomerId
+from src.orders.domain.value_objects.customer_name import CustomerName
+from src.orders.domain.value_objects.order_id import OrderId
+from src.orders.domain.value_objects.order_number import OrderNumber
+from src.orders.domain.value_objects.seller_id import SellerId
+from src.orders.domain.value_objects.seller_name import SellerName
+from src.shared.domain.commands.batch_command_handler import BatchCommandHandler
+
+
+@pytest.fixture
+def mock_order_creator_service():
+  return Mock(spec=OrderCreatorService)
+
+
+def build_command(order_number: str) -> CreateOrderCommand:
+  return CreateOrderCommand(
+    order_id=OrderId(str(uuid.uuid4())),
+    order_number=OrderNumber(order_number),
+    customer_id=CustomerId(str(uuid.uuid4())),
+    customer_name=CustomerName("Test Customer"),
+    seller_id=SellerId(str(uuid.uuid4())),
+    seller_name=SellerName("Test Seller"),
+    ip_address="127.0.0.1",
+    source=OrderSource.WEB,
+    currency="USD",
+    items=[],
+  )
+
+
+def test_create_order_command_handler_is_batch_aware():
+  handler = CreateOrderCommandHandler(service=Mock())
+  assert isinstance(handler, BatchCommandHandler)
+  assert handler.subscribed_to() == CreateOrderCommand
+
+
+def test_create_order_command_handler_handle(mock_order_creator_service):
+  command = build_command("ORD-001")
+  handler = CreateOrderCommandHandler(service=mock_order_creator_service)
+
+  handler.handle(command)
+
+  mock_order_creator_service.run.assert_called_once_with(
+    order_id=command.order_id,
+    order_number=command.order_number,
+    customer_id=command.customer_id,
+    customer_name=command.customer_name,
+    seller_id=command.seller_id,
+    seller_name=command.seller_name,
+    ip_address=command.ip_address,
+    source=command.source,
+    currency=command.currency,
+    items=command.items,
+  )
+
+
+def test_create_order_command_handler_handle_many(mock_order_creator_service):
+  commands = [build_command("ORD-001"), build_command("ORD-002")]
+  handler = CreateOrderCommandHandler(service=mock_order_creator_service)
+
+  handler.handle_many(commands)
+
+  mock_order_creator_service.run_many.assert_called_once()
+  [orders_data] = mock_order_creator_service.run_many.call_args.args
+  assert [order_data["order_number"] for order_data in orders_data] == [command.order_number for command in commands]
+  mock_order_creator_service.run.assert_not_called()
@@ -4,6 +4,7 @@ from decimal import Decimal
 from unittest.mock import Mock, patch
 
 import pytest
+from django.db import transaction
 
 from src.orders.application.commands.create.order_creator_service import OrderCreatorService
 from src.orders.domain.entities.order import Order, OrderSource, OrderStatus
@@ -112,3 +113,88 @@ def test_order_creator_service_run(
     )
     mock_order_repository.save.assert_called_once_with(mock_order_for_creation)
     mock_event_bus.publish.assert_called_once_with(mock_order_for_creation.pull_domain_events())
+
+
+@pytest.fixture
+def orders_data(mock_order_item_for_creation):
+  return [
+    {
+      "order_id": OrderId(str(uuid.uuid4())),
+      "order_number": Mock(value=f"ORD-00{index}"),
+      "customer_id": CustomerId(str(uuid.uuid4())),
+      "customer_name": CustomerName("Test Customer"),
+      "seller_id": SellerId(str(uuid.uuid4())),
+      "seller_name": SellerName("Test Seller"),
+      "ip_address": "127.0.0.1",
+      "source": OrderSource.WEB,
+      "currency": "USD",
+      "items": [mock_order_item_for_creation],
+    }
+    for index in range(3)
+  ]
+
+
+@pytest.mark.django_db
+def test_order_creator_service_run_many_saves_in_bulk_and_publishes_once(
+  mock_order_repository, mock_event_bus, orders_data, django_capture_on_commit_callbacks
+):
+  service = OrderCreatorService(repository=mock_order_repository, event_bus=mock_event_bus)
+  orders = [Mock(spec=Order) for _ in orders_data]
+  for index, order in enumerate(orders):
+    order.pull_domain_events.return_value = [f"event-{index}"]
+
+  with (
+    patch("src.orders.domain.entities.order.Order.create", side_effect=orders) as mock_order_create,
+    django_capture_on_commit_callbacks(execute=True),
+  ):
+    service.run_many(orders_data)
+
+  assert mock_order_create.call_count == 3
+  mock_order_repository.save_many.assert_called_once_with(orders)
+  mock_order_repository.save.assert_not_called()
+  mock_event_bus.publish.assert_called_once_with(["event-0", "event-1", "event-2"])
+
+
+@pytest.mark.django_db(transaction=True)
+def test_order_creator_service_run_many_publishes_only_after_the_outer_transaction_commits(
+  mock_order_repository, mock_event_bus, orders_data
+):
+  service = OrderCreatorService(repository=mock_order_repository, event_bus=mock_event_bus)
+
+  def create_order(**order_data):
+    return Mock(spec=Order, pull_domain_events=Mock(return_value=["event"]))
+
+  with patch("src.orders.domain.entities.order.Order.create", side_effect=create_order):
+    with pytest.raises(RuntimeError), transaction.atomic():
+      service.run_many(orders_data[:1])
+      raise RuntimeError("rollback")
+    mock_event_bus.publish.assert_not_called()
+
+    with transaction.atomic():
+      service.run_many(orders_data)
+      mock_event_bus.publish.assert_not_called()
+  mock_event_bus.publish.assert_called_once()
+
+
+def test_order_repository_save_many_defaults_to_saving_each_order(mock_order_for_creation):
+  class InMemoryOrderRepository(IOrderRepository):
+    def __init__(self):
+      self.saved = []
+
+    def get_all(self):
+      return self.saved
+
+    def get_by_id(self, order_id):
+      return None
+
+    def save(self, order):
+      self.saved.append(order)
+
+    def delete(self, order_id):
+      pass
+
+  repository = InMemoryOrderRepository()
+
+  repository.save_many([mock_order_for_creation, mock_order_for_creation])
+
+  assert repository.saved == [mock_order_for_creation, mock_order_for_creation]
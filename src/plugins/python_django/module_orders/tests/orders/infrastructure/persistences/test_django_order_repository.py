@@ -0,0 +1,95 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from src.orders.domain.entities.order import Order, OrderSource
+from src.orders.domain.entities.order_item import OrderItem
+from src.orders.domain.value_objects.customer_id import CustomerId
+from src.orders.domain.value_objects.customer_name import CustomerName
+from src.orders.domain.value_objects.item_quantity import ItemQuantity
+from src.orders.domain.value_objects.order_id import OrderId
+from src.orders.domain.value_objects.order_item_id import OrderItemId
+from src.orders.domain.value_objects.order_number import OrderNumber
+from src.orders.domain.value_objects.product_id import ProductId
+from src.orders.domain.value_objects.product_name import ProductName
+from src.orders.domain.value_objects.product_price import ProductPrice
+from src.orders.domain.value_objects.seller_id import SellerId
+from src.orders.domain.value_objects.seller_name import SellerName
+from src.orders.infrastructure.persistences.django_order_repository import DjangoOrderRepository
+from src.orders.infrastructure.persistences.models.order import OrderDAO
+from src.orders.infrastructure.persistences.models.order_item import OrderItemDAO
+from src.shared.infrastructure.persistences.base_models import SYSTEM_USER_ID
+
+
+def build_order_item(unit_price: str, quantity: int) -> OrderItem:
+  return OrderItem(
+    order_item_id=OrderItemId(str(uuid.uuid4())),
+    product_id=ProductId(str(uuid.uuid4())),
+    product_name=ProductName("Test Product"),
+    product_sku="SKU123",
+    product_image_url="http://example.com/image.jpg",
+    quantity=ItemQuantity(quantity),
+    unit_price=ProductPrice(Decimal(unit_price)),
+  )
+
+
+def build_order(index: int, items: list[OrderItem]) -> Order:
+  return Order.create(
+    order_id=OrderId(str(uuid.uuid4())),
+    order_number=OrderNumber(f"ORD-00{index}"),
+    customer_id=CustomerId(str(uuid.uuid4())),
+    customer_name=CustomerName("Test Customer"),
+    seller_id=SellerId(str(uuid.uuid4())),
+    seller_name=SellerName("Test Seller"),
+    ip_address="127.0.0.1",
+    source=OrderSource.WEB,
+    currency="USD",
+    items=items,
+  )
+
+
+@pytest.mark.django_db
+def test_save_many_bulk_inserts_orders_with_their_items(django_assert_num_queries):
+  orders = [
+    build_order(1, [build_order_item("10.00", 2), build_order_item("5.50", 1)]),
+    build_order(2, [build_order_item("3.25", 4)]),
+  ]
+
+  # One savepoint pair plus one INSERT per table, whatever the batch size.
+  with django_assert_num_queries(4):
+    DjangoOrderRepository().save_many(orders)
+
+  saved = {dao.id: dao for dao in OrderDAO.objects.prefetch_related("items")}
+  assert set(saved) == {uuid.UUID(order.id.value) for order in orders}
+  for order in orders:
+    order_dao = saved[uuid.UUID(order.id.value)]
+    assert order_dao.order_number == order.order_number.value
+    assert order_dao.total_items == order.total_items
+    assert order_dao.total_amount == order.total_amount.value
+    assert (order_dao.created_by, order_dao.updated_by) == (SYSTEM_USER_ID, SYSTEM_USER_ID)
+    assert {item.id for item in order_dao.items.all()} == {uuid.UUID(item.order_item_id.value) for item in order.items}
+  assert OrderItemDAO.objects.count() == 3
+
+
+def persisted_columns(order: Order) -> tuple[dict, list[dict]]:
+  # Identifiers and timestamps differ between two built orders by construction; every other column must match.
+  order_dao = OrderDAO.objects.get(id=order.id.value)
+  item_daos = order_dao.items.order_by("product_sku", "quantity")
+  order_ignored = {"_state", "id", "order_number", "order_date", "customer_id", "seller_id", "created_at", "updated_at"}
+  item_ignored = {"_state", "id", "order_id", "product_id", "created_at", "updated_at"}
+  return (
+    {field: value for field, value in vars(order_dao).items() if field not in order_ignored},
+    [{field: value for field, value in vars(item).items() if field not in item_ignored} for item in item_daos],
+  )
+
+
+@pytest.mark.django_db
+def test_save_persists_the_same_columns_as_save_many():
+  single, bulk = (build_order(index, [build_order_item("10.00", 2), build_order_item("5.50", 1)]) for index in (1, 2))
+  repository = DjangoOrderRepository()
+
+  repository.save(single)
+  repository.save_many([bulk])
+
+  assert persisted_columns(single) == persisted_columns(bulk)
+  assert persisted_columns(single)[0]["created_by"] == SYSTEM_USER_ID
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from src.shared.domain.commands.command import Command
+
+
+class AsyncCommandBus(ABC):
+  @abstractmethod
+  async def dispatch(self, command: Command) -> None:
+    raise NotImplementedError
+
+  async def dispatch_many(self, commands: list[Command]) -> None:
+    for command in commands:
+      await self.dispatch(command)
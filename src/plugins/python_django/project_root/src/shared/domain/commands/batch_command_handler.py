@@ -0,0 +1,13 @@
+from abc import abstractmethod
+from typing import TypeVar
+
+from src.shared.domain.commands.command import Command
+from src.shared.domain.commands.command_handler import CommandHandler
+
+C = TypeVar("C", bound=Command)
+
+
+class BatchCommandHandler[C: Command](CommandHandler[C]):
+  @abstractmethod
+  def handle_many(self, commands: list[C]) -> None:
+    raise NotImplementedError
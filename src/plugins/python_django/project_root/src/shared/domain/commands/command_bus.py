@@ -7,3 +7,7 @@ class CommandBus(ABC):
   @abstractmethod
   def dispatch(self, command: Command) -> None:
     raise NotImplementedError
+
+  def dispatch_many(self, commands: list[Command]) -> None:
+    for command in commands:
+      self.dispatch(command)
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import TypeVar
+
+from src.shared.domain.queries.query import Query
+from src.shared.domain.queries.response import Response
+
+R = TypeVar("R", bound=Response)
+Q = TypeVar("Q", bound=Query)
+
+
+class AsyncQueryBus[R: Response](ABC):
+  @abstractmethod
+  async def ask(self, query: Q) -> R:
+    raise NotImplementedError
@@ -0,0 +1,18 @@
+from importlib import import_module
+
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class SharedAPIConfig(AppConfig):
+  name = "src.shared.infrastructure.api"
+  verbose_name = "Shared API"
+
+  def ready(self):
+    from src.shared.infrastructure.command_bus.command_bus_registry import command_bus_registry
+
+    # Loading the URLconf registers every routed command view, so their buses are built before the first request.
+    root_urlconf = getattr(settings, "ROOT_URLCONF", None)
+    if root_urlconf:
+      import_module(root_urlconf)
+    command_bus_registry.warm_up()
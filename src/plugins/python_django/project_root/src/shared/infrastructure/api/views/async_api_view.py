@@ -0,0 +1,41 @@
+import inspect
+from functools import update_wrapper
+
+from src.shared.infrastructure.sync_executor import run_sync
+
+
+class AsyncAPIViewMixin:
+  @classmethod
+  def as_view(cls, actions=None, **initkwargs):
+    view = super().as_view(actions, **initkwargs)
+
+    # Django only awaits views that are coroutine functions; DRF's view returns the coroutine from dispatch().
+    async def async_view(request, *args, **kwargs):
+      return await view(request, *args, **kwargs)
+
+    return update_wrapper(async_view, view)
+
+  async def dispatch(self, request, *args, **kwargs):
+    self.args = args
+    self.kwargs = kwargs
+    request = self.initialize_request(request, *args, **kwargs)
+    self.request = request
+    self.headers = self.default_response_headers
+
+    try:
+      # Authentication, permissions and throttling may hit the database, so they run off the event loop.
+      await run_sync(self.initial, request, *args, **kwargs)
+
+      if request.method.lower() in self.http_method_names:
+        handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+      else:
+        handler = self.http_method_not_allowed
+
+      response = handler(request, *args, **kwargs)
+      if inspect.isawaitable(response):
+        response = await response
+    except Exception as exc:
+      response = self.handle_exception(exc)
+
+    self.response = self.finalize_response(request, response, *args, **kwargs)
+    return self.response
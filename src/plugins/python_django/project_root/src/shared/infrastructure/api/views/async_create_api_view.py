@@ -0,0 +1,18 @@
+from src.shared.infrastructure.api.views.async_api_view import AsyncAPIViewMixin
+from src.shared.infrastructure.api.views.create_api_view import CreateAPIView
+from src.shared.infrastructure.command_bus.in_memory_async_command_bus import InMemoryAsyncCommandBus
+from src.shared.infrastructure.sync_executor import run_sync
+
+
+class AsyncCreateAPIView(AsyncAPIViewMixin, CreateAPIView):
+  view_name = "AsyncCreateAPIView"
+  infrastructure_command_bus = InMemoryAsyncCommandBus
+
+  async def create(self, request):
+    validated_data = await run_sync(self._validate_request_serializer, request.data)
+
+    command = self.application_command(validated_data)
+
+    await self.infrastructure_command_bus.dispatch(command)
+
+    return self._created_response()
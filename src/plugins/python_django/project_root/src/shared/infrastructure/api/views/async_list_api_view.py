@@ -0,0 +1,17 @@
+from src.shared.infrastructure.api.views.async_api_view import AsyncAPIViewMixin
+from src.shared.infrastructure.api.views.list_api_view import ListAPIView
+from src.shared.infrastructure.query_bus.in_memory_async_query_bus import InMemoryAsyncQueryBus
+from src.shared.infrastructure.sync_executor import run_sync
+
+
+class AsyncListAPIView(AsyncAPIViewMixin, ListAPIView):
+  view_name = "AsyncListAPIView"
+  infrastructure_query_bus = InMemoryAsyncQueryBus
+
+  async def list(self, request):
+    query = self._list_query(request)
+
+    items = await self.infrastructure_query_bus.ask(query)
+    serialized_items = await run_sync(self._serialize_items, items)
+
+    return self._list_response(serialized_items)
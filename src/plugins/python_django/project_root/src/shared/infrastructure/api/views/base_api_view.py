@@ -12,11 +12,12 @@ class BaseAPIView(ExceptionMixin, GenericViewSet):
   request_serializer_class = None
   response_serializer_class = None
 
-  def _validate_request_serializer(self, data, partial=False):
+  def _validate_request_serializer(self, data, partial=False, many=False):
     if not self.request_serializer_class:
       raise InternalServerErrorException(detail="request_serializer_class debe ser definido para esta vista.")
 
-    serializer = self.request_serializer_class(data=data, partial=partial)
+    options = {"many": True} if many else {}
+    serializer = self.request_serializer_class(data=data, partial=partial, **options)
     if not serializer.is_valid():
       raise UnprocessableEntityException(
         detail="Error de validación en los datos de entrada.",
@@ -0,0 +1,31 @@
+from src.shared.domain.exceptions.domain_exception import HTTP_201_CREATED
+from src.shared.infrastructure.api.api_response import success_response
+from src.shared.infrastructure.api.exceptions.unprocessable_entity_exception import UnprocessableEntityException
+from src.shared.infrastructure.api.views.commad_api_view import CommandAPIView
+
+
+class BulkCreateAPIView(CommandAPIView):
+  view_name = "BulkCreateAPIView"
+  max_batch_size = 1000
+
+  def bulk_create(self, request):
+    if not isinstance(request.data, list) or not request.data:
+      raise UnprocessableEntityException(detail="Se esperaba una lista no vacía de recursos.")
+    if len(request.data) > self.max_batch_size:
+      raise UnprocessableEntityException(
+        detail=f"Se pueden crear como máximo {self.max_batch_size} recursos por solicitud."
+      )
+
+    validated_items = self._validate_request_serializer(request.data, many=True)
+
+    commands = [self.application_command(validated_data) for validated_data in validated_items]
+
+    self.infrastructure_command_bus.dispatch_many(commands)
+
+    return success_response(
+      message=self.message_response
+      if self.message_response is not None
+      else f"{len(commands)} recursos creados exitosamente.",
+      data={"created": len(commands)},
+      status_code=HTTP_201_CREATED,
+    )
@@ -2,9 +2,11 @@ from typing import Any
 
 from src.orders.application.subscribers.log_order_created_subscriber import LogOrderCreatedSubscriber
 from src.shared.domain.commands.command import Command
+from src.shared.domain.commands.command_bus import CommandBus
 from src.shared.domain.commands.command_handler import CommandHandler
 from src.shared.infrastructure.api.exceptions.internal_server_error_exception import InternalServerErrorException
 from src.shared.infrastructure.api.views.base_api_view import BaseAPIView
+from src.shared.infrastructure.command_bus.command_bus_registry import command_bus_registry
 from src.shared.infrastructure.command_bus.command_handlers import CommandHandlers
 from src.shared.infrastructure.command_bus.in_memory_command_bus import InMemoryCommandBus
 from src.shared.infrastructure.event_bus.domain_event_subscribers import DomainEventSubscribers
@@ -40,14 +42,17 @@ class CommandAPIView(BaseAPIView):
   infrastructure_command_bus = InMemoryCommandBus
   infrastructure_event_bus = InMemoryAsyncEventBus
   infrastructure_command_handlers = CommandHandlers
-  _initialized = False
+  command_bus_middlewares = ()
+  command_bus_registry = command_bus_registry
+
+  @classmethod
+  def as_view(cls, actions=None, **initkwargs):
+    cls.command_bus_registry.register(cls, **initkwargs)
+    return super().as_view(actions, **initkwargs)
 
   def __init__(self, **kwargs):
     print(f"CommandAPIView __init__ {self.__class__.__name__}")
     super().__init__(**kwargs)
-    if not self._initialized:
-      self._initialize_components()
-      self._initialized = True
 
   def dispatch(self, request, *args, **kwargs):
     print(f"CommandAPIView dispatch {self.__class__.__name__}")
@@ -56,15 +61,25 @@ class CommandAPIView(BaseAPIView):
     except Exception as exc:
       return self.handle_exception(exc)
 
+  def initial(self, request, *args, **kwargs):
+    super().initial(request, *args, **kwargs)
+    # Buses are built once per view class and shared across requests; a bus instance set on the view is used as is.
+    if isinstance(self.infrastructure_command_bus, type):
+      self.infrastructure_command_bus = self.command_bus_registry.command_bus(type(self), self._build_command_bus)
+
   def _initialize_components(self):
     try:
-      self._validate_required_attributes()
-      self._initialize_repositories()
-      self._initialize_event_bus()
-      self._initialize_command_bus()
+      self._build_command_bus()
     except Exception as exc:
       return self.handle_exception(exc)
 
+  def _build_command_bus(self) -> CommandBus:
+    self._validate_required_attributes()
+    self._initialize_repositories()
+    self._initialize_event_bus()
+    self._initialize_command_bus()
+    return self.infrastructure_command_bus
+
   def _validate_required_attributes(self):
     required_attrs = {
       "repositories": "repositories",
@@ -86,22 +101,25 @@ class CommandAPIView(BaseAPIView):
   def _initialize_repositories(self):
     self.instantiated_repositories = {}
     for repo_name, repo_class in self.repositories:
-      self.instantiated_repositories[repo_name] = repo_class()
+      self.instantiated_repositories[repo_name] = self.command_bus_registry.repository(repo_class)
 
   def _initialize_event_bus(self):
+    self.event_bus = self.command_bus_registry.event_bus(self.infrastructure_event_bus, self._domain_event_subscribers)
+
+  def _domain_event_subscribers(self) -> DomainEventSubscribers:
     container = DIContainer()
     log_subscriber = LogOrderCreatedSubscriber()
     container.register_service("logProductCreatedSubscriber", log_subscriber, tags=["domainEventSubscriber"])
-    all_subscribers = DomainEventSubscribers.from_container(container)
-
-    self.event_bus = self.infrastructure_event_bus()
-    self.event_bus.add_subscribers(all_subscribers)
+    return DomainEventSubscribers.from_container(container)
 
   def _initialize_command_bus(self):
-    service = self.application_service(self.event_bus, **self.instantiated_repositories)
+    service = self.application_service(event_bus=self.event_bus, **self.instantiated_repositories)
     command_handler = self.application_command_handler(service=service)
     command_handlers = self.infrastructure_command_handlers(command_handlers=[command_handler])
-    self.infrastructure_command_bus = self.infrastructure_command_bus(command_handlers_information=command_handlers)
+    options = {"middlewares": self.command_bus_middlewares} if self.command_bus_middlewares else {}
+    self.infrastructure_command_bus = self.infrastructure_command_bus(
+      command_handlers_information=command_handlers, **options
+    )
 
   def __message_detail__(self, variable: str):
     return f"{variable} must be defined for this {self.view_name}."
@@ -13,6 +13,9 @@ class CreateAPIView(CommandAPIView):
 
     self.infrastructure_command_bus.dispatch(command)
 
+    return self._created_response()
+
+  def _created_response(self):
     return success_response(
       message=self.message_response if self.message_response is not None else "Recurso creado exitosamente.",
       status_code=HTTP_201_CREATED,
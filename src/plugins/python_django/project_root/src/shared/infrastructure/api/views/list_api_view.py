@@ -12,14 +12,20 @@ class ListAPIView(QueryAPIView, ListModelMixin):
     super().__init__(**kwargs)
 
   def list(self, request):
-    skip = int(request.query_params.get("skip", 0))
-    limit = int(request.query_params.get("limit", 50))
-
-    query = self.application_query(skip=skip, limit=limit)
+    query = self._list_query(request)
 
     items = self.infrastructure_query_bus.ask(query)
     serialized_items = self._serialize_items(items)
 
+    return self._list_response(serialized_items)
+
+  def _list_query(self, request):
+    skip = int(request.query_params.get("skip", 0))
+    limit = int(request.query_params.get("limit", 50))
+
+    return self.application_query(skip=skip, limit=limit)
+
+  def _list_response(self, serialized_items):
     return success_response(
       message=self.message_response if self.message_response is not None else "Recursos obtenidos exitosamente.",
       data=serialized_items,
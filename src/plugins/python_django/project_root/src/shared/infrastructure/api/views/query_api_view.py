@@ -2,6 +2,7 @@ from src.shared.domain.queries.query import Query
 from src.shared.domain.queries.query_handler import QueryHandler
 from src.shared.infrastructure.api.exceptions.internal_server_error_exception import InternalServerErrorException
 from src.shared.infrastructure.api.views.base_api_view import BaseAPIView
+from src.shared.infrastructure.command_bus.command_bus_registry import command_bus_registry
 from src.shared.infrastructure.query_bus.in_memory_query_bus import InMemoryQueryBus
 from src.shared.infrastructure.query_bus.query_handlers import QueryHandlers
 
@@ -11,14 +12,12 @@ class QueryAPIView(BaseAPIView):
   application_query_handler = QueryHandler
   infrastructure_query_bus = InMemoryQueryBus
   infrastructure_query_handlers = QueryHandlers
-  _initialized = False
+  query_bus_middlewares = ()
+  command_bus_registry = command_bus_registry
 
   def __init__(self, **kwargs):
     print(f"QueryAPIView __init__ {self.__class__.__name__}")
     super().__init__(**kwargs)
-    if not self._initialized:
-      self._initialize_components()
-      self.__class__._initialized = True
 
   def dispatch(self, request, *args, **kwargs):
     print(f"QueryAPIView dispatch {self.__class__.__name__}")
@@ -27,14 +26,24 @@ class QueryAPIView(BaseAPIView):
     except Exception as exc:
       return self.handle_exception(exc)
 
+  def initial(self, request, *args, **kwargs):
+    super().initial(request, *args, **kwargs)
+    # Resolved on each request from the registry, which builds the query bus once per view class.
+    if isinstance(self.infrastructure_query_bus, type):
+      self.infrastructure_query_bus = self.command_bus_registry.query_bus(type(self), self._build_query_bus)
+
   def _initialize_components(self):
     try:
-      self._validate_required_attributes()
-      self._initialize_repositories()
-      self._initialize_query_bus()
+      self._build_query_bus()
     except Exception as exc:
       return self.handle_exception(exc)
 
+  def _build_query_bus(self):
+    self._validate_required_attributes()
+    self._initialize_repositories()
+    self._initialize_query_bus()
+    return self.infrastructure_query_bus
+
   def _validate_required_attributes(self):
     required_attrs = {
       "repositories": "repositories debe ser definido para ListAPIView.",
@@ -55,4 +64,5 @@ class QueryAPIView(BaseAPIView):
   def _initialize_query_bus(self):
     query_handler = self.application_query_handler(**self.instantiated_repositories)
     query_handlers = self.infrastructure_query_handlers(query_handlers=[query_handler])
-    self.infrastructure_query_bus = self.infrastructure_query_bus(query_handlers_information=query_handlers)
+    options = {"middlewares": self.query_bus_middlewares} if self.query_bus_middlewares else {}
+    self.infrastructure_query_bus = self.infrastructure_query_bus(query_handlers_information=query_handlers, **options)
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+from src.shared.domain.commands.command import Command
+
+
+@dataclass(frozen=True)
+class CommandBatch:
+  commands: tuple[Command, ...]
@@ -0,0 +1,82 @@
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from src.shared.domain.commands.command_bus import CommandBus
+from src.shared.domain.events.event_bus import EventBus
+from src.shared.domain.queries.query_bus import QueryBus
+from src.shared.infrastructure.event_bus.domain_event_subscribers import DomainEventSubscribers
+
+logger = logging.getLogger(__name__)
+
+
+class CommandBusRegistry:
+  def __init__(self):
+    self._command_buses: dict[type, CommandBus] = {}
+    self._query_buses: dict[type, QueryBus] = {}
+    self._repositories: dict[type, Any] = {}
+    self._event_buses: dict[type, EventBus] = {}
+    self._views: dict[type, dict[str, Any]] = {}
+    self._lock = threading.RLock()
+    self.builds = 0
+
+  def register(self, view_class: type, **initkwargs) -> None:
+    with self._lock:
+      self._views[view_class] = initkwargs
+
+  def command_bus(self, view_class: type, build: Callable[[], CommandBus]) -> CommandBus:
+    return self._resolve(self._command_buses, view_class, build)
+
+  def query_bus(self, view_class: type, build: Callable[[], QueryBus]) -> QueryBus:
+    return self._resolve(self._query_buses, view_class, build)
+
+  def repository(self, repository_class: type) -> Any:
+    with self._lock:
+      if repository_class not in self._repositories:
+        self._repositories[repository_class] = repository_class()
+      return self._repositories[repository_class]
+
+  def event_bus(self, event_bus_class: type, subscribers: Callable[[], DomainEventSubscribers]) -> EventBus:
+    with self._lock:
+      if event_bus_class not in self._event_buses:
+        event_bus = event_bus_class()
+        event_bus.add_subscribers(subscribers())
+        self._event_buses[event_bus_class] = event_bus
+      return self._event_buses[event_bus_class]
+
+  def warm_up(self) -> int:
+    with self._lock:
+      views = list(self._views.items())
+
+    for view_class, initkwargs in views:
+      try:
+        view = view_class(**initkwargs)
+        self.command_bus(view_class, view._build_command_bus)
+      except Exception as exc:
+        # A misconfigured view must not stop manage.py commands; it reports the error on its first request.
+        logger.warning(f"No se pudo construir el command bus de {view_class.__name__}: {exc}")
+    return len(self._command_buses)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._command_buses.clear()
+      self._query_buses.clear()
+      self._repositories.clear()
+      self._event_buses.clear()
+
+  def _resolve(self, buses: dict[type, Any], view_class: type, build: Callable[[], Any]) -> Any:
+    bus = buses.get(view_class)
+    if bus is not None:
+      return bus
+
+    with self._lock:
+      bus = buses.get(view_class)
+      if bus is None:
+        bus = build()
+        buses[view_class] = bus
+        self.builds += 1
+    return bus
+
+
+command_bus_registry = CommandBusRegistry()
@@ -0,0 +1,67 @@
+import inspect
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from itertools import groupby
+from typing import Any
+
+from src.shared.domain.commands.async_command_bus import AsyncCommandBus
+from src.shared.domain.commands.batch_command_handler import BatchCommandHandler
+from src.shared.domain.commands.command import Command
+from src.shared.domain.commands.command_not_registered_error import CommandNotRegisteredError
+from src.shared.infrastructure.command_bus.command_batch import CommandBatch
+from src.shared.infrastructure.command_bus.command_handlers import CommandHandlers
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, Handle, compose_middlewares
+from src.shared.infrastructure.sync_executor import run_sync
+
+
+class InMemoryAsyncCommandBus(AsyncCommandBus):
+  def __init__(
+    self,
+    command_handlers_information: CommandHandlers,
+    executor: Executor | None = None,
+    middlewares: Sequence[BusMiddleware] = (),
+  ):
+    self.__command_handlers_information = command_handlers_information
+    self.__executor = executor
+    self.__middlewares = tuple(middlewares)
+    self.__handle = compose_middlewares(middlewares, self.__handle_command)
+    self.__handle_batch = compose_middlewares(middlewares, self.__handle_command_batch)
+
+  async def dispatch(self, command: Command) -> None:
+    handler = self.__handler_for(command)
+    await self.__run(handler, handler.handle, self.__handle, command)
+
+  async def dispatch_many(self, commands: list[Command]) -> None:
+    for _, group in groupby(commands, key=type):
+      batch = list(group)
+      handler = self.__handler_for(batch[0])
+      if isinstance(handler, BatchCommandHandler):
+        await self.__run(handler, handler.handle_many, self.__handle_batch, CommandBatch(tuple(batch)))
+      else:
+        for command in batch:
+          await self.__run(handler, handler.handle, self.__handle, command)
+
+  async def __run(self, handler: Any, handle: Callable[..., Any], chain: Handle, message: Any) -> None:
+    if inspect.iscoroutinefunction(handle):
+      if self.__middlewares:
+        raise TypeError(
+          f"Los middlewares del bus son síncronos y no pueden envolver el handler asíncrono {type(handler).__name__}"
+        )
+      await handle(list(message.commands) if isinstance(message, CommandBatch) else message)
+      return
+    # Middlewares are synchronous, so the whole chain runs in the worker thread together with the handler.
+    await run_sync(chain, message, executor=self.__executor)
+
+  def __handle_command(self, command: Command) -> None:
+    self.__handler_for(command).handle(command)
+
+  def __handle_command_batch(self, batch: CommandBatch) -> None:
+    self.__handler_for(batch.commands[0]).handle_many(list(batch.commands))
+
+  def __handler_for(self, command: Command):
+    handler = self.__command_handlers_information.get(command)
+
+    if not handler:
+      raise CommandNotRegisteredError(command)
+
+    return handler
@@ -1,17 +1,44 @@
+from collections.abc import Sequence
+from itertools import groupby
+
+from src.shared.domain.commands.batch_command_handler import BatchCommandHandler
 from src.shared.domain.commands.command import Command
 from src.shared.domain.commands.command_bus import CommandBus
 from src.shared.domain.commands.command_not_registered_error import CommandNotRegisteredError
+from src.shared.infrastructure.command_bus.command_batch import CommandBatch
 from src.shared.infrastructure.command_bus.command_handlers import CommandHandlers
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, compose_middlewares
 
 
 class InMemoryCommandBus(CommandBus):
-  def __init__(self, command_handlers_information: CommandHandlers):
+  def __init__(self, command_handlers_information: CommandHandlers, middlewares: Sequence[BusMiddleware] = ()):
     self.__command_handlers_information = command_handlers_information
+    self.__handle = compose_middlewares(middlewares, self.__handle_command)
+    self.__handle_batch = compose_middlewares(middlewares, self.__handle_command_batch)
 
   def dispatch(self, command: Command) -> None:
+    self.__handle(command)
+
+  def dispatch_many(self, commands: list[Command]) -> None:
+    # Consecutive commands of the same type form one batch, so the overall dispatch order is preserved.
+    for _, group in groupby(commands, key=type):
+      batch = list(group)
+      if isinstance(self.__handler_for(batch[0]), BatchCommandHandler):
+        self.__handle_batch(CommandBatch(tuple(batch)))
+      else:
+        for command in batch:
+          self.__handle(command)
+
+  def __handle_command(self, command: Command) -> None:
+    self.__handler_for(command).handle(command)
+
+  def __handle_command_batch(self, batch: CommandBatch) -> None:
+    self.__handler_for(batch.commands[0]).handle_many(list(batch.commands))
+
+  def __handler_for(self, command: Command):
     handler = self.__command_handlers_information.get(command)
 
     if not handler:
       raise CommandNotRegisteredError(command)
 
-    handler.handle(command)
+    return handler
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import Any
+
+Handle = Callable[[Any], Any]
+
+
+class BusMiddleware(ABC):
+  @abstractmethod
+  def __call__(self, message: Any, next_handler: Handle) -> Any:
+    raise NotImplementedError
+
+
+def compose_middlewares(middlewares: Sequence[BusMiddleware], handle: Handle) -> Handle:
+  # The first middleware is the outermost one; without middlewares the handle is returned untouched.
+  for middleware in reversed(middlewares):
+    handle = partial(middleware, next_handler=handle)
+  return handle
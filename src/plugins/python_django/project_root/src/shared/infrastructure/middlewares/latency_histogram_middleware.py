@@ -0,0 +1,42 @@
+import bisect
+import threading
+import time
+from typing import Any
+
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, Handle
+
+DEFAULT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class LatencyHistogramMiddleware(BusMiddleware):
+  def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+    self.buckets_ms = tuple(sorted(buckets_ms))
+    self._counts: dict[str, list[int]] = {}
+    self._totals_ms: dict[str, float] = {}
+    self._lock = threading.Lock()
+
+  def __call__(self, message: Any, next_handler: Handle) -> Any:
+    start = time.perf_counter()
+    try:
+      return next_handler(message)
+    finally:
+      self.observe(type(message).__name__, (time.perf_counter() - start) * 1000)
+
+  def observe(self, message_type: str, elapsed_ms: float) -> None:
+    bucket = bisect.bisect_left(self.buckets_ms, elapsed_ms)
+    with self._lock:
+      counts = self._counts.setdefault(message_type, [0] * (len(self.buckets_ms) + 1))
+      counts[bucket] += 1
+      self._totals_ms[message_type] = self._totals_ms.get(message_type, 0.0) + elapsed_ms
+
+  def snapshot(self) -> dict[str, dict[str, Any]]:
+    labels = [f"<={bound}" for bound in self.buckets_ms] + ["+Inf"]
+    with self._lock:
+      return {
+        message_type: {
+          "count": sum(counts),
+          "total_ms": round(self._totals_ms[message_type], 3),
+          "buckets": dict(zip(labels, counts, strict=True)),
+        }
+        for message_type, counts in self._counts.items()
+      }
@@ -0,0 +1,19 @@
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, Handle
+from src.shared.infrastructure.query_bus.query_cache import QueryCache
+
+CommandTags = Iterable[str] | Callable[[Any], Iterable[str]]
+
+
+class QueryCacheInvalidationMiddleware(BusMiddleware):
+  def __init__(self, cache: QueryCache, tags: CommandTags):
+    self.cache = cache
+    self.tags = tags if callable(tags) else tuple(tags)
+
+  def __call__(self, message: Any, next_handler: Handle) -> Any:
+    result = next_handler(message)
+    # Only handled commands invalidate; list it before a TransactionMiddleware so it runs after the commit.
+    self.cache.invalidate(*(self.tags(message) if callable(self.tags) else self.tags))
+    return result
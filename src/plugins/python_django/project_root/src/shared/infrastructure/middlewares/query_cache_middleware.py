@@ -0,0 +1,19 @@
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, Handle
+from src.shared.infrastructure.query_bus.query_cache import QueryCache
+
+QueryTags = Iterable[str] | Callable[[Any], Iterable[str]]
+
+
+class QueryCacheMiddleware(BusMiddleware):
+  def __init__(self, cache: QueryCache, ttl: float | None = None, tags: QueryTags = ()):
+    self.cache = cache
+    self.ttl = ttl
+    self.tags = tags if callable(tags) else tuple(tags)
+
+  def __call__(self, message: Any, next_handler: Handle) -> Any:
+    tags = self.tags(message) if callable(self.tags) else self.tags
+    # Cached results are shared between requests, so callers must treat them as read-only.
+    return self.cache.fetch(message, lambda: next_handler(message), ttl=self.ttl, tags=tags)
@@ -0,0 +1,33 @@
+import logging
+import time
+from typing import Any
+
+from django.db import OperationalError
+
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, Handle
+
+logger = logging.getLogger(__name__)
+
+
+class RetryMiddleware(BusMiddleware):
+  def __init__(
+    self,
+    attempts: int = 3,
+    retry_on: tuple[type[Exception], ...] = (OperationalError,),
+    backoff_seconds: float = 0.05,
+  ):
+    self.attempts = max(1, attempts)
+    self.retry_on = retry_on
+    self.backoff_seconds = backoff_seconds
+
+  def __call__(self, message: Any, next_handler: Handle) -> Any:
+    for attempt in range(1, self.attempts + 1):
+      try:
+        return next_handler(message)
+      except self.retry_on as exc:
+        if attempt == self.attempts:
+          raise
+        logger.warning(
+          f"Reintentando '{type(message).__name__}' ({attempt}/{self.attempts}) tras {exc.__class__.__name__}: {exc}"
+        )
+        time.sleep(self.backoff_seconds * 2 ** (attempt - 1))
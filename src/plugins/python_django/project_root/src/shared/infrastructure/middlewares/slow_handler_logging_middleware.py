@@ -0,0 +1,23 @@
+import logging
+import time
+from typing import Any
+
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, Handle
+
+logger = logging.getLogger(__name__)
+
+
+class SlowHandlerLoggingMiddleware(BusMiddleware):
+  def __init__(self, threshold_ms: float = 500):
+    self.threshold_ms = threshold_ms
+
+  def __call__(self, message: Any, next_handler: Handle) -> Any:
+    start = time.perf_counter()
+    try:
+      return next_handler(message)
+    finally:
+      elapsed_ms = (time.perf_counter() - start) * 1000
+      if elapsed_ms >= self.threshold_ms:
+        logger.warning(
+          f"Handler lento para '{type(message).__name__}': {elapsed_ms:.1f} ms (umbral {self.threshold_ms} ms)"
+        )
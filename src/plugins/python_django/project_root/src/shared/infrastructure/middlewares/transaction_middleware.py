@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.db import transaction
+
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, Handle
+
+
+class TransactionMiddleware(BusMiddleware):
+  def __init__(self, using: str | None = None, savepoint: bool = True):
+    self.using = using
+    self.savepoint = savepoint
+
+  def __call__(self, message: Any, next_handler: Handle) -> Any:
+    with transaction.atomic(using=self.using, savepoint=self.savepoint):
+      return next_handler(message)
@@ -1,7 +1,10 @@
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from django.db.models import DateTimeField, Model, UUIDField
 
+# Audit actor for rows written by the system rather than on behalf of an authenticated user.
+SYSTEM_USER_ID = UUID(int=0)
+
 
 class BaseDAO(Model):
   id = UUIDField(primary_key=True, default=uuid4, editable=False)
@@ -0,0 +1,27 @@
+import hashlib
+from collections.abc import Hashable
+from typing import Any
+
+from django.core.cache import caches
+
+from src.shared.infrastructure.query_bus.query_cache_backend import QueryCacheBackend
+
+
+class DjangoQueryCacheBackend(QueryCacheBackend):
+  def __init__(self, alias: str = "default", key_prefix: str = "query-cache"):
+    self.alias = alias
+    self.key_prefix = key_prefix
+
+  def get(self, key: Hashable, default: Any = None) -> Any:
+    return caches[self.alias].get(self._cache_key(key), default)
+
+  def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+    # Django treats a None timeout as "never expire", which matches a cache entry without TTL.
+    caches[self.alias].set(self._cache_key(key), value, timeout=ttl)
+
+  def delete(self, key: Hashable) -> None:
+    caches[self.alias].delete(self._cache_key(key))
+
+  def _cache_key(self, key: Hashable) -> str:
+    # Hashing keeps keys within memcached's length and character limits whatever the query fields contain.
+    return f"{self.key_prefix}:{hashlib.sha1(repr(key).encode('utf-8')).hexdigest()}"
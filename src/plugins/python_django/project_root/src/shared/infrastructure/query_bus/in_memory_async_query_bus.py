@@ -0,0 +1,50 @@
+import inspect
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from typing import TypeVar
+
+from src.shared.domain.queries.async_query_bus import AsyncQueryBus
+from src.shared.domain.queries.query import Query
+from src.shared.domain.queries.query_not_registered_error import QueryNotRegisteredError
+from src.shared.domain.queries.response import Response
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, compose_middlewares
+from src.shared.infrastructure.query_bus.query_handlers import QueryHandlers
+from src.shared.infrastructure.sync_executor import run_sync
+
+R_co = TypeVar("R_co", bound=Response, covariant=True)
+
+
+class InMemoryAsyncQueryBus(AsyncQueryBus):
+  def __init__(
+    self,
+    query_handlers_information: QueryHandlers,
+    executor: Executor | None = None,
+    middlewares: Sequence[BusMiddleware] = (),
+  ):
+    self.__query_handlers_information = query_handlers_information
+    self.__executor = executor
+    self.__middlewares = tuple(middlewares)
+    self.__handle = compose_middlewares(middlewares, self.__handle_query)
+
+  async def ask(self, query: Query) -> R_co:
+    handler = self.__handler_for(query)
+
+    if inspect.iscoroutinefunction(handler.handle):
+      if self.__middlewares:
+        raise TypeError(
+          f"Los middlewares del bus son síncronos y no pueden envolver el handler asíncrono {type(handler).__name__}"
+        )
+      return await handler.handle(query)
+    # Middlewares are synchronous, so the whole chain runs in the worker thread together with the handler.
+    return await run_sync(self.__handle, query, executor=self.__executor)
+
+  def __handle_query(self, query: Query) -> R_co:
+    return self.__handler_for(query).handle(query)
+
+  def __handler_for(self, query: Query):
+    handler = self.__query_handlers_information.get(query)
+
+    if not handler:
+      raise QueryNotRegisteredError(query)
+
+    return handler
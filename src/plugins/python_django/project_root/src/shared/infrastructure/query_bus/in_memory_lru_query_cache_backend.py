@@ -0,0 +1,45 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from src.shared.infrastructure.query_bus.query_cache_backend import QueryCacheBackend
+
+
+class InMemoryLRUQueryCacheBackend(QueryCacheBackend):
+  def __init__(self, max_entries: int = 1024):
+    self.max_entries = max(1, max_entries)
+    self._entries: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, key: Hashable, default: Any = None) -> Any:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return default
+      expires_at, value = entry
+      if expires_at is not None and expires_at <= time.monotonic():
+        del self._entries[key]
+        return default
+      self._entries.move_to_end(key)
+      return value
+
+  def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+    expires_at = time.monotonic() + ttl if ttl is not None else None
+    with self._lock:
+      self._entries[key] = (expires_at, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+
+  def delete(self, key: Hashable) -> None:
+    with self._lock:
+      self._entries.pop(key, None)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+
+  def __len__(self) -> int:
+    return len(self._entries)
@@ -1,19 +1,25 @@
+from collections.abc import Sequence
 from typing import TypeVar
 
 from src.shared.domain.queries.query import Query
 from src.shared.domain.queries.query_bus import QueryBus
 from src.shared.domain.queries.query_not_registered_error import QueryNotRegisteredError
 from src.shared.domain.queries.response import Response
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, compose_middlewares
 from src.shared.infrastructure.query_bus.query_handlers import QueryHandlers
 
 R_co = TypeVar("R_co", bound=Response, covariant=True)
 
 
 class InMemoryQueryBus(QueryBus):
-  def __init__(self, query_handlers_information: QueryHandlers):
+  def __init__(self, query_handlers_information: QueryHandlers, middlewares: Sequence[BusMiddleware] = ()):
     self.__query_handlers_information = query_handlers_information
+    self.__handle = compose_middlewares(middlewares, self.__handle_query)
 
   def ask(self, query: Query) -> R_co:
+    return self.__handle(query)
+
+  def __handle_query(self, query: Query) -> R_co:
     handler = self.__query_handlers_information.get(query)
 
     if not handler:
@@ -0,0 +1,87 @@
+import dataclasses
+import threading
+import uuid
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from src.shared.domain.queries.query import Query
+from src.shared.infrastructure.query_bus.query_cache_backend import QueryCacheBackend
+
+_MISSING = object()
+_NAMESPACE_KEY = ("namespace",)
+
+
+class QueryCache:
+  def __init__(self, backend: QueryCacheBackend, ttl: float | None = None):
+    self.backend = backend
+    self.ttl = ttl
+    self._hits: dict[str, int] = {}
+    self._misses: dict[str, int] = {}
+    self._lock = threading.Lock()
+
+  def fetch(self, query: Query, compute: Callable[[], Any], ttl: float | None = None, tags: Iterable[str] = ()) -> Any:
+    if not self.is_cacheable(query):
+      return compute()
+
+    key = self._query_key(query)
+    # Tag tokens are read before computing, so an invalidation racing with the handler makes the stored entry stale.
+    tokens = (self._token(_NAMESPACE_KEY), *(self._token(self._tag_key(tag)) for tag in tags))
+    entry = self.backend.get(key, _MISSING)
+    if entry is not _MISSING and entry[0] == tokens:
+      self._count(self._hits, query)
+      return entry[1]
+
+    self._count(self._misses, query)
+    result = compute()
+    self.backend.set(key, (tokens, result), ttl=ttl if ttl is not None else self.ttl)
+    return result
+
+  def invalidate(self, *tags: str) -> None:
+    # Entries keep the tokens their tags had when stored; issuing new tokens turns every tagged entry into a miss.
+    for tag in tags:
+      self.backend.set(self._tag_key(tag), uuid.uuid4().hex)
+
+  def clear(self) -> None:
+    # Rotating the namespace token expires every entry without touching keys the backend shares with other users.
+    self.backend.set(_NAMESPACE_KEY, uuid.uuid4().hex)
+
+  @property
+  def hits(self) -> int:
+    return sum(self._hits.values())
+
+  @property
+  def misses(self) -> int:
+    return sum(self._misses.values())
+
+  def snapshot(self) -> dict[str, dict[str, int]]:
+    with self._lock:
+      query_types = sorted(self._hits.keys() | self._misses.keys())
+      return {
+        query_type: {"hits": self._hits.get(query_type, 0), "misses": self._misses.get(query_type, 0)}
+        for query_type in query_types
+      }
+
+  @staticmethod
+  def is_cacheable(query: Query) -> bool:
+    return dataclasses.is_dataclass(query) and query.__dataclass_params__.frozen
+
+  def _token(self, key: tuple[str, ...]) -> str:
+    token = self.backend.get(key)
+    if token is None:
+      # An evicted token is replaced by a fresh one so entries stored under the old one cannot come back.
+      token = uuid.uuid4().hex
+      self.backend.set(key, token)
+    return token
+
+  def _count(self, counters: dict[str, int], query: Query) -> None:
+    query_type = type(query).__name__
+    with self._lock:
+      counters[query_type] = counters.get(query_type, 0) + 1
+
+  @staticmethod
+  def _query_key(query: Query) -> tuple[str, str, Query]:
+    return ("query", type(query).__module__, query)
+
+  @staticmethod
+  def _tag_key(tag: str) -> tuple[str, str]:
+    return ("tag", tag)
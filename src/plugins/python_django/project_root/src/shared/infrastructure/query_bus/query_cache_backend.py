@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from typing import Any
+
+
+class QueryCacheBackend(ABC):
+  @abstractmethod
+  def get(self, key: Hashable, default: Any = None) -> Any:
+    raise NotImplementedError
+
+  @abstractmethod
+  def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+    raise NotImplementedError
+
+  @abstractmethod
+  def delete(self, key: Hashable) -> None:
+    raise NotImplementedError
@@ -0,0 +1,21 @@
+from collections.abc import Callable, Iterable
+
+from src.shared.domain.events.domain_event import DomainEvent
+from src.shared.domain.events.domain_event_subscriber import DomainEventSubscriber
+from src.shared.infrastructure.query_bus.query_cache import QueryCache
+
+EventTags = Iterable[str] | Callable[[DomainEvent], Iterable[str]]
+
+
+class QueryCacheInvalidationSubscriber(DomainEventSubscriber):
+  def __init__(self, cache: QueryCache, tags_by_event: dict[type[DomainEvent], EventTags]):
+    self.cache = cache
+    self.tags_by_event = tags_by_event
+
+  def subscribed_to(self) -> list[type[DomainEvent]]:
+    return list(self.tags_by_event)
+
+  def on(self, domain_event: DomainEvent) -> None:
+    for event_class, tags in self.tags_by_event.items():
+      if isinstance(domain_event, event_class):
+        self.cache.invalidate(*(tags(domain_event) if callable(tags) else tags))
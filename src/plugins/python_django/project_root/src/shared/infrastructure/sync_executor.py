@@ -0,0 +1,24 @@
+import asyncio
+import contextvars
+import functools
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any
+
+from django.db import close_old_connections
+
+
+def _call_with_connections(func: Callable[[], Any]) -> Any:
+  # Worker threads never see request_started/request_finished, so stale connections are closed around each call.
+  close_old_connections()
+  try:
+    return func()
+  finally:
+    close_old_connections()
+
+
+async def run_sync(func: Callable[..., Any], *args, executor: Executor | None = None, **kwargs) -> Any:
+  loop = asyncio.get_running_loop()
+  context = contextvars.copy_context()
+  call = functools.partial(context.run, _call_with_connections, functools.partial(func, *args, **kwargs))
+  return await loop.run_in_executor(executor, call)
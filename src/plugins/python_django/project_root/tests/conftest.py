@@ -1,3 +1,4 @@
+import importlib.util
 import os
 
 from django.conf import settings
@@ -5,13 +6,17 @@ from django.conf import settings
 
 def pytest_configure():
   if not settings.configured:
+    installed_apps = [
+      "django.contrib.auth",
+      "django.contrib.contenttypes",
+      "rest_framework",
+      "src.shared.infrastructure.api",
+    ]
+    # The orders sample module ships its own models; its repository tests need them migrated.
+    if importlib.util.find_spec("src.orders") is not None:
+      installed_apps.append("src.orders.infrastructure.persistences")
     settings.configure(
-      INSTALLED_APPS=[
-        "django.contrib.auth",
-        "django.contrib.contenttypes",
-        "rest_framework",
-        "src.shared.infrastructure.api",
-      ],
+      INSTALLED_APPS=installed_apps,
       SECRET_KEY="a-very-secret-key-for-tests",
       DATABASES={
         "default": {
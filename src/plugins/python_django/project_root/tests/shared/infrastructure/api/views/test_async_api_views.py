@@ -0,0 +1,210 @@
+import asyncio
+import inspect
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from src.shared.domain.commands.command import Command
+from src.shared.domain.commands.command_handler import CommandHandler
+from src.shared.domain.exceptions.domain_exception import HTTP_201_CREATED, HTTP_500_INTERNAL_SERVER_ERROR
+from src.shared.infrastructure.api.views.async_create_api_view import AsyncCreateAPIView
+from src.shared.infrastructure.api.views.async_list_api_view import AsyncListAPIView
+from src.shared.infrastructure.command_bus.command_bus_registry import CommandBusRegistry
+from src.shared.infrastructure.middlewares.query_cache_middleware import QueryCacheMiddleware
+from src.shared.infrastructure.query_bus.in_memory_lru_query_cache_backend import InMemoryLRUQueryCacheBackend
+from src.shared.infrastructure.query_bus.query_cache import QueryCache
+
+
+class DummyCommand(Command):
+  def __init__(self, data):
+    self.data = data
+
+
+class SlowCommandHandler(CommandHandler):
+  def __init__(self, service):
+    self.service = service
+
+  def subscribed_to(self) -> type[Command]:
+    return DummyCommand
+
+  async def handle(self, command: DummyCommand) -> None:
+    await asyncio.sleep(0.05)
+    self.service.handled.append(command.data)
+
+
+class DummyService:
+  def __init__(self, event_bus, **repositories):
+    self.handled = []
+
+
+class DummyRequestSerializer:
+  def __init__(self, data, partial=False):
+    self.validated_data = data
+
+  def is_valid(self):
+    return True
+
+
+class DummyQuery:
+  def __init__(self, skip: int = 0, limit: int = 50):
+    self.skip = skip
+    self.limit = limit
+
+
+class DummyQueryHandler:
+  def __init__(self, **repositories):
+    pass
+
+  def subscribed_to(self):
+    return DummyQuery
+
+  def handle(self, query: DummyQuery) -> list[dict]:
+    return [{"skip": query.skip, "limit": query.limit}]
+
+
+class DummyResponseSerializer:
+  def __init__(self, data=None, many=False):
+    self.data = data
+
+  def is_valid(self):
+    return True
+
+
+@pytest.fixture
+def registry():
+  return CommandBusRegistry()
+
+
+@pytest.fixture
+def create_view_class(registry):
+  class DummyAsyncCreateAPIView(AsyncCreateAPIView):
+    command_bus_registry = registry
+    repositories = [("repository", Mock)]
+    request_serializer_class = DummyRequestSerializer
+    application_command = DummyCommand
+    application_command_handler = SlowCommandHandler
+    application_service = DummyService
+    infrastructure_event_bus = Mock
+
+  return DummyAsyncCreateAPIView
+
+
+def test_as_view_returns_a_coroutine_function(create_view_class):
+  view = create_view_class.as_view({"post": "create"})
+
+  assert inspect.iscoroutinefunction(view)
+  assert view.csrf_exempt
+
+
+@pytest.mark.django_db
+def test_async_create_serves_concurrent_requests(create_view_class, registry):
+  view = create_view_class.as_view({"post": "create"})
+  factory = APIRequestFactory()
+  requests = [factory.post("/fake-url/", {"index": index}, format="json") for index in range(10)]
+
+  async def serve():
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    responses = await asyncio.gather(*(view(request) for request in requests))
+    return responses, loop.time() - start
+
+  responses, elapsed = asyncio.run(serve())
+
+  assert [response.status_code for response in responses] == [HTTP_201_CREATED] * 10
+  assert responses[0].data["message"] == "Recurso creado exitosamente."
+  assert elapsed < 0.05 * 5
+  assert registry.builds == 1
+
+
+@pytest.mark.django_db
+def test_async_create_handles_command_bus_exception(create_view_class):
+  class FailingCommandHandler(SlowCommandHandler):
+    async def handle(self, command: DummyCommand) -> None:
+      raise Exception("Bus error")
+
+  class FailingView(create_view_class):
+    application_command_handler = FailingCommandHandler
+
+  view = FailingView.as_view({"post": "create"})
+  request = APIRequestFactory().post("/fake-url/", {"index": 0}, format="json")
+
+  response = asyncio.run(view(request))
+
+  assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
+
+
+@pytest.mark.django_db
+def test_async_create_runs_command_bus_middlewares_around_sync_handlers(create_view_class):
+  calls = []
+
+  class SyncCommandHandler(SlowCommandHandler):
+    def handle(self, command: DummyCommand) -> None:
+      calls.append(("handle", command.data))
+
+  def middleware(message, next_handler):
+    calls.append(("middleware", message.data))
+    return next_handler(message)
+
+  class MiddlewareView(create_view_class):
+    application_command_handler = SyncCommandHandler
+    command_bus_middlewares = (middleware,)
+
+  view = MiddlewareView.as_view({"post": "create"})
+
+  response = asyncio.run(view(APIRequestFactory().post("/fake-url/", {"index": 0}, format="json")))
+
+  assert response.status_code == HTTP_201_CREATED
+  assert calls == [("middleware", {"index": 0}), ("handle", {"index": 0})]
+
+
+@pytest.mark.django_db
+def test_async_list_runs_sync_handler_and_reuses_the_query_bus(registry):
+  class DummyAsyncListAPIView(AsyncListAPIView):
+    command_bus_registry = registry
+    repositories = []
+    application_query = DummyQuery
+    application_query_handler = DummyQueryHandler
+    response_serializer_class = DummyResponseSerializer
+
+  view = DummyAsyncListAPIView.as_view({"get": "list"})
+  factory = APIRequestFactory()
+
+  responses = [asyncio.run(view(factory.get("/fake-url/", {"skip": 10, "limit": 5}))) for _ in range(2)]
+
+  assert [response.data["data"] for response in responses] == [[{"skip": 10, "limit": 5}]] * 2
+  assert responses[0].data["message"] == "Recursos obtenidos exitosamente."
+  assert registry.builds == 1
+
+
+@dataclass(frozen=True)
+class FrozenDummyQuery:
+  skip: int = 0
+  limit: int = 50
+
+
+class FrozenDummyQueryHandler(DummyQueryHandler):
+  def subscribed_to(self):
+    return FrozenDummyQuery
+
+
+@pytest.mark.django_db
+def test_async_list_serves_repeated_queries_through_the_cache_middleware(registry):
+  cache = QueryCache(InMemoryLRUQueryCacheBackend())
+
+  class CachedAsyncListAPIView(AsyncListAPIView):
+    command_bus_registry = registry
+    repositories = []
+    application_query = FrozenDummyQuery
+    application_query_handler = FrozenDummyQueryHandler
+    response_serializer_class = DummyResponseSerializer
+    query_bus_middlewares = (QueryCacheMiddleware(cache),)
+
+  view = CachedAsyncListAPIView.as_view({"get": "list"})
+  factory = APIRequestFactory()
+
+  responses = [asyncio.run(view(factory.get("/fake-url/", {"skip": 10, "limit": 5}))) for _ in range(3)]
+
+  assert [response.data["data"] for response in responses] == [[{"skip": 10, "limit": 5}]] * 3
+  assert (cache.hits, cache.misses) == (2, 1)
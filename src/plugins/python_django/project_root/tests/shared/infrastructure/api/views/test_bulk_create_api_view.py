@@ -0,0 +1,62 @@
+from unittest.mock import Mock
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from src.shared.domain.commands.command import Command
+from src.shared.domain.exceptions.domain_exception import HTTP_201_CREATED
+from src.shared.infrastructure.api.views.bulk_create_api_view import BulkCreateAPIView
+
+
+class DummyCommand(Command):
+  def __init__(self, data):
+    self.data = data
+
+
+class DummyRequestSerializer:
+  def __init__(self, data, partial=False, many=False):
+    self.validated_data = data
+    self.many = many
+
+  def is_valid(self):
+    return self.many
+
+
+@pytest.fixture
+def command_bus():
+  return Mock()
+
+
+@pytest.fixture
+def view(command_bus):
+  class DummyBulkCreateAPIView(BulkCreateAPIView):
+    request_serializer_class = DummyRequestSerializer
+    application_command = DummyCommand
+    infrastructure_command_bus = command_bus
+    max_batch_size = 3
+
+  return DummyBulkCreateAPIView.as_view({"post": "bulk_create"})
+
+
+@pytest.mark.django_db
+def test_bulk_create_dispatches_all_commands_at_once(view, command_bus):
+  payload = [{"name": "a"}, {"name": "b"}]
+
+  response = view(APIRequestFactory().post("/fake-url/", payload, format="json"))
+
+  assert response.status_code == HTTP_201_CREATED
+  assert response.data["message"] == "2 recursos creados exitosamente."
+  assert response.data["data"] == {"created": 2}
+  command_bus.dispatch_many.assert_called_once()
+  [commands] = command_bus.dispatch_many.call_args.args
+  assert [command.data for command in commands] == payload
+  command_bus.dispatch.assert_not_called()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("payload", [{"name": "a"}, [], [{"name": str(index)} for index in range(4)]])
+def test_bulk_create_rejects_invalid_batches(view, command_bus, payload):
+  response = view(APIRequestFactory().post("/fake-url/", payload, format="json"))
+
+  assert response.status_code == 422
+  command_bus.dispatch_many.assert_not_called()
@@ -127,3 +127,13 @@ def test_initialize_command_bus(command_api_view: CommandAPIView):
   command_api_view.event_bus = Mock()
   command_api_view._initialize_command_bus()
   assert command_api_view.infrastructure_command_bus is not None
+
+
+def test_initialize_command_bus_passes_configured_middlewares(command_api_view: CommandAPIView):
+  middleware = Mock()
+  command_bus_class = command_api_view.infrastructure_command_bus
+  command_api_view.command_bus_middlewares = (middleware,)
+  command_api_view.instantiated_repositories = {}
+  command_api_view.event_bus = Mock()
+  command_api_view._initialize_command_bus()
+  assert command_bus_class.call_args.kwargs["middlewares"] == (middleware,)
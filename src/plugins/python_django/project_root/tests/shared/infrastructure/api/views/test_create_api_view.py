@@ -5,12 +5,14 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.test import APIRequestFactory
 
 from src.shared.domain.commands.command import Command
+from src.shared.domain.commands.command_handler import CommandHandler
 from src.shared.domain.exceptions.domain_exception import (
   HTTP_201_CREATED,
   HTTP_400_BAD_REQUEST,
   HTTP_500_INTERNAL_SERVER_ERROR,
 )
 from src.shared.infrastructure.api.views.create_api_view import CreateAPIView
+from src.shared.infrastructure.command_bus.command_bus_registry import CommandBusRegistry
 
 
 class DummyCommand(Command):
@@ -78,3 +80,45 @@ class TestCreateAPIView:
 
     assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
     mock_command_bus.dispatch.assert_called_once()
+
+
+class RegistryCommandHandler(CommandHandler):
+  def __init__(self, service):
+    self.service = service
+
+  def subscribed_to(self) -> type[Command]:
+    return DummyCommand
+
+  def handle(self, command: DummyCommand) -> None:
+    self.service.handled.append(command)
+
+
+class RegistryService:
+  def __init__(self, event_bus, **repositories):
+    self.event_bus = event_bus
+    self.repositories = repositories
+    self.handled = []
+
+
+@pytest.mark.django_db
+def test_command_bus_is_built_once_per_view_class():
+  registry = CommandBusRegistry()
+
+  class RegistryCreateAPIView(DummyCreateAPIView):
+    command_bus_registry = registry
+    repositories = [("repository", Mock)]
+    application_command = DummyCommand
+    application_command_handler = RegistryCommandHandler
+    application_service = RegistryService
+    infrastructure_event_bus = Mock
+
+  view = RegistryCreateAPIView.as_view({"post": "create"})
+  factory = APIRequestFactory()
+  with patch.object(RegistryCreateAPIView, "_validate_request_serializer", return_value={"test": "data"}):
+    responses = [view(factory.post("/fake-url/", {"test": "data"}, format="json")) for _ in range(3)]
+
+  assert [response.status_code for response in responses] == [HTTP_201_CREATED] * 3
+  assert registry.builds == 1
+  command_bus = registry.command_bus(RegistryCreateAPIView, Mock())
+  handler = command_bus._InMemoryCommandBus__command_handlers_information.get(DummyCommand({}))
+  assert len(handler.service.handled) == 3
@@ -1,12 +1,18 @@
+from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
 import pytest
 from django.forms import ValidationError
 from rest_framework.status import HTTP_200_OK
+from rest_framework.test import APIRequestFactory
 
 from src.shared.infrastructure.api.views.base_api_view import BaseAPIView
 from src.shared.infrastructure.api.views.list_api_view import ListAPIView
+from src.shared.infrastructure.command_bus.command_bus_registry import CommandBusRegistry
+from src.shared.infrastructure.middlewares.query_cache_middleware import QueryCacheMiddleware
+from src.shared.infrastructure.query_bus.in_memory_lru_query_cache_backend import InMemoryLRUQueryCacheBackend
 from src.shared.infrastructure.query_bus.in_memory_query_bus import InMemoryQueryBus
+from src.shared.infrastructure.query_bus.query_cache import QueryCache
 
 
 class MockRepo:
@@ -52,7 +58,6 @@ class TestListAPIView:
       application_query = MockQuery
       application_query_handler = MockQueryHandler
       response_serializer_class = MagicMock(spec=MockSerializer)
-      _initialized = False
 
     test_view = TestableListAPIView()
 
@@ -130,3 +135,49 @@ class TestListAPIView:
     view.dispatch(request)
 
     mock_handle_exception.assert_called_once_with(error)
+
+
+@dataclass(frozen=True)
+class FrozenListQuery:
+  skip: int = 0
+  limit: int = 50
+
+
+class FrozenListQueryHandler:
+  calls = 0
+
+  def __init__(self, **repositories):
+    pass
+
+  def subscribed_to(self):
+    return FrozenListQuery
+
+  def handle(self, query: FrozenListQuery):
+    FrozenListQueryHandler.calls += 1
+    return [{"skip": query.skip, "limit": query.limit}]
+
+
+@pytest.mark.django_db
+def test_list_view_reuses_its_query_bus_and_cache_across_requests():
+  cache = QueryCache(InMemoryLRUQueryCacheBackend())
+  registry = CommandBusRegistry()
+
+  class CachedListAPIView(ListAPIView):
+    command_bus_registry = registry
+    repositories = []
+    application_query = FrozenListQuery
+    application_query_handler = FrozenListQueryHandler
+    response_serializer_class = MockSerializer
+    query_bus_middlewares = (QueryCacheMiddleware(cache),)
+
+  view = CachedListAPIView.as_view({"get": "list"})
+  factory = APIRequestFactory()
+  FrozenListQueryHandler.calls = 0
+
+  responses = [view(factory.get("/fake-url/", {"skip": 10, "limit": 5})) for _ in range(3)]
+
+  assert [response.status_code for response in responses] == [HTTP_200_OK] * 3
+  assert [response.data["data"] for response in responses] == [[{"skip": 10, "limit": 5}]] * 3
+  assert FrozenListQueryHandler.calls == 1
+  assert (cache.hits, cache.misses) == (2, 1)
+  assert registry.builds == 1
@@ -4,6 +4,8 @@ import pytest
 
 from src.shared.infrastructure.api.exceptions.internal_server_error_exception import InternalServerErrorException
 from src.shared.infrastructure.api.views.query_api_view import QueryAPIView
+from src.shared.infrastructure.command_bus.command_bus_registry import CommandBusRegistry
+from src.shared.infrastructure.query_bus.in_memory_query_bus import InMemoryQueryBus
 
 
 class MockRepo:
@@ -39,7 +41,6 @@ class TestQueryAPIView:
       application_query = MockQuery
       application_query_handler = MockQueryHandler
       response_serializer_class = MockSerializer
-      _initialized = False
 
     return ValidQueryView
 
@@ -50,9 +51,8 @@ class TestQueryAPIView:
       application_query_handler = MockQueryHandler
       response_serializer_class = MockSerializer
       repositories = None
-      _initialized = False
 
-    InvalidView()
+    InvalidView()._initialize_components()
     mock_handle_exception.assert_called_once()
     exception = mock_handle_exception.call_args[0][0]
     assert isinstance(exception, InternalServerErrorException)
@@ -65,9 +65,8 @@ class TestQueryAPIView:
       application_query_handler = MockQueryHandler
       response_serializer_class = MockSerializer
       application_query = None
-      _initialized = False
 
-    InvalidView()
+    InvalidView()._initialize_components()
     mock_handle_exception.assert_called_once()
     exception = mock_handle_exception.call_args[0][0]
     assert isinstance(exception, InternalServerErrorException)
@@ -80,9 +79,8 @@ class TestQueryAPIView:
       application_query = MockQuery
       response_serializer_class = MockSerializer
       application_query_handler = None
-      _initialized = False
 
-    InvalidView()
+    InvalidView()._initialize_components()
     mock_handle_exception.assert_called_once()
     exception = mock_handle_exception.call_args[0][0]
     assert isinstance(exception, InternalServerErrorException)
@@ -95,9 +93,8 @@ class TestQueryAPIView:
       application_query = MockQuery
       application_query_handler = MockQueryHandler
       response_serializer_class = None
-      _initialized = False
 
-    InvalidView()
+    InvalidView()._initialize_components()
     mock_handle_exception.assert_called_once()
     exception = mock_handle_exception.call_args[0][0]
     assert isinstance(exception, InternalServerErrorException)
@@ -105,6 +102,7 @@ class TestQueryAPIView:
 
   def test_successful_initialization(self, valid_view_class):
     view = valid_view_class()
+    view._initialize_components()
 
     assert hasattr(view, "instantiated_repositories")
     assert "mock_repo" in view.instantiated_repositories
@@ -127,6 +125,7 @@ class TestQueryAPIView:
     valid_view_class.repositories = []
 
     view = valid_view_class()
+    view._initialize_components()
 
     assert view.instantiated_repositories == {}
     assert hasattr(view, "infrastructure_query_bus")
@@ -135,17 +134,39 @@ class TestQueryAPIView:
   def test_initialization_handles_faulty_repository(self, mock_handle_exception, valid_view_class):
     valid_view_class.repositories = [("faulty_repo", FaultyRepo)]
 
-    valid_view_class()
+    valid_view_class()._initialize_components()
 
     mock_handle_exception.assert_called_once()
     exception = mock_handle_exception.call_args[0][0]
     assert isinstance(exception, ValueError)
     assert "Repo connection failed" in str(exception)
 
-  def test_initialization_is_only_run_once_per_class(self, valid_view_class):
-    with patch.object(valid_view_class, "_initialize_components") as mock_init:
-      view1 = valid_view_class()
-      assert mock_init.call_count == 1
+  def test_instantiation_does_not_build_the_query_bus(self, valid_view_class):
+    valid_view_class.repositories = [("faulty_repo", FaultyRepo)]
+
+    view = valid_view_class()
+
+    assert view.infrastructure_query_bus is InMemoryQueryBus
+
+  def test_initial_resolves_the_query_bus_once_per_class(self, valid_view_class):
+    registry = CommandBusRegistry()
+    valid_view_class.command_bus_registry = registry
+
+    with patch("src.shared.infrastructure.api.views.base_api_view.BaseAPIView.initial"):
+      buses = []
+      for _ in range(2):
+        view = valid_view_class()
+        view.initial(MagicMock())
+        buses.append(view.infrastructure_query_bus)
+
+    assert isinstance(buses[0], InMemoryQueryBus)
+    assert buses[0] is buses[1]
+    assert registry.builds == 1
+
+  def test_initial_raises_build_errors(self, valid_view_class):
+    valid_view_class.command_bus_registry = CommandBusRegistry()
+    valid_view_class.repositories = [("faulty_repo", FaultyRepo)]
 
-      view2 = valid_view_class()
-      assert mock_init.call_count == 1
+    with patch("src.shared.infrastructure.api.views.base_api_view.BaseAPIView.initial"):
+      with pytest.raises(ValueError, match="Repo connection failed"):
+        valid_view_class().initial(MagicMock())
@@ -52,7 +52,6 @@ class TestRetrieveAPIView:
             application_query = MockQuery
             application_query_handler = MockQueryHandler
             response_serializer_class = MagicMock(spec=MockSerializer) # Mock the class itself
-            _initialized = False # Ensure re-initialization for each test
 
         test_view = TestableRetrieveAPIView()
         # Mock the query bus for direct control over its behavior
@@ -0,0 +1,110 @@
+import threading
+from unittest.mock import Mock
+
+from src.shared.infrastructure.command_bus.command_bus_registry import CommandBusRegistry
+from src.shared.infrastructure.event_bus.domain_event_subscribers import DomainEventSubscribers
+
+
+class DummyView:
+  pass
+
+
+class DummyRepository:
+  pass
+
+
+def test_command_bus_is_built_once_per_view():
+  registry = CommandBusRegistry()
+  build = Mock(return_value=Mock())
+
+  first = registry.command_bus(DummyView, build)
+  second = registry.command_bus(DummyView, build)
+
+  assert first is second
+  build.assert_called_once()
+  assert registry.builds == 1
+
+
+def test_command_bus_is_built_once_under_concurrency():
+  registry = CommandBusRegistry()
+  build = Mock(side_effect=lambda: Mock())
+  barrier = threading.Barrier(8)
+  buses = []
+
+  def resolve():
+    barrier.wait()
+    buses.append(registry.command_bus(DummyView, build))
+
+  threads = [threading.Thread(target=resolve) for _ in range(8)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  build.assert_called_once()
+  assert all(bus is buses[0] for bus in buses)
+
+
+def test_failed_build_is_not_cached():
+  registry = CommandBusRegistry()
+  bus = Mock()
+  build = Mock(side_effect=[ValueError("boom"), bus])
+
+  try:
+    registry.command_bus(DummyView, build)
+  except ValueError:
+    pass
+
+  assert registry.command_bus(DummyView, build) is bus
+  assert build.call_count == 2
+
+
+def test_repositories_are_shared():
+  registry = CommandBusRegistry()
+
+  assert registry.repository(DummyRepository) is registry.repository(DummyRepository)
+
+
+def test_event_bus_is_wired_once():
+  registry = CommandBusRegistry()
+  event_bus_class = Mock()
+  subscribers = Mock(return_value=DomainEventSubscribers([]))
+
+  first = registry.event_bus(event_bus_class, subscribers)
+  second = registry.event_bus(event_bus_class, subscribers)
+
+  assert first is second
+  event_bus_class.assert_called_once()
+  subscribers.assert_called_once()
+  first.add_subscribers.assert_called_once_with(subscribers.return_value)
+
+
+def test_warm_up_builds_registered_views():
+  registry = CommandBusRegistry()
+  view_class = Mock()
+  registry.register(view_class, option="value")
+
+  assert registry.warm_up() == 1
+  view_class.assert_called_once_with(option="value")
+  assert registry.command_bus(view_class, Mock()) is view_class.return_value._build_command_bus.return_value
+
+
+def test_warm_up_skips_misconfigured_views():
+  registry = CommandBusRegistry()
+  view_class = Mock(__name__="BrokenView")
+  view_class.return_value._build_command_bus.side_effect = ValueError("missing repositories")
+  registry.register(view_class)
+
+  assert registry.warm_up() == 0
+  assert registry.builds == 0
+
+
+def test_clear_forgets_built_buses():
+  registry = CommandBusRegistry()
+  build = Mock(side_effect=lambda: Mock())
+  registry.command_bus(DummyView, build)
+
+  registry.clear()
+  registry.command_bus(DummyView, build)
+
+  assert build.call_count == 2
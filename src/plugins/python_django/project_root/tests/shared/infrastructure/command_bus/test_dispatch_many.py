@@ -0,0 +1,111 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.shared.domain.commands.batch_command_handler import BatchCommandHandler
+from src.shared.domain.commands.command import Command
+from src.shared.domain.commands.command_bus import CommandBus
+from src.shared.domain.commands.command_handler import CommandHandler
+from src.shared.domain.commands.command_not_registered_error import CommandNotRegisteredError
+from src.shared.infrastructure.command_bus.command_batch import CommandBatch
+from src.shared.infrastructure.command_bus.command_handlers import CommandHandlers
+from src.shared.infrastructure.command_bus.in_memory_async_command_bus import InMemoryAsyncCommandBus
+from src.shared.infrastructure.command_bus.in_memory_command_bus import InMemoryCommandBus
+
+
+class CreateCommand(Command):
+  def __init__(self, name: str):
+    self.name = name
+
+
+class NoteCommand(Command):
+  def __init__(self, name: str):
+    self.name = name
+
+
+class CreateBatchHandler(BatchCommandHandler):
+  def __init__(self, calls: list):
+    self.calls = calls
+
+  def subscribed_to(self) -> type[Command]:
+    return CreateCommand
+
+  def handle(self, command: CreateCommand) -> None:
+    self.calls.append(("handle", command.name))
+
+  def handle_many(self, commands: list[CreateCommand]) -> None:
+    self.calls.append(("handle_many", [command.name for command in commands]))
+
+
+class NoteHandler(CommandHandler):
+  def __init__(self, calls: list):
+    self.calls = calls
+
+  def subscribed_to(self) -> type[Command]:
+    return NoteCommand
+
+  def handle(self, command: NoteCommand) -> None:
+    self.calls.append(("handle", command.name))
+
+
+@pytest.fixture
+def calls():
+  return []
+
+
+@pytest.fixture
+def command_handlers(calls):
+  return CommandHandlers(command_handlers=[CreateBatchHandler(calls), NoteHandler(calls)])
+
+
+@pytest.fixture
+def commands():
+  return [CreateCommand("a"), CreateCommand("b"), NoteCommand("n1"), NoteCommand("n2"), CreateCommand("c")]
+
+
+EXPECTED_CALLS = [
+  ("handle_many", ["a", "b"]),
+  ("handle", "n1"),
+  ("handle", "n2"),
+  ("handle_many", ["c"]),
+]
+
+
+def test_dispatch_many_batches_consecutive_commands_in_order(command_handlers, commands, calls):
+  InMemoryCommandBus(command_handlers).dispatch_many(commands)
+
+  assert calls == EXPECTED_CALLS
+
+
+def test_dispatch_many_runs_batches_through_middlewares(command_handlers, commands):
+  messages = []
+
+  def middleware(message, next_handler):
+    messages.append(message)
+    return next_handler(message)
+
+  InMemoryCommandBus(command_handlers, middlewares=[middleware]).dispatch_many(commands)
+
+  assert [type(message) for message in messages] == [CommandBatch, NoteCommand, NoteCommand, CommandBatch]
+  assert messages[0].commands == tuple(commands[:2])
+
+
+def test_dispatch_many_raises_error_if_command_not_registered():
+  with pytest.raises(CommandNotRegisteredError):
+    InMemoryCommandBus(CommandHandlers(command_handlers=[])).dispatch_many([CreateCommand("a")])
+
+
+def test_dispatch_many_defaults_to_one_dispatch_per_command():
+  bus = MagicMock(spec=CommandBus)
+  commands = [CreateCommand("a"), CreateCommand("b")]
+
+  CommandBus.dispatch_many(bus, commands)
+
+  assert [call.args[0] for call in bus.dispatch.call_args_list] == commands
+
+
+def test_async_dispatch_many_batches_consecutive_commands_in_order(command_handlers, commands, calls):
+  asyncio.run(InMemoryAsyncCommandBus(command_handlers).dispatch_many(commands))
+
+  assert calls == EXPECTED_CALLS
@@ -0,0 +1,97 @@
+import asyncio
+import contextvars
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.shared.domain.commands.command import Command
+from src.shared.domain.commands.command_not_registered_error import CommandNotRegisteredError
+from src.shared.infrastructure.command_bus.command_handlers import CommandHandlers
+from src.shared.infrastructure.command_bus.in_memory_async_command_bus import InMemoryAsyncCommandBus
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class MyCommand(Command):
+  pass
+
+
+class AsyncHandler:
+  def __init__(self):
+    self.handled = []
+
+  def subscribed_to(self) -> type[MyCommand]:
+    return MyCommand
+
+  async def handle(self, command: MyCommand) -> None:
+    await asyncio.sleep(0)
+    self.handled.append((command, request_id.get(), threading.get_ident()))
+
+
+class SyncHandler(AsyncHandler):
+  def handle(self, command: MyCommand) -> None:
+    self.handled.append((command, request_id.get(), threading.get_ident()))
+
+
+async def dispatch(bus: InMemoryAsyncCommandBus, command: MyCommand) -> int:
+  request_id.set("req-1")
+  await bus.dispatch(command)
+  return threading.get_ident()
+
+
+def test_dispatch_awaits_async_handler_on_the_event_loop():
+  handler = AsyncHandler()
+  bus = InMemoryAsyncCommandBus(CommandHandlers(command_handlers=[handler]))
+  command = MyCommand()
+
+  loop_thread = asyncio.run(dispatch(bus, command))
+
+  assert handler.handled == [(command, "req-1", loop_thread)]
+
+
+def test_dispatch_runs_sync_handler_in_a_thread_with_the_callers_context():
+  handler = SyncHandler()
+  bus = InMemoryAsyncCommandBus(CommandHandlers(command_handlers=[handler]))
+  command = MyCommand()
+
+  loop_thread = asyncio.run(dispatch(bus, command))
+
+  [(handled_command, handled_request_id, handler_thread)] = handler.handled
+  assert handled_command is command
+  assert handled_request_id == "req-1"
+  assert handler_thread != loop_thread
+
+
+def test_dispatch_raises_error_if_command_not_registered():
+  command_handlers = MagicMock(spec=CommandHandlers)
+  command_handlers.get.return_value = None
+  bus = InMemoryAsyncCommandBus(command_handlers)
+
+  with pytest.raises(CommandNotRegisteredError):
+    asyncio.run(bus.dispatch(MyCommand()))
+
+
+def test_dispatch_runs_middlewares_in_the_handler_thread():
+  handler = SyncHandler()
+  middleware_threads = []
+
+  def middleware(message, next_handler):
+    middleware_threads.append(threading.get_ident())
+    return next_handler(message)
+
+  bus = InMemoryAsyncCommandBus(CommandHandlers(command_handlers=[handler]), middlewares=[middleware])
+
+  asyncio.run(dispatch(bus, MyCommand()))
+
+  [(_, _, handler_thread)] = handler.handled
+  assert middleware_threads == [handler_thread]
+
+
+def test_dispatch_rejects_middlewares_around_async_handlers():
+  handler = AsyncHandler()
+  bus = InMemoryAsyncCommandBus(CommandHandlers(command_handlers=[handler]), middlewares=[MagicMock()])
+
+  with pytest.raises(TypeError, match="AsyncHandler"):
+    asyncio.run(dispatch(bus, MyCommand()))
+  assert handler.handled == []
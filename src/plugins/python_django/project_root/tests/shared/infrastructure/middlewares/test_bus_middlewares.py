@@ -0,0 +1,224 @@
+import logging
+from dataclasses import dataclass
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.db import OperationalError
+
+from src.shared.domain.commands.command import Command
+from src.shared.domain.commands.command_not_registered_error import CommandNotRegisteredError
+from src.shared.domain.queries.query import Query
+from src.shared.infrastructure.command_bus.command_handlers import CommandHandlers
+from src.shared.infrastructure.command_bus.in_memory_command_bus import InMemoryCommandBus
+from src.shared.infrastructure.middlewares.bus_middleware import BusMiddleware, compose_middlewares
+from src.shared.infrastructure.middlewares.latency_histogram_middleware import LatencyHistogramMiddleware
+from src.shared.infrastructure.middlewares.query_cache_invalidation_middleware import QueryCacheInvalidationMiddleware
+from src.shared.infrastructure.middlewares.query_cache_middleware import QueryCacheMiddleware
+from src.shared.infrastructure.middlewares.retry_middleware import RetryMiddleware
+from src.shared.infrastructure.middlewares.slow_handler_logging_middleware import SlowHandlerLoggingMiddleware
+from src.shared.infrastructure.middlewares.transaction_middleware import TransactionMiddleware
+from src.shared.infrastructure.query_bus.in_memory_lru_query_cache_backend import InMemoryLRUQueryCacheBackend
+from src.shared.infrastructure.query_bus.in_memory_query_bus import InMemoryQueryBus
+from src.shared.infrastructure.query_bus.query_cache import QueryCache
+from src.shared.infrastructure.query_bus.query_handlers import QueryHandlers
+
+
+class MyCommand(Command):
+  pass
+
+
+class MyQuery(Query):
+  pass
+
+
+@dataclass(frozen=True)
+class MyFrozenQuery(Query):
+  pk: str
+
+
+class RecordingMiddleware(BusMiddleware):
+  def __init__(self, name: str, calls: list[str]):
+    self.name = name
+    self.calls = calls
+
+  def __call__(self, message, next_handler):
+    self.calls.append(f"{self.name}:before")
+    result = next_handler(message)
+    self.calls.append(f"{self.name}:after")
+    return result
+
+
+def handlers_for(message_class, handle):
+  handler = MagicMock()
+  handler.subscribed_to.return_value = message_class
+  handler.handle.side_effect = handle
+  return handler
+
+
+def test_compose_without_middlewares_returns_the_handle():
+  handle = MagicMock()
+
+  assert compose_middlewares([], handle) is handle
+
+
+def test_compose_runs_middlewares_outermost_first():
+  calls = []
+  handle = compose_middlewares(
+    [RecordingMiddleware("outer", calls), RecordingMiddleware("inner", calls)], lambda message: calls.append("handle")
+  )
+
+  handle(MyCommand())
+
+  assert calls == ["outer:before", "inner:before", "handle", "inner:after", "outer:after"]
+
+
+def test_command_bus_runs_handler_through_middlewares():
+  calls = []
+  handler = handlers_for(MyCommand, lambda command: calls.append("handle"))
+  bus = InMemoryCommandBus(
+    CommandHandlers(command_handlers=[handler]), middlewares=[RecordingMiddleware("middleware", calls)]
+  )
+
+  bus.dispatch(MyCommand())
+
+  assert calls == ["middleware:before", "handle", "middleware:after"]
+
+
+def test_command_bus_raises_not_registered_through_middlewares():
+  bus = InMemoryCommandBus(CommandHandlers(command_handlers=[]), middlewares=[RecordingMiddleware("middleware", [])])
+
+  with pytest.raises(CommandNotRegisteredError):
+    bus.dispatch(MyCommand())
+
+
+def test_query_bus_returns_handler_response_through_middlewares():
+  histogram = LatencyHistogramMiddleware()
+  handler = handlers_for(MyQuery, lambda query: ["response"])
+  bus = InMemoryQueryBus(QueryHandlers(query_handlers=[handler]), middlewares=[histogram])
+
+  assert bus.ask(MyQuery()) == ["response"]
+  assert histogram.snapshot()["MyQuery"]["count"] == 1
+
+
+def test_latency_histogram_buckets_per_message_type():
+  histogram = LatencyHistogramMiddleware(buckets_ms=(10, 1))
+
+  histogram.observe("MyCommand", 0.5)
+  histogram.observe("MyCommand", 5)
+  histogram.observe("MyCommand", 50)
+  histogram.observe("MyQuery", 1)
+
+  snapshot = histogram.snapshot()
+  assert snapshot["MyCommand"] == {"count": 3, "total_ms": 55.5, "buckets": {"<=1": 1, "<=10": 1, "+Inf": 1}}
+  assert snapshot["MyQuery"]["buckets"] == {"<=1": 1, "<=10": 0, "+Inf": 0}
+
+
+def test_latency_histogram_records_failed_handlers():
+  histogram = LatencyHistogramMiddleware()
+
+  with pytest.raises(ValueError):
+    histogram(MyCommand(), MagicMock(side_effect=ValueError("boom")))
+
+  assert histogram.snapshot()["MyCommand"]["count"] == 1
+
+
+def test_slow_handler_logging_warns_above_threshold(caplog):
+  middleware = SlowHandlerLoggingMiddleware(threshold_ms=0)
+
+  with caplog.at_level(logging.WARNING):
+    assert middleware(MyCommand(), lambda command: "done") == "done"
+
+  assert "Handler lento para 'MyCommand'" in caplog.text
+
+
+def test_slow_handler_logging_is_silent_below_threshold(caplog):
+  middleware = SlowHandlerLoggingMiddleware(threshold_ms=60_000)
+
+  with caplog.at_level(logging.WARNING):
+    middleware(MyCommand(), lambda command: None)
+
+  assert caplog.text == ""
+
+
+@patch("src.shared.infrastructure.middlewares.transaction_middleware.transaction")
+def test_transaction_middleware_wraps_handler_in_atomic_block(mock_transaction):
+  middleware = TransactionMiddleware(using="default")
+
+  assert middleware(MyCommand(), lambda command: "done") == "done"
+
+  mock_transaction.atomic.assert_called_once_with(using="default", savepoint=True)
+  mock_transaction.atomic.return_value.__enter__.assert_called_once()
+
+
+@patch("src.shared.infrastructure.middlewares.retry_middleware.time.sleep")
+def test_retry_middleware_retries_configured_errors(mock_sleep):
+  next_handler = MagicMock(side_effect=[OperationalError("deadlock"), OperationalError("deadlock"), "done"])
+  middleware = RetryMiddleware(attempts=3, backoff_seconds=0.1)
+
+  assert middleware(MyCommand(), next_handler) == "done"
+
+  assert next_handler.call_count == 3
+  assert [call.args[0] for call in mock_sleep.call_args_list] == [0.1, 0.2]
+
+
+@patch("src.shared.infrastructure.middlewares.retry_middleware.time.sleep")
+def test_retry_middleware_gives_up_after_last_attempt(mock_sleep):
+  next_handler = MagicMock(side_effect=OperationalError("deadlock"))
+
+  with pytest.raises(OperationalError):
+    RetryMiddleware(attempts=2)(MyCommand(), next_handler)
+
+  assert next_handler.call_count == 2
+
+
+def test_retry_middleware_does_not_retry_other_errors():
+  next_handler = MagicMock(side_effect=CommandNotRegisteredError(MyCommand()))
+
+  with pytest.raises(CommandNotRegisteredError):
+    RetryMiddleware(attempts=3)(MyCommand(), next_handler)
+
+  next_handler.assert_called_once()
+
+
+def test_query_cache_middleware_serves_repeated_queries_from_cache():
+  cache = QueryCache(InMemoryLRUQueryCacheBackend())
+  handler = handlers_for(MyFrozenQuery, lambda query: f"order {query.pk}")
+  bus = InMemoryQueryBus(
+    QueryHandlers(query_handlers=[handler]),
+    middlewares=[QueryCacheMiddleware(cache, tags=lambda query: (f"order:{query.pk}",))],
+  )
+
+  assert [bus.ask(MyFrozenQuery("1")) for _ in range(3)] == ["order 1"] * 3
+  cache.invalidate("order:1")
+  bus.ask(MyFrozenQuery("1"))
+
+  assert handler.handle.call_count == 2
+  assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_query_cache_invalidation_middleware_invalidates_tags_after_handled_commands():
+  cache = QueryCache(InMemoryLRUQueryCacheBackend())
+  query_handler = handlers_for(MyFrozenQuery, lambda query: f"order {query.pk}")
+  query_bus = InMemoryQueryBus(
+    QueryHandlers(query_handlers=[query_handler]), middlewares=[QueryCacheMiddleware(cache, tags=("orders",))]
+  )
+  command_bus = InMemoryCommandBus(
+    CommandHandlers(command_handlers=[handlers_for(MyCommand, lambda command: None)]),
+    middlewares=[QueryCacheInvalidationMiddleware(cache, tags=("orders",))],
+  )
+
+  query_bus.ask(MyFrozenQuery("1"))
+  command_bus.dispatch(MyCommand())
+  query_bus.ask(MyFrozenQuery("1"))
+
+  assert query_handler.handle.call_count == 2
+
+
+def test_query_cache_invalidation_middleware_keeps_the_cache_when_the_command_fails():
+  cache = MagicMock()
+  middleware = QueryCacheInvalidationMiddleware(cache, tags=lambda command: ("orders",))
+
+  with pytest.raises(ValueError):
+    middleware(MyCommand(), MagicMock(side_effect=ValueError("boom")))
+
+  cache.invalidate.assert_not_called()
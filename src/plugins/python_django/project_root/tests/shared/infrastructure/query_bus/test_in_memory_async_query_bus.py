@@ -0,0 +1,93 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.shared.domain.queries.query import Query
+from src.shared.domain.queries.query_not_registered_error import QueryNotRegisteredError
+from src.shared.infrastructure.query_bus.in_memory_async_query_bus import InMemoryAsyncQueryBus
+from src.shared.infrastructure.query_bus.query_handlers import QueryHandlers
+
+
+class MyQuery(Query):
+  pass
+
+
+class AsyncQueryHandler:
+  def subscribed_to(self) -> type[MyQuery]:
+    return MyQuery
+
+  async def handle(self, query: MyQuery) -> list[dict]:
+    await asyncio.sleep(0.05)
+    return [{"id": 1}]
+
+
+class SyncQueryHandler(AsyncQueryHandler):
+  def handle(self, query: MyQuery) -> list[dict]:
+    return [{"thread": threading.current_thread().name}]
+
+
+def test_ask_returns_async_handler_response():
+  bus = InMemoryAsyncQueryBus(QueryHandlers(query_handlers=[AsyncQueryHandler()]))
+
+  assert asyncio.run(bus.ask(MyQuery())) == [{"id": 1}]
+
+
+def test_ask_runs_concurrent_async_queries_on_one_loop():
+  bus = InMemoryAsyncQueryBus(QueryHandlers(query_handlers=[AsyncQueryHandler()]))
+
+  async def ask_many():
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    responses = await asyncio.gather(*(bus.ask(MyQuery()) for _ in range(10)))
+    return responses, loop.time() - start
+
+  responses, elapsed = asyncio.run(ask_many())
+
+  assert responses == [[{"id": 1}]] * 10
+  assert elapsed < 0.05 * 5
+
+
+def test_ask_runs_sync_handler_in_the_given_executor():
+  with ThreadPoolExecutor(max_workers=1, thread_name_prefix="query-worker") as executor:
+    bus = InMemoryAsyncQueryBus(QueryHandlers(query_handlers=[SyncQueryHandler()]), executor=executor)
+    [response] = asyncio.run(bus.ask(MyQuery()))
+
+  assert response["thread"].startswith("query-worker")
+
+
+def test_ask_raises_error_if_query_not_registered():
+  query_handlers = MagicMock(spec=QueryHandlers)
+  query_handlers.get.return_value = None
+  bus = InMemoryAsyncQueryBus(query_handlers)
+
+  with pytest.raises(QueryNotRegisteredError):
+    asyncio.run(bus.ask(MyQuery()))
+
+
+def test_ask_runs_middlewares_with_sync_handler_in_the_worker_thread():
+  calls = []
+
+  def middleware(query, next_handler):
+    calls.append(threading.current_thread().name)
+    return next_handler(query)
+
+  with ThreadPoolExecutor(max_workers=1, thread_name_prefix="query-worker") as executor:
+    bus = InMemoryAsyncQueryBus(
+      QueryHandlers(query_handlers=[SyncQueryHandler()]), executor=executor, middlewares=[middleware]
+    )
+    [response] = asyncio.run(bus.ask(MyQuery()))
+
+  assert calls == [response["thread"]]
+  assert response["thread"].startswith("query-worker")
+
+
+def test_ask_rejects_middlewares_around_async_handlers():
+  bus = InMemoryAsyncQueryBus(
+    QueryHandlers(query_handlers=[AsyncQueryHandler()]), middlewares=[lambda query, next_handler: next_handler(query)]
+  )
+
+  with pytest.raises(TypeError):
+    asyncio.run(bus.ask(MyQuery()))
@@ -0,0 +1,152 @@
+import uuid
+from dataclasses import dataclass
+from unittest.mock import Mock, patch
+
+import pytest
+from django.core.cache import cache as django_cache
+
+from src.shared.domain.events.domain_event import DomainEvent
+from src.shared.infrastructure.query_bus.django_query_cache_backend import DjangoQueryCacheBackend
+from src.shared.infrastructure.query_bus.in_memory_lru_query_cache_backend import InMemoryLRUQueryCacheBackend
+from src.shared.infrastructure.query_bus.query_cache import QueryCache
+from src.shared.infrastructure.query_bus.query_cache_invalidation_subscriber import QueryCacheInvalidationSubscriber
+
+
+@dataclass(frozen=True)
+class ListQuery:
+  skip: int = 0
+  limit: int = 100
+
+
+@dataclass
+class MutableQuery:
+  pk: str = "1"
+
+
+class CreatedEvent(DomainEvent):
+  def __init__(self):
+    super().__init__(event_name="item.created", aggregate_id="1")
+
+  @classmethod
+  def from_primitives(cls, params):
+    return cls()
+
+  def to_primitives(self):
+    return {}
+
+
+@pytest.fixture(params=["lru", "django"])
+def backend(request):
+  if request.param == "lru":
+    return InMemoryLRUQueryCacheBackend()
+  return DjangoQueryCacheBackend(key_prefix=f"test-query-cache-{uuid.uuid4().hex}")
+
+
+@pytest.fixture
+def cache(backend):
+  return QueryCache(backend, ttl=60)
+
+
+def test_fetch_computes_once_per_query(cache):
+  compute = Mock(return_value=["order"])
+
+  assert cache.fetch(ListQuery(), compute) == ["order"]
+  assert cache.fetch(ListQuery(), compute) == ["order"]
+  cache.fetch(ListQuery(skip=10), compute)
+
+  assert compute.call_count == 2
+  assert (cache.hits, cache.misses) == (1, 2)
+  assert cache.snapshot() == {"ListQuery": {"hits": 1, "misses": 2}}
+
+
+def test_fetch_caches_none_results(cache):
+  compute = Mock(return_value=None)
+
+  cache.fetch(ListQuery(), compute)
+  cache.fetch(ListQuery(), compute)
+
+  compute.assert_called_once()
+
+
+def test_fetch_bypasses_queries_that_are_not_frozen_dataclasses(cache):
+  compute = Mock(return_value="result")
+
+  cache.fetch(MutableQuery(), compute)
+  cache.fetch(MutableQuery(), compute)
+
+  assert compute.call_count == 2
+  assert cache.snapshot() == {}
+
+
+def test_invalidate_expires_tagged_entries_only(cache):
+  tagged = Mock(return_value="tagged")
+  untagged = Mock(return_value="untagged")
+  cache.fetch(ListQuery(), tagged, tags=("orders",))
+  cache.fetch(ListQuery(skip=1), untagged)
+
+  cache.invalidate("orders")
+  cache.fetch(ListQuery(), tagged, tags=("orders",))
+  cache.fetch(ListQuery(skip=1), untagged)
+
+  assert tagged.call_count == 2
+  untagged.assert_called_once()
+
+
+def test_clear_expires_entries_without_touching_other_cache_keys():
+  cache = QueryCache(DjangoQueryCacheBackend(key_prefix=f"test-query-cache-{uuid.uuid4().hex}"))
+  compute = Mock(return_value="result")
+  django_cache.set("session-key", "session")
+  cache.fetch(ListQuery(), compute)
+
+  cache.clear()
+  cache.fetch(ListQuery(), compute)
+
+  assert compute.call_count == 2
+  assert django_cache.get("session-key") == "session"
+
+
+def test_entries_do_not_survive_evicted_tag_tokens():
+  backend = InMemoryLRUQueryCacheBackend()
+  cache = QueryCache(backend)
+  compute = Mock(return_value="result")
+  cache.fetch(ListQuery(), compute, tags=("orders",))
+
+  backend.delete(("tag", "orders"))
+  cache.fetch(ListQuery(), compute, tags=("orders",))
+
+  assert compute.call_count == 2
+
+
+def test_lru_backend_evicts_least_recently_used_entry():
+  backend = InMemoryLRUQueryCacheBackend(max_entries=2)
+  backend.set("a", 1)
+  backend.set("b", 2)
+  backend.get("a")
+
+  backend.set("c", 3)
+
+  assert backend.get("b") is None
+  assert (backend.get("a"), backend.get("c")) == (1, 3)
+  assert len(backend) == 2
+
+
+def test_lru_backend_expires_entries_after_ttl():
+  backend = InMemoryLRUQueryCacheBackend()
+  with patch("time.monotonic", return_value=100.0):
+    backend.set("a", 1, ttl=5)
+  with patch("time.monotonic", return_value=104.0):
+    assert backend.get("a") == 1
+  with patch("time.monotonic", return_value=105.0):
+    assert backend.get("a", "expired") == "expired"
+
+
+def test_invalidation_subscriber_invalidates_tags_for_subscribed_events():
+  cache = Mock()
+  subscriber = QueryCacheInvalidationSubscriber(
+    cache, {CreatedEvent: lambda event: ("orders", f"order:{event.aggregate_id}")}
+  )
+
+  subscriber.on(CreatedEvent())
+
+  assert subscriber.subscribed_to() == [CreatedEvent]
+  cache.invalidate.assert_called_once_with("orders", "order:1")
@@ -24,6 +24,7 @@ INSTALLED_APPS = [
   "django.contrib.staticfiles",
   "rest_framework",
   "rest_framework_simplejwt",
+  "src.shared.infrastructure.api",
 ]
 
 MIDDLEWARE = [
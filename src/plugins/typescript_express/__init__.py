@@ -1,5 +1,5 @@
 from core.generator.base_generator import BaseGenerator
-from core.interfaces.base_class import FrameworkOption, LanguageOption, LanguagePlugin
+from core.interfaces.base_class import FrameworkOption, LanguageOption, LanguagePlugin, LayerType
 
 
 class TypescriptFrameworkOption(FrameworkOption):
@@ -16,7 +16,9 @@ class ExpressPlugin(LanguagePlugin):
   def supported_frameworks(self) -> list[TypescriptFrameworkOption]:
     return [TypescriptFrameworkOption.EXPRESS, TypescriptFrameworkOption.NEST_JS]
 
-  def get_generator(self, framework: TypescriptFrameworkOption | None = None) -> BaseGenerator:
+  def get_generator(
+    self, framework: TypescriptFrameworkOption | None = None, layer: LayerType | None = None
+  ) -> BaseGenerator:
     if framework == TypescriptFrameworkOption.EXPRESS:
       pass
 